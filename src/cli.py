@@ -1,24 +1,197 @@
 from __future__ import annotations
 
+import argparse
 import logging
+import multiprocessing
+import sys
+from collections.abc import Sequence
+from dataclasses import replace
+from pathlib import Path
 
-from src.core.container import create_container
+from src.core.batch import (
+    EXIT_USAGE,
+    OUTPUT_FORMATS,
+    RecordWriter,
+    lookup_stages,
+    read_names,
+    run_lookup,
+)
+from src.core.config import AppConfig
+from src.core.container import build_ocr_engine, build_scraper, create_container
 from src.core.logging_setup import configure_logging
-from src.ui.app import main as app_main
+from src.core.models import CharacterInfo
+from src.core.pipeline import Pipeline
+from src.core.scraper import default_url_template
 
 logger = logging.getLogger(__name__)
 
+_LOOKUP_EPILOG = """\
+종료 코드: 0 전부 성공, 1 일부 실패, 2 사용법/입력 오류, 3 전부 실패(또는 인식된 이름 없음)
+"""
+
 
 def run() -> None:
-    container = create_container()
+    raise SystemExit(main())
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    container = create_container(args.config)
     log_path = configure_logging(container.config)
     logger.info("Logging to %s", log_path)
+
+    if args.command == "lookup":
+        return _lookup(args, container.config)
+    if args.command == "serve":
+        return _serve(args, container.config)
+
+    # Tk/pyautogui는 화면이 있어야 로드되므로 GUI를 띄울 때만 가져온다.
+    from src.ui.app import main as app_main
+
     try:
         app_main(container.config)
     except Exception:  # noqa: BLE001
         logger.exception("Application crashed.")
         raise
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bory", description="던담 공대원 데미지 도우미"
+    )
+    parser.add_argument("--config", type=Path, help="설정 파일(config.ini) 경로")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("gui", help="데스크톱 앱 실행(기본)")
+
+    lookup = commands.add_parser(
+        "lookup",
+        help="화면 없이 일괄 조회",
+        description="이름 목록이나 스크린샷의 공대원 총딜을 동시에 조회해 "
+        "끝나는 대로 한 줄씩 출력합니다.",
+        epilog=_LOOKUP_EPILOG,
+    )
+    source = lookup.add_mutually_exclusive_group()
+    source.add_argument(
+        "--names",
+        metavar="FILE",
+        help="한 줄에 이름 하나인 파일('-'면 표준 입력, 생략해도 표준 입력)",
+    )
+    source.add_argument(
+        "--image",
+        action="append",
+        type=Path,
+        metavar="PATH",
+        help="OCR로 공대원을 읽을 스크린샷(여러 번 지정 가능)",
+    )
+    lookup.add_argument(
+        "--template", help="URL 템플릿({name} 치환, 기본은 dundam_base_url 기준)"
+    )
+    lookup.add_argument("--format", choices=OUTPUT_FORMATS, default="jsonl")
+    lookup.add_argument(
+        "--workers", type=int, help="동시 조회 수(기본 fetch_max_workers)"
+    )
+    lookup.add_argument(
+        "--refresh", action="store_true", help="캐시를 무시하고 다시 조회"
+    )
+
+    serve = commands.add_parser(
+        "serve",
+        help="팀이 함께 쓰는 조회 서버 실행",
+        description="캐시와 속도 제한을 공유하는 로컬 HTTP/JSON 조회 서버를 띄웁니다. "
+        "앱은 lookup_server_url을 이 주소로 설정하면 직접 스크래핑하지 않습니다.",
+    )
+    serve.add_argument("--host", help="바인드 주소(기본 server_host)")
+    serve.add_argument("--port", type=int, help="포트(기본 server_port)")
+    return parser
+
+
+def _serve(args: argparse.Namespace, config: AppConfig) -> int:
+    from src.core.server import LookupServer
+
+    # 서버 자신은 항상 던담에 직접 요청한다.
+    scraper = build_scraper(replace(config, lookup_server_url=""))
+    try:
+        server = LookupServer(
+            scraper,
+            base_url=config.dundam_base_url,
+            host=args.host or config.server_host,
+            port=args.port if args.port is not None else config.server_port,
+        )
+    except OSError as exc:
+        scraper.close()
+        print(f"cannot start lookup server: {exc}", file=sys.stderr)
+        return EXIT_USAGE
+    host, port = server.address
+    print(f"bory lookup server on http://{host}:{port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Lookup server stopped.")
+    finally:
+        server.close()
+        scraper.close()
+    return 0
+
+
+def _lookup(args: argparse.Namespace, config: AppConfig) -> int:
+    if args.workers is not None and args.workers < 1:
+        print("--workers must be positive", file=sys.stderr)
+        return EXIT_USAGE
+    if hasattr(sys.stdout, "reconfigure"):
+        # 한글 이름이 콘솔 코드 페이지 때문에 깨지지 않도록 UTF-8로 내보낸다.
+        sys.stdout.reconfigure(encoding="utf-8")
+
+    names: list[str] = []
+    if not args.image:
+        try:
+            names = _read_name_source(args.names)
+        except OSError as exc:
+            print(f"cannot read names: {exc}", file=sys.stderr)
+            return EXIT_USAGE
+        if not names:
+            print("no character names given", file=sys.stderr)
+            return EXIT_USAGE
+
+    scraper = build_scraper(config)
+    ocr_engine = None
+    if args.image:
+        known_names = scraper.store.known_names() if scraper.store else []
+        ocr_engine = build_ocr_engine(config, known_names)
+    try:
+        stages = lookup_stages(
+            scraper,
+            args.template or default_url_template(config.dundam_base_url),
+            workers=args.workers or config.fetch_max_workers,
+            force_refresh=args.refresh,
+            ocr_engine=ocr_engine,
+            min_confidence=config.ocr_min_confidence,
+            low_confidence_action=config.ocr_low_confidence_action,
+        )
+        items = args.image or [CharacterInfo(name=name) for name in names]
+        logger.info("Headless lookup of %s inputs.", len(items))
+        return run_lookup(
+            Pipeline(stages),
+            items,
+            RecordWriter(sys.stdout, args.format),
+            min_confidence=config.ocr_min_confidence if ocr_engine else 0.0,
+        )
+    finally:
+        scraper.close()
+        if ocr_engine is not None:
+            ocr_engine.close()
+
+
+def _read_name_source(source: str | None) -> list[str]:
+    if source is None or source == "-":
+        return read_names(sys.stdin)
+    with open(source, encoding="utf-8-sig") as handle:
+        return read_names(handle)
 
 
 if __name__ == "__main__":
+    # PyInstaller --onefile 실행 파일에서 tesserocr 작업 프로세스가 앱을 또 띄우지 않고
+    # 작업자로만 동작하게 한다(프로세스 풀을 쓰기 전에 호출해야 한다).
+    multiprocessing.freeze_support()
     run()
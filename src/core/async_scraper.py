@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Coroutine, Iterable, Mapping
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+import httpx
+
+from src.core.cache import TTLCache
+from src.core.damage_store import DamageStore
+from src.core.models import CharacterDamage, FetchResult, FetchStats
+from src.core.ratelimit import RequestGuard
+from src.core.scraper import (
+    DamageStreamScanner,
+    HttpValidator,
+    ResultCallback,
+    conditional_headers,
+    lookup_cached_damage,
+    parse_total_damage,
+    parse_total_damage_with_tier,
+    remember_damage,
+    validator_from_headers,
+)
+from src.core.singleflight import AsyncSingleFlight
+
+T = TypeVar("T")
+
+
+class AsyncDundamScraper:
+    """asyncio 기반 던담 스크래퍼.
+
+    - 하나의 httpx.AsyncClient(keep-alive 커넥션 풀)를 공대원/연속 조회 전체에서 재사용한다.
+    - 재시도/오류 규칙과 총딜 파서는 DundamScraper와 동일하다.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        *,
+        request_timeout: float = 10.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        max_connections: int = 4,
+        cache: TTLCache[str] | None = None,
+        store: DamageStore | None = None,
+        conditional_requests: bool = False,
+        stream_responses: bool = False,
+        guard: RequestGuard | None = None,
+    ) -> None:
+        self._client = client
+        self._owns_client = client is None
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_connections = max_connections
+        self.cache = cache
+        self.store = store
+        self.validators: TTLCache[HttpValidator] | None = (
+            TTLCache(max_entries=1024, ttl=None) if conditional_requests else None
+        )
+        self.stream_responses = stream_responses
+        self.guard = guard
+        self._inflight: AsyncSingleFlight[tuple[str, int, str | None]] = (
+            AsyncSingleFlight()
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 클라이언트는 이벤트 루프 안에서 처음 사용할 때 만든다.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def fetch_html(self, url: str) -> str:
+        return (await self._get(url)).text
+
+    async def _get(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        last_exc: httpx.HTTPError | None = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                # 회로가 열려 있으면 CircuitOpenError로 즉시 실패한다.
+                delay = self.guard.reserve() if self.guard is not None else 0.0
+                request = self.client.build_request("GET", url, headers=headers)
+                try:
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    response = await self.client.send(request, stream=stream)
+                except httpx.HTTPError:
+                    raise
+                except BaseException:
+                    # 속도 제한 대기나 전송 중 취소(CancelledError) 등으로 응답 없이 끝나면
+                    # 회로의 시험 요청 자리를 돌려놓는다. 그대로 두면 회로가 영영 열린 채로
+                    # 남는다.
+                    if self.guard is not None:
+                        self.guard.record_cancelled()
+                    raise
+                if self.guard is not None:
+                    self.guard.record_response(
+                        response.status_code, response.headers.get("Retry-After")
+                    )
+                if stream and response.status_code >= 400:
+                    await response.aclose()
+                if response.status_code >= 500 or response.status_code == 429:
+                    raise httpx.HTTPStatusError(
+                        f"Retryable status: {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                if response.status_code >= 400:
+                    # httpx는 3xx(304 포함)도 오류로 보므로 4xx만 올린다.
+                    response.raise_for_status()
+                return response
+            except httpx.HTTPError as exc:
+                last_exc = exc
+                response = getattr(exc, "response", None)
+                status = getattr(response, "status_code", None)
+                if status is None and self.guard is not None:
+                    self.guard.record_error()
+                if status is not None and 400 <= status < 500 and status != 429:
+                    raise RuntimeError(f"요청 실패({status}): {url}") from exc
+                if attempt >= self.max_retries:
+                    break
+                await asyncio.sleep(self.retry_backoff * (2**attempt))
+        raise RuntimeError(f"요청 실패(재시도 초과): {url}") from last_exc
+
+    def parse_total_damage(self, html: str) -> str:
+        return parse_total_damage(html)
+
+    def parse_total_damage_with_tier(self, html: str) -> tuple[str, str]:
+        return parse_total_damage_with_tier(html)
+
+    async def fetch_character_damage(
+        self,
+        url: str,
+        name: str,
+        job: str | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> CharacterDamage:
+        if not force_refresh:
+            cached = lookup_cached_damage(
+                url, name, job, cache=self.cache, store=self.store
+            )
+            if cached is not None:
+                return cached
+
+        started = time.perf_counter()
+        # 같은 URL을 동시에 조회하면 요청 하나만 보내고 결과/오류를 함께 받는다.
+        (total_damage, status, tier), shared = await self._inflight.do(
+            url, lambda: self._fetch_network(url)
+        )
+        result = CharacterDamage(
+            name=name,
+            job=job,
+            damage=total_damage,
+            stats=FetchStats(
+                url=url,
+                source="coalesced" if shared else "network",
+                status=status,
+                elapsed=time.perf_counter() - started,
+                parse_tier=tier,
+            ),
+        )
+        if not shared:
+            remember_damage(url, result, cache=self.cache, store=self.store)
+        return result
+
+    async def _fetch_network(self, url: str) -> tuple[str, int, str | None]:
+        if self.validators is None and not self.stream_responses:
+            html = await self.fetch_html(url)
+            total_damage, tier = self.parse_total_damage_with_tier(html)
+            return total_damage, 200, tier
+        return await self._fetch_and_parse(url)
+
+    async def _fetch_and_parse(self, url: str) -> tuple[str, int, str | None]:
+        validator = self.validators.get(url) if self.validators is not None else None
+        stream = self.stream_responses
+        response = await self._get(
+            url, headers=conditional_headers(validator), stream=stream
+        )
+        if response.status_code == 304:
+            await response.aclose()
+            if validator is not None:
+                return validator.damage, 304, None
+            response = await self._get(url, stream=stream)
+
+        try:
+            if stream:
+                total_damage, tier = await self._scan_stream(response)
+            else:
+                total_damage, tier = self.parse_total_damage_with_tier(response.text)
+        finally:
+            await response.aclose()
+
+        if self.validators is not None:
+            validator = validator_from_headers(response.headers, total_damage)
+            if validator is not None:
+                self.validators.set(url, validator)
+        return total_damage, response.status_code, tier
+
+    async def _scan_stream(self, response: httpx.Response) -> tuple[str, str]:
+        scanner = DamageStreamScanner()
+        async for chunk in response.aiter_text():
+            candidate = scanner.feed(chunk)
+            if candidate:
+                return candidate, "stream"
+        return scanner.finish()
+
+    async def fetch_many(
+        self,
+        urls: Iterable[tuple[str, str, str | None]],
+        *,
+        max_concurrency: int | None = None,
+        force_refresh: bool = False,
+        on_result: ResultCallback | None = None,
+    ) -> list[FetchResult]:
+        """여러 캐릭터를 하나의 이벤트 루프에서 동시에 조회한다(입력 순서 유지).
+
+        on_result는 한 명씩 끝날 때마다 이벤트 루프 스레드에서 호출된다.
+        """
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_connections))
+
+        async def run_one(
+            index: int, url: str, name: str, job: str | None
+        ) -> FetchResult:
+            async with semaphore:
+                try:
+                    damage = await self.fetch_character_damage(
+                        url, name, job, force_refresh=force_refresh
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    result = FetchResult(name=name, url=url, job=job, error=exc)
+                else:
+                    result = FetchResult(name=name, url=url, job=job, damage=damage)
+            if on_result is not None:
+                on_result(index, result)
+            return result
+
+        return list(
+            await asyncio.gather(
+                *(run_one(index, *target) for index, target in enumerate(urls))
+            )
+        )
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+        if self.store is not None:
+            self.store.close()
+
+
+class EventLoopThread:
+    """백그라운드 스레드 하나에서 이벤트 루프를 계속 돌리는 도우미.
+
+    UI 스레드나 작업 스레드는 submit()으로 코루틴을 넘기고 concurrent Future로 결과를 받는다.
+    """
+
+    def __init__(self, name: str = "bory-asyncio") -> None:
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        self.start()
+        assert self._loop is not None
+        return self._loop
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+        self._ready.wait()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        return self.submit(coro).result(timeout)
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+            self._ready.clear()
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._ready.set()
+        loop.run_forever()
+
+
+class PooledDundamScraper:
+    """AsyncDundamScraper를 DundamScraper와 같은 동기 API로 감싼 얇은 래퍼.
+
+    모든 요청은 하나의 EventLoopThread에서 실행되므로 커넥션 풀이 조회 간에 유지된다.
+    """
+
+    def __init__(
+        self,
+        scraper: AsyncDundamScraper | None = None,
+        *,
+        loop_thread: EventLoopThread | None = None,
+        request_timeout: float = 10.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        max_workers: int = 4,
+        cache: TTLCache[str] | None = None,
+        store: DamageStore | None = None,
+        conditional_requests: bool = False,
+        stream_responses: bool = False,
+        guard: RequestGuard | None = None,
+    ) -> None:
+        self.async_scraper = scraper or AsyncDundamScraper(
+            request_timeout=request_timeout,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            max_connections=max_workers,
+            cache=cache,
+            store=store,
+            conditional_requests=conditional_requests,
+            stream_responses=stream_responses,
+            guard=guard,
+        )
+        self.loop_thread = loop_thread or EventLoopThread()
+        self.max_workers = max_workers
+
+    def fetch_html(self, url: str) -> str:
+        return self.loop_thread.run(self.async_scraper.fetch_html(url))
+
+    def parse_total_damage(self, html: str) -> str:
+        return self.async_scraper.parse_total_damage(html)
+
+    @property
+    def cache(self) -> TTLCache[str] | None:
+        return self.async_scraper.cache
+
+    @property
+    def store(self) -> DamageStore | None:
+        return self.async_scraper.store
+
+    def fetch_character_damage(
+        self,
+        url: str,
+        name: str,
+        job: str | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> CharacterDamage:
+        return self.loop_thread.run(
+            self.async_scraper.fetch_character_damage(
+                url, name, job, force_refresh=force_refresh
+            )
+        )
+
+    def fetch_many_concurrent(
+        self,
+        urls: Iterable[tuple[str, str, str | None]],
+        *,
+        max_workers: int | None = None,
+        force_refresh: bool = False,
+        on_result: ResultCallback | None = None,
+    ) -> list[FetchResult]:
+        return self.loop_thread.run(
+            self.async_scraper.fetch_many(
+                list(urls),
+                max_concurrency=max_workers or self.max_workers,
+                force_refresh=force_refresh,
+                on_result=on_result,
+            )
+        )
+
+    def close(self) -> None:
+        if self.loop_thread.running:
+            self.loop_thread.run(self.async_scraper.aclose())
+        self.loop_thread.stop()
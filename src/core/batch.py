@@ -0,0 +1,206 @@
+"""화면 없이 실행하는 일괄 총딜 조회.
+
+이름 목록이나 스크린샷을 입력으로 받아 앱과 같은 파이프라인(OCR → 조회)으로 처리하고,
+한 명씩 끝나는 대로 JSON Lines 또는 CSV 한 줄로 내보낸다.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+import numpy as np
+from PIL import Image
+
+from src.core.models import CharacterDamage, CharacterInfo
+from src.core.ocr import OcrEngine
+from src.core.pipeline import Emit, Pipeline, PipelineResult, Stage, fetch_stage
+from src.core.prefetch import DamageFetcher
+
+# 종료 코드: 전부 성공 / 일부 실패 / 사용법·입력 오류 / 전부 실패(또는 인식된 이름 없음)
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_USAGE = 2
+EXIT_ALL_FAILED = 3
+
+OUTPUT_FORMATS = ("jsonl", "csv")
+
+
+class LowConfidenceName(ValueError):
+    """OCR 신뢰도가 낮아 조회하지 않은 이름."""
+
+
+class NoNamesRecognized(ValueError):
+    """스크린샷에서 공대원 이름을 하나도 읽지 못했다."""
+
+
+@dataclass
+class LoadedImage:
+    # 실패 레코드에 어떤 --image였는지 남기기 위해 경로를 함께 넘긴다.
+    path: str | Path
+    array: np.ndarray
+
+
+@dataclass
+class LookupRecord:
+    name: str | None
+    job: str | None = None
+    fame: int | None = None
+    damage: str | None = None
+    # 총딜을 가져온 곳(network/cache/store/coalesced 등)
+    source: str | None = None
+    confidence: float | None = None
+    # OCR 신뢰도가 낮지만 설정(flag)에 따라 조회한 이름
+    flagged: bool = False
+    error: str | None = None
+    # 실패한 단계(load/ocr/confidence/fetch)
+    stage: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def read_names(lines: Iterable[str]) -> list[str]:
+    """한 줄에 이름 하나. 빈 줄과 #으로 시작하는 줄은 건너뛰고 중복은 한 번만 남긴다."""
+
+    names: list[str] = []
+    for line in lines:
+        name = line.strip()
+        if name and not name.startswith("#") and name not in names:
+            names.append(name)
+    return names
+
+
+def lookup_stages(
+    scraper: DamageFetcher,
+    template: str,
+    *,
+    workers: int = 4,
+    force_refresh: bool = False,
+    ocr_engine: OcrEngine | None = None,
+    min_confidence: float = 0.0,
+    low_confidence_action: str = "skip",
+) -> list[Stage]:
+    """입력이 이름(CharacterInfo)이면 조회만, ocr_engine을 주면 이미지 경로부터 시작한다."""
+
+    fetch = fetch_stage(scraper, template, workers=workers, force_refresh=force_refresh)
+    if ocr_engine is None:
+        return [fetch]
+
+    def check_confidence(info: CharacterInfo) -> CharacterInfo:
+        if (
+            low_confidence_action == "skip"
+            and info.confidence is not None
+            and info.confidence < min_confidence
+        ):
+            raise LowConfidenceName(
+                f"OCR confidence {info.confidence:.0%} is below {min_confidence:.0%}"
+            )
+        return info
+
+    def read_names_from(image: LoadedImage, emit: Emit) -> None:
+        if not ocr_engine.extract_characters_from_image(image.array, on_character=emit):
+            # 아무도 못 읽은 입력도 실패로 남겨 종료 코드에 반영한다.
+            raise NoNamesRecognized("no names recognized")
+
+    return [
+        Stage("load", _load_image),
+        Stage("ocr", read_names_from, fan_out=True),
+        Stage("confidence", check_confidence),
+        fetch,
+    ]
+
+
+def to_record(result: PipelineResult, *, min_confidence: float = 0.0) -> LookupRecord:
+    source = result.source
+    if isinstance(source, LoadedImage):
+        source = source.path
+    if not isinstance(source, CharacterInfo):
+        # 이미지를 읽거나 OCR하는 단계에서 실패하면 이름 대신 이미지 경로를 남긴다.
+        name = str(source) if isinstance(source, str | Path) else None
+        return LookupRecord(
+            name=name, error=_describe(result.error), stage=result.stage
+        )
+
+    record = LookupRecord(
+        name=source.name,
+        job=source.job,
+        fame=source.fame,
+        confidence=source.confidence,
+        flagged=source.confidence is not None and source.confidence < min_confidence,
+    )
+    if not result.ok:
+        record.error = _describe(result.error)
+        record.stage = result.stage
+        return record
+    damage: CharacterDamage = result.value
+    record.job = damage.job or record.job
+    record.fame = damage.fame if damage.fame is not None else record.fame
+    record.damage = damage.damage
+    record.source = damage.stats.source if damage.stats is not None else None
+    return record
+
+
+class RecordWriter:
+    """레코드를 한 줄씩 쓰고 바로 flush해 파이프/스케줄러가 실시간으로 읽을 수 있게 한다."""
+
+    def __init__(self, stream: TextIO, output_format: str = "jsonl") -> None:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'")
+        self.stream = stream
+        self.output_format = output_format
+        self._csv: Any = None
+
+    def write(self, record: LookupRecord) -> None:
+        row = asdict(record)
+        if self.output_format == "jsonl":
+            self.stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+        else:
+            if self._csv is None:
+                self._csv = csv.DictWriter(
+                    self.stream, fieldnames=list(row), lineterminator="\n"
+                )
+                self._csv.writeheader()
+            self._csv.writerow(row)
+        self.stream.flush()
+
+
+def run_lookup(
+    pipeline: Pipeline,
+    items: Iterable[Any],
+    writer: RecordWriter,
+    *,
+    min_confidence: float = 0.0,
+) -> int:
+    """파이프라인을 실행해 결과를 완료 순서대로 쓰고 종료 코드를 돌려준다."""
+
+    succeeded = failed = 0
+    for result in pipeline.stream(items):
+        record = to_record(result, min_confidence=min_confidence)
+        writer.write(record)
+        if record.ok:
+            succeeded += 1
+        else:
+            failed += 1
+    if succeeded and failed:
+        return EXIT_PARTIAL
+    if failed or not succeeded:
+        return EXIT_ALL_FAILED
+    return EXIT_OK
+
+
+def _load_image(path: str | Path) -> LoadedImage:
+    with Image.open(path) as image:
+        return LoadedImage(path, np.asarray(image.convert("RGB")))
+
+
+def _describe(error: BaseException | None) -> str:
+    if error is None:
+        return ""
+    message = str(error)
+    return f"{type(error).__name__}: {message}" if message else type(error).__name__
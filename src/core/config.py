@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+from src.core.models import CaptureRegion
+
 
 @dataclass
 class AppConfig:
@@ -24,8 +26,43 @@ class AppConfig:
     request_timeout: float = 5.0
     request_max_retries: int = 2
     request_retry_backoff: float = 0.5
+    fetch_max_workers: int = 4
+    scraper_engine: str = "threads"
+    http_conditional_requests: bool = True
+    stream_responses: bool = True
+    rate_limit_per_second: float = 4.0
+    rate_limit_burst: int = 4
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    cache_ttl_seconds: float = 300.0
+    cache_max_entries: int = 256
+    damage_store_enabled: bool = False
+    damage_store_path: Path = Path("cache") / "damage.sqlite3"
+    damage_store_max_entries: int = 5000
+    damage_store_stale_after: float = 1800.0
+    lookup_server_url: str = ""
+    server_host: str = "127.0.0.1"
+    server_port: int = 8765
+    capture_region: CaptureRegion | None = None
+    capture_backend: str = "auto"
+    snapshot_save: str = "crop"
+    snapshot_format: str = "jpg"
     ocr_language: str = "ko"
+    ocr_detect_panel: bool = True
+    ocr_row_mode: bool = True
+    ocr_backend: str = "pytesseract"
+    ocr_workers: int = 2
+    ocr_cache_entries: int = 128
+    ocr_preprocess: str = "gray,otsu"
+    name_snap_min_confidence: float = 0.75
+    ocr_retry_below_confidence: float = 0.6
+    ocr_retry_preprocess: str = "upscale:2,gray,adaptive:31:10"
+    ocr_min_confidence: float = 0.5
+    ocr_low_confidence_action: str = "skip"
     max_party_members: int = 12
+    speculative_prefetch: bool = False
+    watch_interval_seconds: float = 2.0
+    watch_cpu_budget: float = 0.25
     log_level: str = "ERROR"
     log_dir: Path = Path("logs")
     log_to_console: bool = False
@@ -93,6 +130,168 @@ def load_config(
             default=defaults.request_retry_backoff,
             caster=float,
         ),
+        fetch_max_workers=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="fetch_max_workers",
+            env_key="BORY_FETCH_MAX_WORKERS",
+            default=defaults.fetch_max_workers,
+            caster=int,
+        ),
+        scraper_engine=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="scraper_engine",
+            env_key="BORY_SCRAPER_ENGINE",
+            default=defaults.scraper_engine,
+        ),
+        http_conditional_requests=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="http_conditional_requests",
+            env_key="BORY_HTTP_CONDITIONAL_REQUESTS",
+            default=defaults.http_conditional_requests,
+            caster=_parse_bool,
+        ),
+        stream_responses=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="stream_responses",
+            env_key="BORY_STREAM_RESPONSES",
+            default=defaults.stream_responses,
+            caster=_parse_bool,
+        ),
+        rate_limit_per_second=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="rate_limit_per_second",
+            env_key="BORY_RATE_LIMIT_PER_SECOND",
+            default=defaults.rate_limit_per_second,
+            caster=float,
+        ),
+        rate_limit_burst=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="rate_limit_burst",
+            env_key="BORY_RATE_LIMIT_BURST",
+            default=defaults.rate_limit_burst,
+            caster=int,
+        ),
+        circuit_failure_threshold=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="circuit_failure_threshold",
+            env_key="BORY_CIRCUIT_FAILURE_THRESHOLD",
+            default=defaults.circuit_failure_threshold,
+            caster=int,
+        ),
+        circuit_reset_timeout=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="circuit_reset_timeout",
+            env_key="BORY_CIRCUIT_RESET_TIMEOUT",
+            default=defaults.circuit_reset_timeout,
+            caster=float,
+        ),
+        cache_ttl_seconds=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="cache_ttl_seconds",
+            env_key="BORY_CACHE_TTL_SECONDS",
+            default=defaults.cache_ttl_seconds,
+            caster=float,
+        ),
+        cache_max_entries=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="cache_max_entries",
+            env_key="BORY_CACHE_MAX_ENTRIES",
+            default=defaults.cache_max_entries,
+            caster=int,
+        ),
+        damage_store_enabled=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="damage_store_enabled",
+            env_key="BORY_DAMAGE_STORE_ENABLED",
+            default=defaults.damage_store_enabled,
+            caster=_parse_bool,
+        ),
+        damage_store_path=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="damage_store_path",
+            env_key="BORY_DAMAGE_STORE_PATH",
+            default=defaults.damage_store_path,
+            caster=Path,
+        ),
+        damage_store_max_entries=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="damage_store_max_entries",
+            env_key="BORY_DAMAGE_STORE_MAX_ENTRIES",
+            default=defaults.damage_store_max_entries,
+            caster=int,
+        ),
+        damage_store_stale_after=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="damage_store_stale_after",
+            env_key="BORY_DAMAGE_STORE_STALE_AFTER",
+            default=defaults.damage_store_stale_after,
+            caster=float,
+        ),
+        lookup_server_url=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="lookup_server_url",
+            env_key="BORY_LOOKUP_SERVER_URL",
+            default=defaults.lookup_server_url,
+        ),
+        server_host=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="server_host",
+            env_key="BORY_SERVER_HOST",
+            default=defaults.server_host,
+        ),
+        server_port=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="server_port",
+            env_key="BORY_SERVER_PORT",
+            default=defaults.server_port,
+            caster=int,
+        ),
+        capture_region=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="capture_region",
+            env_key="BORY_CAPTURE_REGION",
+            default=defaults.capture_region,
+            caster=_parse_capture_region,
+        ),
+        capture_backend=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="capture_backend",
+            env_key="BORY_CAPTURE_BACKEND",
+            default=defaults.capture_backend,
+        ),
+        snapshot_save=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="snapshot_save",
+            env_key="BORY_SNAPSHOT_SAVE",
+            default=defaults.snapshot_save,
+        ),
+        snapshot_format=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="snapshot_format",
+            env_key="BORY_SNAPSHOT_FORMAT",
+            default=defaults.snapshot_format,
+        ),
         ocr_language=_resolve_value(
             environment=environment,
             parser=parser,
@@ -100,6 +299,90 @@ def load_config(
             env_key="BORY_OCR_LANGUAGE",
             default=defaults.ocr_language,
         ),
+        ocr_detect_panel=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_detect_panel",
+            env_key="BORY_OCR_DETECT_PANEL",
+            default=defaults.ocr_detect_panel,
+            caster=_parse_bool,
+        ),
+        ocr_row_mode=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_row_mode",
+            env_key="BORY_OCR_ROW_MODE",
+            default=defaults.ocr_row_mode,
+            caster=_parse_bool,
+        ),
+        ocr_backend=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_backend",
+            env_key="BORY_OCR_BACKEND",
+            default=defaults.ocr_backend,
+        ),
+        ocr_workers=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_workers",
+            env_key="BORY_OCR_WORKERS",
+            default=defaults.ocr_workers,
+            caster=int,
+        ),
+        ocr_cache_entries=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_cache_entries",
+            env_key="BORY_OCR_CACHE_ENTRIES",
+            default=defaults.ocr_cache_entries,
+            caster=int,
+        ),
+        ocr_preprocess=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_preprocess",
+            env_key="BORY_OCR_PREPROCESS",
+            default=defaults.ocr_preprocess,
+        ),
+        name_snap_min_confidence=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="name_snap_min_confidence",
+            env_key="BORY_NAME_SNAP_MIN_CONFIDENCE",
+            default=defaults.name_snap_min_confidence,
+            caster=float,
+        ),
+        ocr_retry_below_confidence=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_retry_below_confidence",
+            env_key="BORY_OCR_RETRY_BELOW_CONFIDENCE",
+            default=defaults.ocr_retry_below_confidence,
+            caster=float,
+        ),
+        ocr_retry_preprocess=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_retry_preprocess",
+            env_key="BORY_OCR_RETRY_PREPROCESS",
+            default=defaults.ocr_retry_preprocess,
+        ),
+        ocr_min_confidence=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_min_confidence",
+            env_key="BORY_OCR_MIN_CONFIDENCE",
+            default=defaults.ocr_min_confidence,
+            caster=float,
+        ),
+        ocr_low_confidence_action=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="ocr_low_confidence_action",
+            env_key="BORY_OCR_LOW_CONFIDENCE_ACTION",
+            default=defaults.ocr_low_confidence_action,
+        ),
         max_party_members=_resolve_value(
             environment=environment,
             parser=parser,
@@ -108,6 +391,30 @@ def load_config(
             default=defaults.max_party_members,
             caster=int,
         ),
+        speculative_prefetch=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="speculative_prefetch",
+            env_key="BORY_SPECULATIVE_PREFETCH",
+            default=defaults.speculative_prefetch,
+            caster=_parse_bool,
+        ),
+        watch_interval_seconds=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="watch_interval_seconds",
+            env_key="BORY_WATCH_INTERVAL_SECONDS",
+            default=defaults.watch_interval_seconds,
+            caster=float,
+        ),
+        watch_cpu_budget=_resolve_value(
+            environment=environment,
+            parser=parser,
+            key="watch_cpu_budget",
+            env_key="BORY_WATCH_CPU_BUDGET",
+            default=defaults.watch_cpu_budget,
+            caster=float,
+        ),
         log_level=_resolve_value(
             environment=environment,
             parser=parser,
@@ -183,6 +490,36 @@ def _parse_bool(value: str) -> bool:
     raise ValueError(f"Expected boolean value, got '{value}'")
 
 
+def _parse_capture_region(value: str) -> CaptureRegion | None:
+    """Parse ``left,top,width,height`` in pixels or as screen fractions (0-1)."""
+
+    if not value.strip():
+        return None
+    parts = [part.strip() for part in value.split(",")]
+    if len(parts) != 4:
+        raise ValueError(
+            f"capture_region must be 'left,top,width,height', got '{value}'"
+        )
+    return CaptureRegion(*(float(part) for part in parts))
+
+
+def save_config_values(path: str | Path, values: Mapping[str, str]) -> Path:
+    """Write ``values`` into the ``[bory]`` section of ``path``, keeping other keys."""
+
+    path = Path(path).expanduser()
+    parser = configparser.ConfigParser()
+    if path.is_file():
+        parser.read(path, encoding="utf-8")
+    if not parser.has_section("bory"):
+        parser.add_section("bory")
+    for key, value in values.items():
+        parser.set("bory", key, value)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        parser.write(handle)
+    return path
+
+
 def _validate_config(config: AppConfig) -> None:
     if not config.dundam_base_url.strip():
         raise ValueError("dundam_base_url must not be empty")
@@ -197,8 +534,84 @@ def _validate_config(config: AppConfig) -> None:
         raise ValueError("request_max_retries must be zero or positive")
     if config.request_retry_backoff < 0:
         raise ValueError("request_retry_backoff must be zero or positive")
+    if not 1 <= config.fetch_max_workers <= 32:
+        raise ValueError("fetch_max_workers must be between 1 to 32")
+    engine = config.scraper_engine.strip().lower()
+    if engine not in {"threads", "asyncio"}:
+        raise ValueError("scraper_engine must be one of threads, asyncio")
+    config.scraper_engine = engine
+    if config.rate_limit_per_second < 0:
+        raise ValueError("rate_limit_per_second must be zero or positive")
+    if config.rate_limit_burst < 1:
+        raise ValueError("rate_limit_burst must be positive")
+    if config.circuit_failure_threshold < 1:
+        raise ValueError("circuit_failure_threshold must be positive")
+    if config.circuit_reset_timeout <= 0:
+        raise ValueError("circuit_reset_timeout must be positive")
+    if config.cache_ttl_seconds < 0:
+        raise ValueError("cache_ttl_seconds must be zero or positive")
+    if config.cache_max_entries < 0:
+        raise ValueError("cache_max_entries must be zero or positive")
+    if not str(config.damage_store_path).strip():
+        raise ValueError("damage_store_path must not be empty")
+    if config.damage_store_max_entries <= 0:
+        raise ValueError("damage_store_max_entries must be positive")
+    if config.damage_store_stale_after < 0:
+        raise ValueError("damage_store_stale_after must be zero or positive")
+    server_url = config.lookup_server_url.strip()
+    if server_url:
+        parsed_server = urlparse(server_url)
+        if parsed_server.scheme not in {"http", "https"} or not parsed_server.netloc:
+            raise ValueError(
+                "lookup_server_url must include scheme and host (http or https)"
+            )
+    config.lookup_server_url = server_url
+    if not config.server_host.strip():
+        raise ValueError("server_host must not be empty")
+    if not 1 <= config.server_port <= 65535:
+        raise ValueError("server_port must be between 1 to 65535")
+    backend = config.ocr_backend.strip().lower()
+    if backend not in {"pytesseract", "tesserocr"}:
+        raise ValueError("ocr_backend must be one of pytesseract, tesserocr")
+    config.ocr_backend = backend
+    if not 1 <= config.ocr_workers <= 16:
+        raise ValueError("ocr_workers must be between 1 to 16")
+    if config.ocr_cache_entries < 0:
+        raise ValueError("ocr_cache_entries must be zero or positive")
+    if not config.ocr_preprocess.strip():
+        raise ValueError("ocr_preprocess must not be empty")
+    if not 0 <= config.name_snap_min_confidence <= 1:
+        raise ValueError("name_snap_min_confidence must be between 0 and 1")
+    for key in ("ocr_retry_below_confidence", "ocr_min_confidence"):
+        if not 0 <= getattr(config, key) <= 1:
+            raise ValueError(f"{key} must be between 0 and 1")
+    action = config.ocr_low_confidence_action.strip().lower()
+    if action not in {"skip", "flag"}:
+        raise ValueError("ocr_low_confidence_action must be one of skip, flag")
+    config.ocr_low_confidence_action = action
+    region = config.capture_region
+    if region is not None and (
+        region.left < 0 or region.top < 0 or region.width <= 0 or region.height <= 0
+    ):
+        raise ValueError("capture_region must have non-negative origin and size")
+    capture_backend = config.capture_backend.strip().lower()
+    if capture_backend not in {"auto", "mss", "pyautogui"}:
+        raise ValueError("capture_backend must be one of auto, mss, pyautogui")
+    config.capture_backend = capture_backend
+    snapshot_save = config.snapshot_save.strip().lower()
+    if snapshot_save not in {"off", "crop", "full"}:
+        raise ValueError("snapshot_save must be one of off, crop, full")
+    config.snapshot_save = snapshot_save
+    snapshot_format = config.snapshot_format.strip().lower().lstrip(".")
+    if snapshot_format not in {"png", "jpg", "bmp"}:
+        raise ValueError("snapshot_format must be one of png, jpg, bmp")
+    config.snapshot_format = snapshot_format
     if not 1 <= config.max_party_members <= 12:
         raise ValueError("max_party_members must be between 1 to 12")
+    if config.watch_interval_seconds <= 0:
+        raise ValueError("watch_interval_seconds must be positive")
+    if not 0 < config.watch_cpu_budget <= 1:
+        raise ValueError("watch_cpu_budget must be greater than 0 and at most 1")
     if not str(config.log_dir).strip():
         raise ValueError("log_dir must not be empty")
     level = config.log_level.strip().upper()
@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from .cache import TTLCache
 from .config import AppConfig, load_config
+from .damage_store import DamageStore
+from .name_index import NameIndex
+from .ocr import OcrEngine
+from .ocr_backends import create_ocr_backend
+from .panel_detect import PanelDetector
+from .prefetch import DamageFetcher, Prefetcher
+from .preprocess import PreprocessPipeline
+from .ratelimit import shared_request_guard
+from .remote import RemoteScraper
+from .scraper import DundamScraper
+
+if TYPE_CHECKING:
+    from .async_scraper import PooledDundamScraper
 
 
 @dataclass
@@ -27,3 +42,109 @@ def create_container(
 
     resolved_config = load_config(config_path=config_path, environ=environ)
     return Container(config=resolved_config)
+
+
+def build_scraper(
+    config: AppConfig,
+) -> DundamScraper | PooledDundamScraper | RemoteScraper:
+    """Build the damage scraper selected by ``config.scraper_engine``.
+
+    ``asyncio`` returns a synchronous facade over the pooled async engine, so
+    callers can use either engine through the same API. When
+    ``lookup_server_url`` is set, lookups go through that shared server instead.
+    """
+
+    if config.lookup_server_url:
+        # 서버 쪽 재시도와 속도 제한 대기까지 포함해 기다린다.
+        timeout = config.request_timeout * (config.request_max_retries + 1) * 2
+        return RemoteScraper(config.lookup_server_url, timeout=timeout)
+    cache = build_response_cache(config)
+    store = build_damage_store(config)
+    guard = shared_request_guard(config)
+    if config.scraper_engine == "asyncio":
+        from .async_scraper import PooledDundamScraper
+
+        return PooledDundamScraper(
+            request_timeout=config.request_timeout,
+            max_retries=config.request_max_retries,
+            retry_backoff=config.request_retry_backoff,
+            max_workers=config.fetch_max_workers,
+            cache=cache,
+            store=store,
+            conditional_requests=config.http_conditional_requests,
+            stream_responses=config.stream_responses,
+            guard=guard,
+        )
+    return DundamScraper(
+        request_timeout=config.request_timeout,
+        max_retries=config.request_max_retries,
+        retry_backoff=config.request_retry_backoff,
+        max_workers=config.fetch_max_workers,
+        cache=cache,
+        store=store,
+        conditional_requests=config.http_conditional_requests,
+        stream_responses=config.stream_responses,
+        guard=guard,
+    )
+
+
+def build_response_cache(config: AppConfig) -> TTLCache[str] | None:
+    """Return the in-memory damage cache, or None when disabled by a zero setting."""
+
+    if config.cache_ttl_seconds <= 0 or config.cache_max_entries <= 0:
+        return None
+    return TTLCache(max_entries=config.cache_max_entries, ttl=config.cache_ttl_seconds)
+
+
+def build_damage_store(config: AppConfig) -> DamageStore | None:
+    """Open the on-disk damage store when ``damage_store_enabled`` is set."""
+
+    if not config.damage_store_enabled:
+        return None
+    return DamageStore(
+        config.damage_store_path,
+        max_entries=config.damage_store_max_entries,
+        stale_after=config.damage_store_stale_after,
+    )
+
+
+def build_prefetcher(config: AppConfig, scraper: DamageFetcher) -> Prefetcher | None:
+    """Return the speculative lookup helper when ``speculative_prefetch`` is set."""
+
+    if not config.speculative_prefetch:
+        return None
+    return Prefetcher(scraper, max_workers=config.fetch_max_workers)
+
+
+def build_ocr_engine(config: AppConfig, known_names: Iterable[str] = ()) -> OcrEngine:
+    """Build the OCR engine with the backend selected by ``config.ocr_backend``.
+
+    ``known_names`` seeds the fuzzy name index; a zero
+    ``name_snap_min_confidence`` disables name snapping.
+    """
+
+    return OcrEngine(
+        language=config.ocr_language,
+        panel_detector=PanelDetector() if config.ocr_detect_panel else None,
+        backend=create_ocr_backend(
+            config.ocr_backend, config.ocr_language, workers=config.ocr_workers
+        ),
+        row_mode=config.ocr_row_mode,
+        result_cache=(
+            TTLCache(max_entries=config.ocr_cache_entries, ttl=None)
+            if config.ocr_cache_entries > 0
+            else None
+        ),
+        preprocessor=PreprocessPipeline(config.ocr_preprocess),
+        name_index=(
+            NameIndex(known_names, min_confidence=config.name_snap_min_confidence)
+            if config.name_snap_min_confidence > 0
+            else None
+        ),
+        retry_confidence=config.ocr_retry_below_confidence,
+        retry_preprocessor=(
+            PreprocessPipeline(config.ocr_retry_preprocess)
+            if config.ocr_retry_preprocess.strip()
+            else None
+        ),
+    )
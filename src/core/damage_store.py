@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.core.models import CharacterDamage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS damage (
+    server TEXT NOT NULL,
+    name TEXT NOT NULL,
+    damage TEXT NOT NULL,
+    job TEXT,
+    fame INTEGER,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (server, name)
+);
+CREATE INDEX IF NOT EXISTS idx_damage_fetched_at ON damage (fetched_at);
+"""
+
+
+@dataclass
+class StoredDamage:
+    damage: CharacterDamage
+    server: str
+    fetched_at: float
+    is_stale: bool
+
+
+class DamageStore:
+    """재시작 후에도 유지되는 SQLite 총딜 캐시.
+
+    - 키는 (서버, 캐릭터명)이며 조회 시각(fetched_at)을 함께 저장한다.
+    - stale_after초가 지난 항목은 is_stale=True로 돌려주어 호출 측이 갱신 여부를 정한다.
+    - 조회 작업 스레드 여러 개가 동시에 쓰므로 연결 하나를 락으로 보호하고 WAL 모드를 쓴다.
+    - max_entries를 넘으면 가장 오래된 항목부터 지운다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_entries: int = 5000,
+        stale_after: float = 1800.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.stale_after = stale_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=5.0, check_same_thread=False
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def get(self, server: str, name: str) -> StoredDamage | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT damage, job, fame, fetched_at FROM damage"
+                " WHERE server = ? AND name = ?",
+                (server, name),
+            ).fetchone()
+        if row is None:
+            return None
+        damage, job, fame, fetched_at = row
+        return StoredDamage(
+            damage=CharacterDamage(name=name, damage=damage, job=job, fame=fame),
+            server=server,
+            fetched_at=fetched_at,
+            is_stale=self._clock() - fetched_at > self.stale_after,
+        )
+
+    def put(
+        self, server: str, damage: CharacterDamage, fetched_at: float | None = None
+    ) -> None:
+        fetched_at = self._clock() if fetched_at is None else fetched_at
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO damage"
+                " (server, name, damage, job, fame, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    server,
+                    damage.name,
+                    damage.damage,
+                    damage.job,
+                    damage.fame,
+                    fetched_at,
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM damage WHERE rowid IN ("
+                " SELECT rowid FROM damage ORDER BY fetched_at DESC"
+                " LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def known_names(self) -> list[str]:
+        """조회에 성공한 적 있는 캐릭터명을 최근 조회 순으로 돌려준다(서버 구분 없음)."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name FROM damage GROUP BY name ORDER BY MAX(fetched_at) DESC"
+            ).fetchall()
+        return [name for (name,) in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM damage").fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def server_from_url(url: str) -> str:
+    """던담 URL의 server 쿼리 값을 돌려준다(없으면 빈 문자열)."""
+
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+    return query.get("server", [""])[0]
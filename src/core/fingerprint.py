@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import hashlib
+
+import cv2
+import numpy as np
+
+
+def dhash(image: np.ndarray, *, width: int = 16, height: int = 8) -> bytes:
+    """가로 방향 차이 해시(dHash)를 돌려준다.
+
+    (width+1)×height로 줄인 뒤 이웃 픽셀의 밝기 비교 결과를 비트로 묶는다.
+    압축 잡음이나 한두 픽셀 차이에는 그대로지만 글자가 바뀌면 값이 달라진다.
+    원본 크기도 함께 넣어 크기가 다른 이미지끼리 같은 값이 나오지 않게 한다.
+    """
+
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    small = cv2.resize(image, (width + 1, height), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    size = np.array(image.shape[:2], dtype=">u4").tobytes()
+    return size + np.packbits(bits).tobytes()
+
+
+def pixel_key(array: np.ndarray) -> bytes:
+    """픽셀 전체와 모양/자료형을 해시한 정확한 지문(blake2b 16바이트).
+
+    dHash와 달리 한 픽셀만 달라도 값이 바뀌므로, 결과를 재사용하거나 작업을 건너뛸지
+    정하는 키로 쓴다.
+    """
+
+    digest = hashlib.blake2b(np.ascontiguousarray(array).tobytes(), digest_size=16)
+    digest.update(repr((array.shape, array.dtype.str)).encode())
+    return digest.digest()
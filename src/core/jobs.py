@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# 작업 스레드에서 UI 스레드로 콜백을 넘기는 함수. Tk에서는 lambda fn, *a: root.after(0, fn, *a)
+Post = Callable[..., Any]
+
+
+class JobCancelled(Exception):
+    """CancelToken.check()가 취소된 작업에서 던지는 예외."""
+
+
+class CancelToken:
+    """작업 스레드가 단계 사이마다 확인하는 취소 표시."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+class JobRunner(Generic[T]):
+    """무거운 작업을 전용 작업 스레드 하나에서 한 번에 하나씩 실행한다.
+
+    - submit()은 이미 실행 중인 작업이 있으면 False를 돌려 중복 요청을 거절한다.
+    - 결과와 예외는 post를 통해 호출한 쪽 스레드(UI)에서 on_done/on_error로 전달된다.
+    - cancel()은 즉시 대기 상태로 돌아가고, 작업은 다음 check()에서 멈추거나
+      끝까지 돌더라도 결과가 버려진다. 취소된 작업이 남아 있는 동안 새 작업은
+      같은 스레드에서 그 뒤에 실행된다.
+    - busy, submit(), cancel()은 post가 콜백을 실행하는 스레드에서만 호출한다.
+    """
+
+    def __init__(self, post: Post, *, name: str = "job") -> None:
+        self._post = post
+        self._name = name
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._token: CancelToken | None = None
+
+    @property
+    def busy(self) -> bool:
+        return self._token is not None
+
+    def submit(
+        self,
+        work: Callable[[CancelToken], T],
+        on_done: Callable[[T], None],
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> bool:
+        if self._token is not None:
+            return False
+        token = self._token = CancelToken()
+        self._executor.submit(self._run, token, work, on_done, on_error)
+        return True
+
+    def cancel(self) -> bool:
+        token, self._token = self._token, None
+        if token is None:
+            return False
+        token.cancel()
+        return True
+
+    def close(self) -> None:
+        self.cancel()
+        # 종료 시 창이 멈추지 않도록 실행 중인 작업을 기다리지 않는다.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(
+        self,
+        token: CancelToken,
+        work: Callable[[CancelToken], T],
+        on_done: Callable[[T], None],
+        on_error: Callable[[BaseException], None] | None,
+    ) -> None:
+        try:
+            result = work(token)
+        except JobCancelled:
+            logger.info("%s job cancelled.", self._name)
+            return
+        except Exception as exc:  # noqa: BLE001
+            self._post(self._finish, token, on_error, exc)
+            return
+        self._post(self._finish, token, on_done, result)
+
+    def _finish(
+        self, token: CancelToken, callback: Callable[[Any], None] | None, value: Any
+    ) -> None:
+        if token.cancelled or self._token is not token:
+            logger.info("Dropping result of a cancelled %s job.", self._name)
+            return
+        self._token = None
+        if callback is not None:
+            callback(value)
+        elif isinstance(value, BaseException):
+            logger.error("%s job failed.", self._name, exc_info=value)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -8,6 +8,22 @@ class CharacterInfo:
     name: str
     job: str | None = None
     fame: int | None = None
+    # OCR 단어 신뢰도 평균(0~1). 단어 정보 없이 읽은 경우 None
+    confidence: float | None = field(default=None, compare=False)
+    # 캡쳐 이미지 기준 (left, top, width, height)
+    bbox: tuple[int, int, int, int] | None = field(default=None, compare=False)
+
+
+@dataclass
+class FetchStats:
+    url: str
+    # network | coalesced(진행 중인 같은 요청을 공유) | cache | store
+    source: str = "network"
+    # 200 또는 304 (캐시에서 가져온 경우 None)
+    status: int | None = None
+    elapsed: float = 0.0
+    # stream | regex | lxml | soup (304/캐시로 파싱을 건너뛴 경우 None)
+    parse_tier: str | None = None
 
 
 @dataclass
@@ -16,9 +32,60 @@ class CharacterDamage:
     damage: str
     job: str | None = None
     fame: int | None = None
+    stats: FetchStats | None = field(default=None, compare=False, repr=False)
+
+
+@dataclass
+class FetchResult:
+    name: str
+    url: str
+    job: str | None = None
+    damage: CharacterDamage | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 
 @dataclass
 class RaidSnapshot:
     characters: list[CharacterInfo]
     screenshot_path: str | None = None
+
+
+@dataclass(frozen=True)
+class CaptureRegion:
+    """캡쳐할 화면 영역. 네 값이 모두 0~1이면 화면 크기에 대한 비율, 아니면 픽셀 좌표다."""
+
+    left: float
+    top: float
+    width: float
+    height: float
+
+    @property
+    def is_fractional(self) -> bool:
+        return all(
+            0 <= value <= 1 for value in (self.left, self.top, self.width, self.height)
+        )
+
+    def to_pixels(
+        self, screen_width: int, screen_height: int
+    ) -> tuple[int, int, int, int]:
+        """(left, top, width, height) 픽셀 상자로 바꾸고 화면 밖으로 나가는 부분은 잘라낸다."""
+
+        left, top, width, height = self.left, self.top, self.width, self.height
+        if self.is_fractional:
+            left, width = left * screen_width, width * screen_width
+            top, height = top * screen_height, height * screen_height
+        x0 = min(max(0, round(left)), screen_width - 1)
+        y0 = min(max(0, round(top)), screen_height - 1)
+        x1 = min(screen_width, max(x0 + 1, round(left + width)))
+        y1 = min(screen_height, max(y0 + 1, round(top + height)))
+        return x0, y0, x1 - x0, y1 - y0
+
+    def to_config_value(self) -> str:
+        values = (self.left, self.top, self.width, self.height)
+        if self.is_fractional:
+            return ",".join(f"{value:.4f}".rstrip("0").rstrip(".") for value in values)
+        return ",".join(str(int(value)) for value in values)
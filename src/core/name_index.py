@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# OCR이 자주 헷갈리는 라틴 문자/숫자는 같은 글자로 보고 거리를 잰다.
+_CONFUSABLES = str.maketrans({"I": "l", "1": "l", "|": "l", "0": "o", "O": "o"})
+
+
+@dataclass
+class NameMatch:
+    name: str
+    distance: int
+    confidence: float
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초/중/종성 자모로 풀어 쓴다. 한글이 아닌 글자는 그대로 둔다.
+
+    음절 단위로 비교하면 받침 하나만 틀려도 한 글자가 통째로 다르게 잡히므로,
+    자모 단위 편집 거리로 비슷하게 생긴 글자를 가깝게 본다.
+    """
+
+    out = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            out.append(_CHOSEONG[offset // 588])
+            out.append(_JUNGSEONG[(offset % 588) // 28])
+            if offset % 28:
+                out.append(_JONGSEONG[offset % 28])
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def name_key(name: str) -> str:
+    return decompose_jamo(name.strip()).translate(_CONFUSABLES)
+
+
+def edit_distance(left: str, right: str) -> int:
+    if len(left) < len(right):
+        left, right = right, left
+    previous = list(range(len(right) + 1))
+    for i, a in enumerate(left, 1):
+        current = [i]
+        for j, b in enumerate(right, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a != b))
+            )
+        previous = current
+    return previous[-1]
+
+
+class _Node:
+    __slots__ = ("key", "names", "children")
+
+    def __init__(self, key: str, name: str) -> None:
+        self.key = key
+        self.names = [name]
+        self.children: dict[int, _Node] = {}
+
+
+class NameIndex:
+    """조회에 성공한 캐릭터명으로 만든 근사 검색용 BK-트리.
+
+    - 키는 자모 분해 + 헷갈리는 문자 정규화(name_key) 결과이고, 편집 거리로 탐색한다.
+    - snap()은 신뢰도(1 - 거리/길이)가 min_confidence 이상인 유일한 최선 후보가 있을 때만
+      이름을 바꾼다. 후보가 동점이면 잘못 고칠 수 있으므로 원래 이름을 둔다.
+    """
+
+    def __init__(
+        self, names: Iterable[str] = (), *, min_confidence: float = 0.75
+    ) -> None:
+        self.min_confidence = min_confidence
+        self._root: _Node | None = None
+        self._size = 0
+        self._lock = threading.Lock()
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> None:
+        name = name.strip()
+        if not name:
+            return
+        key = name_key(name)
+        with self._lock:
+            if self._root is None:
+                self._root = _Node(key, name)
+                self._size = 1
+                return
+            node = self._root
+            while True:
+                distance = edit_distance(key, node.key)
+                if distance == 0:
+                    if name not in node.names:
+                        node.names.append(name)
+                        self._size += 1
+                    return
+                child = node.children.get(distance)
+                if child is None:
+                    node.children[distance] = _Node(key, name)
+                    self._size += 1
+                    return
+                node = child
+
+    def match(self, name: str) -> NameMatch | None:
+        """허용 거리 안의 가장 가까운 이름을 돌려준다(동점이면 None)."""
+
+        if name in self:
+            return NameMatch(name, 0, 1.0)
+        key = name_key(name)
+        if not key:
+            return None
+        max_distance = int(len(key) * (1 - self.min_confidence))
+        best: list[tuple[int, str]] = []
+        with self._lock:
+            stack = [self._root] if self._root is not None else []
+            while stack:
+                node = stack.pop()
+                distance = edit_distance(key, node.key)
+                if distance <= max_distance:
+                    best.extend((distance, known) for known in node.names)
+                low, high = distance - max_distance, distance + max_distance
+                stack.extend(
+                    child
+                    for edge, child in node.children.items()
+                    if low <= edge <= high
+                )
+        if not best:
+            return None
+        best.sort()
+        distance, known = best[0]
+        if len(best) > 1 and best[1][0] == distance:
+            return None
+        return NameMatch(known, distance, 1 - distance / len(key))
+
+    def snap(self, name: str) -> str:
+        found = self.match(name)
+        if found is None or found.confidence < self.min_confidence:
+            return name
+        return found.name
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str) or self._root is None:
+            return False
+        key = name_key(name)
+        with self._lock:
+            node = self._root
+            while node is not None:
+                distance = edit_distance(key, node.key)
+                if distance == 0:
+                    return name in node.names
+                node = node.children.get(distance)
+        return False
+
+    def __len__(self) -> int:
+        return self._size
@@ -1,44 +1,355 @@
 from __future__ import annotations
 
+import logging
 import re
 import tempfile
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from pathlib import Path
 
-import cv2
 import numpy as np
-import pytesseract
 from PIL import Image
 
+from src.core.cache import TTLCache
+from src.core.fingerprint import pixel_key
 from src.core.models import CharacterInfo
+from src.core.name_index import NameIndex, NameMatch
+from src.core.ocr_backends import OcrBackend, OcrOutput, PytesseractBackend
+from src.core.panel_detect import Box, PanelDetector, crop_image
+from src.core.preprocess import Geometry, PreprocessPipeline
+
+logger = logging.getLogger(__name__)
+
+ImageLike = Image.Image | np.ndarray
+CharacterCallback = Callable[[CharacterInfo], None]
+
+# Tesseract 페이지 분할 모드: 이미지를 한 줄의 텍스트로 취급
+SINGLE_LINE_PSM = 7
+
+
+@dataclass
+class PanelReading:
+    """한 장의 캡쳐를 읽은 결과. 화면 순서의 공대원 목록과 그때 찾은 패널 위치."""
+
+    characters: list[CharacterInfo]
+    panel_box: Box | None = None
 
 
 class OcrEngine:
     """OpenCV + Tesseract 기반 OCR 래퍼.
 
-    - 이미지 전처리(그레이스케일, 이진화) 후 pytesseract로 텍스트 추출
+    - 이미지 전처리(기본은 그레이스케일 + Otsu 이진화, 설정으로 단계 구성) 후
+      OCR 백엔드로 텍스트 추출
+      (기본은 pytesseract, 설정에 따라 상주 tesserocr 작업 프로세스)
     - 실서비스에서는 정규식을 통해 캐릭터명/직업/명성을 파싱하도록 확장 가능
+    - 최근 호출별 소요 시간은 timings에 남는다.
     """
 
-    def __init__(self, language: str = "kor+eng") -> None:
+    def __init__(
+        self,
+        language: str = "kor+eng",
+        panel_detector: PanelDetector | None = None,
+        backend: OcrBackend | None = None,
+        row_mode: bool = False,
+        result_cache: TTLCache[list[CharacterInfo]] | None = None,
+        preprocessor: PreprocessPipeline | None = None,
+        name_index: NameIndex | None = None,
+        retry_confidence: float = 0.0,
+        retry_preprocessor: PreprocessPipeline | None = None,
+    ) -> None:
         self.language = language
+        # 있으면 공대원 목록 패널만 잘라서 Tesseract에 넘긴다.
+        self.panel_detector = panel_detector
+        self.backend = backend or PytesseractBackend(language)
+        # 켜면 패널을 행으로 나눠 한 줄씩 병렬 OCR한다.
+        self.row_mode = row_mode
+        # 이미지/행 픽셀 해시 → 인식 결과. 같은 화면을 다시 캡쳐하면 OCR을 건너뛴다.
+        self.result_cache = result_cache
+        self.preprocessor = preprocessor or PreprocessPipeline()
+        # 있으면 OCR로 읽은 이름을 이전에 조회에 성공한 가장 가까운 이름으로 고친다.
+        self.name_index = name_index
+        # 행 모드에서 신뢰도가 이보다 낮은 행만 더 강한 전처리로 다시 인식한다(0이면 끔).
+        self.retry_confidence = retry_confidence
+        self.retry_preprocessor = retry_preprocessor
+        self.timings: deque[OcrOutput] = deque(maxlen=64)
+
+    def extract_text(self, image: ImageLike) -> str:
+        output = self.backend.recognize(self.preprocess(image))
+        self._record(output)
+        return output.text
 
-    def extract_text(self, image: Image.Image) -> str:
-        gray = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2GRAY)
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_OTSU | cv2.THRESH_BINARY)
-        return pytesseract.image_to_string(thresh, lang=self.language)
+    def extract_texts(
+        self, images: list[ImageLike], *, psm: int | None = None
+    ) -> list[str]:
+        """여러 조각을 백엔드에서 병렬로 인식한다(입력 순서 유지)."""
+
+        outputs = self.backend.recognize_many(
+            [self.preprocess(image) for image in images], psm=psm
+        )
+        for output in outputs:
+            self._record(output)
+        return [output.text for output in outputs]
+
+    def preprocess(self, image: ImageLike) -> np.ndarray:
+        # NumPy 버퍼는 복사 없이 그대로 쓴다(PIL 이미지만 한 번 변환).
+        return self.preprocessor(np.asarray(image))
+
+    def warm_up(self) -> None:
+        self.backend.warm_up()
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def _record(self, output: OcrOutput) -> None:
+        self.timings.append(output)
+        logger.debug("OCR backend=%s elapsed=%.3fs", output.backend, output.elapsed)
 
     def parse_characters(self, text: str) -> list[CharacterInfo]:
+        characters = self._parse_lines(text)
+        if self.name_index is not None:
+            for info in characters:
+                self._snap_name(info)
+        return characters
+
+    def _parse_lines(self, text: str) -> list[CharacterInfo]:
         lines = [line.strip() for line in text.splitlines() if line.strip()]
+        return [info for info in map(self._parse_line, lines) if info]
+
+    def _snap_name(self, info: CharacterInfo) -> NameMatch | None:
+        """이름을 가장 가까운 알려진 이름으로 고치고, 고친 근거(일치 정보)를 돌려준다."""
+
+        found = self.name_index.match(info.name)
+        if found is None or found.confidence < self.name_index.min_confidence:
+            return None
+        if found.name != info.name:
+            logger.info("Snapped OCR name %r to known name %r.", info.name, found.name)
+            info.name = found.name
+        return found
+
+    def extract_characters_from_image(
+        self,
+        image: ImageLike,
+        *,
+        on_character: CharacterCallback | None = None,
+    ) -> list[CharacterInfo]:
+        return self.read_panel(image, on_character=on_character).characters
+
+    def read_panel(
+        self,
+        image: ImageLike,
+        *,
+        on_character: CharacterCallback | None = None,
+    ) -> PanelReading:
+        """캡쳐 이미지(PIL 또는 RGB NumPy 배열)에서 공대원 목록을 읽는다.
+
+        - 배열은 복사하지 않고 패널 영역도 슬라이스(뷰)로만 잘라 넘긴다.
+        - 행 모드에서는 각 CharacterInfo에 신뢰도(0~1)와 캡쳐 이미지 기준 bbox가 채워진다.
+        - on_character를 주면 전체 목록을 기다리지 않고 이름이 확정되는 대로 한 명씩
+          호출한다(OCR을 실행하는 스레드에서 호출, bbox는 아직 확정 전일 수 있다).
+          재인식으로 이름이 바뀌거나 빠질 수 있으므로 최종 목록은 반환값을 기준으로 한다.
+        - panel_box는 이 이미지에서 찾은 위치다. 다른 스레드가 같은 탐지기로 다음 캡쳐를
+          읽어 panel_detector.last_box가 바뀌어도 영향을 받지 않는다.
+        """
+
+        array = np.asarray(image)
+        offset = (0, 0)
+        box = None
+        if self.panel_detector is not None:
+            box = self.panel_detector.locate(array)
+            array = crop_image(array, box)
+            if box is not None:
+                offset = (box[0], box[1])
+
+        characters = self._extract_from_crop(array, on_character)
+        for info in characters:
+            if info.bbox is not None:
+                left, top, width, height = info.bbox
+                info.bbox = (left + offset[0], top + offset[1], width, height)
+        return PanelReading(characters, box)
+
+    def _extract_from_crop(
+        self, image: np.ndarray, on_character: CharacterCallback | None = None
+    ) -> list[CharacterInfo]:
+        image_key = None
+        if self.result_cache is not None:
+            image_key = ("image", pixel_key(image))
+            cached = self.result_cache.get(image_key)
+            if cached is not None:
+                self._log_cache("image hit")
+                characters = _copy_characters(cached)
+                _emit(characters, on_character)
+                return characters
+
+        characters = None
+        if self.row_mode:
+            characters = self._extract_characters_by_row(image, on_character)
+        if characters is None:
+            characters = self.parse_characters(self.extract_text(image))
+            _emit(characters, on_character)
+
+        if self.result_cache is not None:
+            self.result_cache.set(image_key, _copy_characters(characters))
+            self._log_cache("image miss")
+        return characters
+
+    def _extract_characters_by_row(
+        self, image: np.ndarray, on_character: CharacterCallback | None = None
+    ) -> list[CharacterInfo] | None:
+        """행 단위로 잘라 한 줄 모드(--psm 7)로 병렬 인식한다. 행을 못 찾으면 None.
+
+        - 결과 캐시가 있으면 이전에 본 행은 그대로 재사용하고 바뀐 행만 OCR한다.
+          키는 그 행의 원본 픽셀이라, 다른 행이 바뀌어 전역 이진화 임계값이 달라져도
+          그대로인 행은 재사용된다(감시 모드에서 새로 들어온 공대원만 OCR하는 근거).
+        - 신뢰도가 retry_confidence 미만인 행만 retry_preprocessor로 다시 인식해
+          더 나은 결과를 쓴다.
+        """
+
+        binary = self.preprocess(image)
+        # 전처리의 crop/upscale을 되돌려 행/bbox를 캡쳐 이미지 좌표로 옮기는 데 쓴다.
+        geometry = self.preprocessor.geometry(image.shape)
+        rows = segment_rows(binary)
+        if not rows:
+            return None
+        strips = [binary[top:bottom] for top, bottom in rows]
+        per_row: list[list[CharacterInfo] | None] = [None] * len(strips)
+        keys: list[tuple[str, bytes] | None] = [None] * len(strips)
+        if self.result_cache is not None:
+            for index, row in enumerate(rows):
+                source = image[_source_region(geometry, binary.shape, row)]
+                keys[index] = ("row", pixel_key(source))
+                cached = self.result_cache.get(keys[index])
+                if cached is not None:
+                    per_row[index] = _copy_characters(cached)
+                    _emit(per_row[index], on_character)
+
+        pending = [index for index, found in enumerate(per_row) if found is None]
+        if pending:
+            step = len(pending)
+            if on_character is not None:
+                # 앞쪽 행의 결과를 먼저 넘길 수 있도록 작업자 수만큼씩 나눠 인식한다.
+                step = max(1, self.backend.workers)
+            for start in range(0, len(pending), step):
+                chunk = pending[start : start + step]
+                outputs = self.backend.recognize_many(
+                    [strips[index] for index in chunk],
+                    psm=SINGLE_LINE_PSM,
+                    with_words=True,
+                )
+                for index, output in zip(chunk, outputs, strict=True):
+                    self._record(output)
+                    per_row[index] = self._row_characters(output, strips[index].shape)
+                    if not self._needs_retry(per_row[index]):
+                        _emit(per_row[index], on_character)
+            retried = self._retry_low_confidence_rows(
+                image, binary.shape, geometry, rows, pending, per_row
+            )
+            for index in retried:
+                _emit(per_row[index], on_character)
+            for index in pending:
+                if keys[index] is not None:
+                    self.result_cache.set(keys[index], _copy_characters(per_row[index]))
+        logger.debug("OCR rows=%s reused=%s", len(rows), len(rows) - len(pending))
+
+        # 행 기준 bbox를 전처리 전 이미지 좌표로 옮긴다(crop 원점, upscale 배수 보정).
         characters: list[CharacterInfo] = []
-        for line in lines:
-            info = self._parse_line(line)
-            if info:
+        for (top, _), found in zip(rows, per_row, strict=True):
+            for info in found:
+                if info.bbox is not None:
+                    left, row_top, width, height = info.bbox
+                    info.bbox = (
+                        round(geometry.offset_x + left * geometry.scale_x),
+                        round(geometry.offset_y + (row_top + top) * geometry.scale_y),
+                        round(width * geometry.scale_x),
+                        round(height * geometry.scale_y),
+                    )
                 characters.append(info)
         return characters
 
-    def extract_characters_from_image(self, image: Image.Image) -> list[CharacterInfo]:
-        text = self.extract_text(image)
-        return self.parse_characters(text)
+    def _row_characters(
+        self, output: OcrOutput, strip_shape: tuple[int, ...]
+    ) -> list[CharacterInfo]:
+        """한 행의 OCR 결과에 신뢰도와 행 기준 bbox를 붙인다."""
+
+        height, width = strip_shape[:2]
+        if output.words:
+            left = min(word.left for word in output.words)
+            right = max(word.left + word.width for word in output.words)
+        else:
+            left, right = 0, width
+        characters = self._parse_lines(output.text)
+        for info in characters:
+            info.confidence = output.confidence
+            if self.name_index is not None:
+                read = info.name
+                found = self._snap_name(info)
+                if found is not None and found.name == read:
+                    # 조회에 성공했던 이름과 그대로 일치하면 잘못 읽었을 가능성이 없다.
+                    info.confidence = 1.0
+                elif found is not None:
+                    # 비슷한 이름으로 고친 경우는 고친 정도만큼 덜 믿는다.
+                    info.confidence = min(
+                        found.confidence,
+                        1.0 if output.confidence is None else output.confidence,
+                    )
+            info.bbox = (left, 0, right - left, height)
+        return characters
+
+    def _retry_low_confidence_rows(
+        self,
+        image: np.ndarray,
+        binary_shape: tuple[int, ...],
+        geometry: Geometry,
+        rows: list[tuple[int, int]],
+        pending: list[int],
+        per_row: list[list[CharacterInfo] | None],
+    ) -> list[int]:
+        """신뢰도가 낮은 행을 다시 인식하고, 다시 인식한 행 번호를 돌려준다."""
+
+        retry = [index for index in pending if self._needs_retry(per_row[index])]
+        if not retry:
+            return []
+
+        # 첫 인식이 본 것과 같은 영역(전처리 crop 안의 해당 행)을 원본에서 다시 잘라낸다.
+        strips = [
+            self.retry_preprocessor(
+                image[_source_region(geometry, binary_shape, rows[index])]
+            )
+            for index in retry
+        ]
+        outputs = self.backend.recognize_many(
+            strips, psm=SINGLE_LINE_PSM, with_words=True
+        )
+        improved = 0
+        for index, strip, output in zip(retry, strips, outputs, strict=True):
+            self._record(output)
+            candidate = self._row_characters(output, strip.shape)
+            if _row_confidence(candidate) > _row_confidence(per_row[index]):
+                # 위치는 첫 번째 인식에서 얻은 값이 원래 좌표계에 맞으므로 그대로 둔다.
+                old_bbox = per_row[index][0].bbox if per_row[index] else None
+                for info in candidate:
+                    info.bbox = old_bbox
+                per_row[index] = candidate
+                improved += 1
+        logger.info(
+            "Re-OCRed %s low-confidence rows; %s improved.", len(retry), improved
+        )
+        return retry
+
+    def _needs_retry(self, characters: list[CharacterInfo] | None) -> bool:
+        return (
+            self.retry_preprocessor is not None
+            and self.retry_confidence > 0
+            and _row_confidence(characters) < self.retry_confidence
+        )
+
+    def _log_cache(self, event: str) -> None:
+        logger.info(
+            "OCR cache %s (hits=%s misses=%s)",
+            event,
+            self.result_cache.hits,
+            self.result_cache.misses,
+        )
 
     def save_screenshot(
         self, image: Image.Image, directory: Path | None = None
@@ -87,3 +398,79 @@ class OcrEngine:
                 tokens.pop(i)
                 break
         return fame
+
+
+def _source_region(
+    geometry: Geometry, binary_shape: tuple[int, ...], row: tuple[int, int]
+) -> tuple[slice, slice]:
+    """전처리 결과의 한 행이 원본 이미지에서 차지하는 영역."""
+
+    top, bottom = row
+    return (
+        slice(
+            round(geometry.offset_y + top * geometry.scale_y),
+            round(geometry.offset_y + bottom * geometry.scale_y),
+        ),
+        slice(
+            round(geometry.offset_x),
+            round(geometry.offset_x + binary_shape[1] * geometry.scale_x),
+        ),
+    )
+
+
+def _row_confidence(characters: list[CharacterInfo] | None) -> float:
+    if not characters:
+        return 0.0
+    return min(
+        info.confidence if info.confidence is not None else 1.0 for info in characters
+    )
+
+
+def _emit(
+    characters: list[CharacterInfo], on_character: CharacterCallback | None
+) -> None:
+    if on_character is not None:
+        for info in characters:
+            on_character(info)
+
+
+def _copy_characters(characters: list[CharacterInfo]) -> list[CharacterInfo]:
+    return [replace(info) for info in characters]
+
+
+def segment_rows(
+    binary: np.ndarray,
+    *,
+    min_height: int = 6,
+    max_gap: int = 2,
+    padding: int = 3,
+) -> list[tuple[int, int]]:
+    """이진화된 이미지의 가로 투영으로 글자 행의 (top, bottom) 구간을 찾는다.
+
+    글자색과 배경색이 게임 화면마다 다르므로 더 적은 쪽 픽셀을 글자로 본다.
+    max_gap 이하의 빈 줄은 같은 행으로 이어 붙이고, min_height보다 낮은 행은 잡음으로 버린다.
+    """
+
+    if binary.size == 0:
+        return []
+    ink = binary > 0
+    if np.count_nonzero(ink) * 2 > ink.size:
+        ink = ~ink
+    profile = ink.sum(axis=1)
+    # 밑줄/잡음 점 몇 개에 반응하지 않도록 가장 진한 행의 일부 이상만 글자로 친다.
+    threshold = max(1, int(profile.max() * 0.05))
+    filled = profile >= threshold
+
+    runs: list[list[int]] = []
+    for y in np.flatnonzero(filled):
+        if runs and y - runs[-1][1] <= max_gap + 1:
+            runs[-1][1] = int(y)
+        else:
+            runs.append([int(y), int(y)])
+
+    height = binary.shape[0]
+    return [
+        (max(0, top - padding), min(height, bottom + 1 + padding))
+        for top, bottom in runs
+        if bottom - top + 1 >= min_height
+    ]
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import numpy as np
+import pytesseract
+
+
+@dataclass
+class OcrWord:
+    text: str
+    # Tesseract 단어 신뢰도(0~100)
+    confidence: float
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+@dataclass
+class OcrOutput:
+    text: str
+    # 호출 시작부터 이 결과가 준비될 때까지 호출 측에서 잰 시간(프로세스 간 전달 포함)
+    elapsed: float
+    backend: str
+    # with_words=True로 호출했을 때만 채워진다.
+    words: list[OcrWord] = field(default_factory=list)
+
+    @property
+    def confidence(self) -> float | None:
+        """단어 신뢰도 평균을 0~1로 돌려준다. 단어 정보가 없으면 None."""
+
+        if not self.words:
+            return None
+        return sum(word.confidence for word in self.words) / len(self.words) / 100
+
+
+class OcrBackend(Protocol):
+    name: str
+    # recognize_many가 동시에 처리하는 조각 수
+    workers: int
+
+    def recognize(
+        self, image: np.ndarray, *, psm: int | None = None, with_words: bool = False
+    ) -> OcrOutput: ...
+
+    def recognize_many(
+        self,
+        images: Sequence[np.ndarray],
+        *,
+        psm: int | None = None,
+        with_words: bool = False,
+    ) -> list[OcrOutput]: ...
+
+    def warm_up(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class PytesseractBackend:
+    """기존 pytesseract 경로. 호출마다 tesseract 프로세스를 새로 띄운다.
+
+    recognize_many는 스레드로 여러 프로세스를 동시에 띄워 병렬 처리한다.
+    """
+
+    name = "pytesseract"
+
+    def __init__(self, language: str, *, workers: int = 2) -> None:
+        self.language = language
+        self.workers = max(1, workers)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def recognize(
+        self, image: np.ndarray, *, psm: int | None = None, with_words: bool = False
+    ) -> OcrOutput:
+        started = time.perf_counter()
+        config = f"--psm {psm}" if psm is not None else ""
+        if not with_words:
+            text = pytesseract.image_to_string(image, lang=self.language, config=config)
+            return OcrOutput(text, time.perf_counter() - started, self.name)
+        data = pytesseract.image_to_data(
+            image,
+            lang=self.language,
+            config=config,
+            output_type=pytesseract.Output.DICT,
+        )
+        words = _words_from_data(data)
+        text = " ".join(word.text for word in words)
+        return OcrOutput(text, time.perf_counter() - started, self.name, words)
+
+    def recognize_many(
+        self,
+        images: Sequence[np.ndarray],
+        *,
+        psm: int | None = None,
+        with_words: bool = False,
+    ) -> list[OcrOutput]:
+        def run(image: np.ndarray) -> OcrOutput:
+            return self.recognize(image, psm=psm, with_words=with_words)
+
+        if len(images) <= 1:
+            return [run(image) for image in images]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="bory-ocr"
+            )
+        return list(self._executor.map(run, images))
+
+    def warm_up(self) -> None:
+        """매번 새 프로세스를 띄우므로 미리 준비할 것이 없다."""
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class TesserocrPoolBackend:
+    """언어 데이터를 올려 둔 tesserocr 작업 프로세스를 계속 재사용하는 백엔드.
+
+    - 프로세스마다 PyTessBaseAPI를 한 번만 만들고, 이미지는 임시 파일 없이 원시 버퍼로 넘긴다.
+    - recognize_many는 여러 조각을 작업 프로세스들에 나눠 동시에 인식한다.
+    - tesserocr는 선택 의존성이며 없으면 생성 시 RuntimeError가 발생한다.
+    """
+
+    name = "tesserocr"
+
+    def __init__(
+        self,
+        language: str,
+        *,
+        workers: int = 2,
+        executor_factory: type[Executor] = ProcessPoolExecutor,
+    ) -> None:
+        try:
+            import tesserocr  # noqa: F401
+        except ImportError as exc:
+            raise RuntimeError(
+                "ocr_backend=tesserocr를 쓰려면 'pip install tesserocr'가 필요합니다."
+            ) from exc
+        self.language = language
+        self.workers = max(1, workers)
+        self._executor = executor_factory(
+            max_workers=self.workers,
+            initializer=_init_tesserocr_worker,
+            initargs=(language,),
+        )
+
+    def warm_up(self) -> None:
+        """작업 프로세스를 미리 띄워 첫 캡쳐에서 언어 데이터 로딩을 기다리지 않게 한다."""
+
+        blank = np.full((8, 8), 255, np.uint8)
+        self.recognize_many([blank] * self.workers)
+
+    def recognize(
+        self, image: np.ndarray, *, psm: int | None = None, with_words: bool = False
+    ) -> OcrOutput:
+        return self.recognize_many([image], psm=psm, with_words=with_words)[0]
+
+    def recognize_many(
+        self,
+        images: Sequence[np.ndarray],
+        *,
+        psm: int | None = None,
+        with_words: bool = False,
+    ) -> list[OcrOutput]:
+        started = time.perf_counter()
+        futures = [
+            self._executor.submit(
+                _tesserocr_recognize, *_to_buffer(image), psm, with_words
+            )
+            for image in images
+        ]
+        outputs = []
+        for future in futures:
+            text, words = future.result()
+            outputs.append(
+                OcrOutput(
+                    text,
+                    time.perf_counter() - started,
+                    self.name,
+                    [OcrWord(*word) for word in words],
+                )
+            )
+        return outputs
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_ocr_backend(name: str, language: str, *, workers: int = 2) -> OcrBackend:
+    if name == "tesserocr":
+        return TesserocrPoolBackend(language, workers=workers)
+    return PytesseractBackend(language, workers=workers)
+
+
+def _to_buffer(image: np.ndarray) -> tuple[bytes, int, int, int]:
+    array = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = array.shape[:2]
+    channels = 1 if array.ndim == 2 else array.shape[2]
+    return array.tobytes(), width, height, channels
+
+
+# 작업 프로세스마다 하나씩 유지하는 Tesseract API 핸들
+_worker_api: Any = None
+
+
+def _init_tesserocr_worker(language: str) -> None:
+    global _worker_api
+    import tesserocr
+
+    _worker_api = tesserocr.PyTessBaseAPI(lang=language)
+
+
+def _tesserocr_recognize(
+    data: bytes,
+    width: int,
+    height: int,
+    channels: int,
+    psm: int | None,
+    with_words: bool = False,
+) -> tuple[str, list[tuple[str, float, int, int, int, int]]]:
+    import tesserocr
+
+    api = _worker_api
+    api.SetPageSegMode(tesserocr.PSM.AUTO if psm is None else psm)
+    api.SetImageBytes(data, width, height, channels, width * channels)
+    text = api.GetUTF8Text()
+    if not with_words:
+        return text, []
+    # 프로세스 간에는 단순한 튜플로 넘긴다.
+    words = []
+    level = tesserocr.RIL.WORD
+    for result in tesserocr.iterate_level(api.GetIterator(), level):
+        word = result.GetUTF8Text(level)
+        box = result.BoundingBox(level)
+        if not word or not word.strip() or box is None:
+            continue
+        x0, y0, x1, y1 = box
+        words.append((word.strip(), result.Confidence(level), x0, y0, x1 - x0, y1 - y0))
+    return text, words
+
+
+def _words_from_data(data: dict[str, list[Any]]) -> list[OcrWord]:
+    words = []
+    for index, text in enumerate(data["text"]):
+        confidence = float(data["conf"][index])
+        # 레이아웃 항목(블록/줄)은 conf가 -1이고 text가 비어 있다.
+        if confidence < 0 or not str(text).strip():
+            continue
+        words.append(
+            OcrWord(
+                text=str(text).strip(),
+                confidence=confidence,
+                left=int(data["left"][index]),
+                top=int(data["top"][index]),
+                width=int(data["width"][index]),
+                height=int(data["height"][index]),
+            )
+        )
+    return words
@@ -0,0 +1,149 @@
+"""OCR 전처리 파이프라인 벤치마크.
+
+픽스처 디렉터리의 ``이름.png``와 같은 이름의 ``이름.txt``(한 줄에 공대원 이름 하나)를 읽어
+전처리 단계별 소요 시간, OCR 시간, 이름 인식 정확도를 비교한다.
+
+    python -m src.core.ocr_bench --fixtures fixtures/ocr --spec gray,otsu \\
+        --spec upscale:2,adaptive:31:10,open:1
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from src.core.ocr import SINGLE_LINE_PSM, OcrEngine, segment_rows
+from src.core.ocr_backends import OcrBackend, create_ocr_backend
+from src.core.preprocess import PreprocessPipeline
+
+
+@dataclass
+class Fixture:
+    image_path: Path
+    expected_names: list[str]
+
+
+@dataclass
+class BenchmarkResult:
+    spec: str
+    images: int = 0
+    expected: int = 0
+    matched: int = 0
+    # 단계 이름 → 이미지 한 장당 평균 초
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    ocr_seconds: float = 0.0
+
+    @property
+    def accuracy(self) -> float:
+        return self.matched / self.expected if self.expected else 0.0
+
+
+def load_fixtures(directory: Path) -> list[Fixture]:
+    fixtures = []
+    for image_path in sorted(Path(directory).glob("*.png")):
+        expected_path = image_path.with_suffix(".txt")
+        if not expected_path.is_file():
+            continue
+        names = [
+            line.strip()
+            for line in expected_path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+        fixtures.append(Fixture(image_path, names))
+    return fixtures
+
+
+def run_benchmark(
+    specs: Sequence[str],
+    fixtures: Sequence[Fixture],
+    backend: OcrBackend,
+    *,
+    row_mode: bool = False,
+) -> list[BenchmarkResult]:
+    parser = OcrEngine(backend=backend)
+    images = [
+        (np.array(Image.open(fixture.image_path).convert("RGB")), fixture)
+        for fixture in fixtures
+    ]
+    results = []
+    for spec in specs:
+        pipeline = PreprocessPipeline(spec)
+        result = BenchmarkResult(spec=spec)
+        stage_totals: dict[str, float] = defaultdict(float)
+        for array, fixture in images:
+            binary, timings = pipeline.run_timed(array)
+            for timing in timings:
+                stage_totals[timing.stage] += timing.elapsed
+
+            started = time.perf_counter()
+            rows = segment_rows(binary) if row_mode else []
+            if rows:
+                outputs = backend.recognize_many(
+                    [binary[top:bottom] for top, bottom in rows], psm=SINGLE_LINE_PSM
+                )
+                text = "\n".join(output.text for output in outputs)
+            else:
+                text = backend.recognize(binary).text
+            result.ocr_seconds += time.perf_counter() - started
+
+            found = Counter(info.name for info in parser.parse_characters(text))
+            expected = Counter(fixture.expected_names)
+            result.images += 1
+            result.expected += sum(expected.values())
+            result.matched += sum((found & expected).values())
+
+        count = max(result.images, 1)
+        result.stage_seconds = {
+            stage: total / count for stage, total in stage_totals.items()
+        }
+        result.ocr_seconds /= count
+        results.append(result)
+    return results
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    lines = []
+    for result in results:
+        lines.append(
+            f"[{result.spec}] images={result.images} "
+            f"accuracy={result.accuracy:.1%} ({result.matched}/{result.expected}) "
+            f"ocr={result.ocr_seconds * 1000:.1f}ms"
+        )
+        for stage, seconds in result.stage_seconds.items():
+            lines.append(f"  {stage:<28} {seconds * 1000:8.2f}ms")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="OCR 전처리 파이프라인 벤치마크")
+    parser.add_argument("--fixtures", type=Path, required=True)
+    parser.add_argument("--spec", action="append", dest="specs")
+    parser.add_argument("--backend", default="pytesseract")
+    parser.add_argument("--language", default="kor+eng")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--row-mode", action="store_true")
+    args = parser.parse_args(argv)
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        parser.error(f"no *.png + *.txt fixtures found in {args.fixtures}")
+    backend = create_ocr_backend(args.backend, args.language, workers=args.workers)
+    try:
+        results = run_benchmark(
+            args.specs or ["gray,otsu"], fixtures, backend, row_mode=args.row_mode
+        )
+    finally:
+        backend.close()
+    print(format_report(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
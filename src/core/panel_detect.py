@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import threading
+from typing import TypeVar
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# (left, top, width, height) 픽셀 상자
+Box = tuple[int, int, int, int]
+ImageT = TypeVar("ImageT", Image.Image, np.ndarray)
+
+
+class PanelDetector:
+    """스크린샷에서 공대원 목록 패널(글자가 몰려 있는 영역)을 찾아 OCR 입력을 줄인다.
+
+    - 축소본에서 글자 경계(모폴로지 그래디언트)를 이진화한 뒤 넓은 커널로 묶어
+      가장 큰 글자 덩어리를 패널로 본다.
+    - 찾은 위치를 기억해 두었다가 다음 캡쳐에서는 그 자리에 글자가 그대로 있는지만
+      확인하고, 달라졌을 때만 전체 화면을 다시 탐지한다.
+    - 패널을 못 찾으면 None을 돌려주며, 호출 측은 원본 전체를 OCR하면 된다.
+    """
+
+    def __init__(
+        self,
+        *,
+        downscale_width: int = 960,
+        min_area_ratio: float = 0.005,
+        padding: int = 8,
+        density_tolerance: float = 2.0,
+        brightness_tolerance: float = 25.0,
+    ) -> None:
+        self.downscale_width = downscale_width
+        self.min_area_ratio = min_area_ratio
+        self.padding = padding
+        self.density_tolerance = density_tolerance
+        self.brightness_tolerance = brightness_tolerance
+        self.last_box: Box | None = None
+        self._last_density = 0.0
+        self._last_brightness = 0.0
+        self._last_size: tuple[int, int] | None = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # 수동 캡쳐와 감시 모드가 서로 다른 스레드에서 같은 탐지기를 쓴다.
+        self._lock = threading.Lock()
+
+    def locate(self, image: Image.Image | np.ndarray) -> Box | None:
+        """캐시된 위치를 먼저 확인하고, 맞지 않으면 새로 탐지한다."""
+
+        gray = _to_gray(image)
+        with self._lock:
+            return self._locate(gray)
+
+    def _locate(self, gray: np.ndarray) -> Box | None:
+        size = (gray.shape[1], gray.shape[0])
+        if self.last_box is not None and self._last_size == size:
+            # 이름은 매번 바뀔 수 있으니 글자 밀도와 배경 밝기가 비슷한지만 본다.
+            crop = _crop(gray, self.last_box)
+            density = _text_density(crop)
+            low = self._last_density / self.density_tolerance
+            high = self._last_density * self.density_tolerance
+            brightness = float(crop.mean())
+            if (
+                low <= density <= high
+                and abs(brightness - self._last_brightness) <= self.brightness_tolerance
+            ):
+                self.cache_hits += 1
+                return self.last_box
+        self.cache_misses += 1
+
+        box = self.detect(gray)
+        self.last_box = box
+        self._last_size = size if box is not None else None
+        if box is not None:
+            crop = _crop(gray, box)
+            self._last_density = _text_density(crop)
+            self._last_brightness = float(crop.mean())
+        return box
+
+    def detect(self, image: Image.Image | np.ndarray) -> Box | None:
+        gray = _to_gray(image)
+        height, width = gray.shape
+        scale = min(1.0, self.downscale_width / width)
+        small = gray
+        if scale < 1.0:
+            small = cv2.resize(
+                gray,
+                (round(width * scale), round(height * scale)),
+                interpolation=cv2.INTER_AREA,
+            )
+
+        mask = _text_mask(small)
+        # 글자 → 줄 → 패널 순으로 이어지도록 가로로 길고 세로로도 조금 넓은 커널로 닫는다.
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 9))
+        blocks = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        contours, _ = cv2.findContours(
+            blocks, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        )
+        min_area = self.min_area_ratio * small.shape[0] * small.shape[1]
+        candidates = [
+            cv2.boundingRect(contour)
+            for contour in contours
+            if cv2.contourArea(contour) >= min_area
+        ]
+        if not candidates:
+            return None
+
+        x, y, w, h = max(candidates, key=lambda rect: rect[2] * rect[3])
+        pad = self.padding
+        left = max(0, round(x / scale) - pad)
+        top = max(0, round(y / scale) - pad)
+        right = min(width, round((x + w) / scale) + pad)
+        bottom = min(height, round((y + h) / scale) + pad)
+        if (right - left) * (bottom - top) >= 0.95 * width * height:
+            # 화면 대부분이 글자로 잡히면 자를 이유가 없다.
+            return None
+        return left, top, right - left, bottom - top
+
+    def reset(self) -> None:
+        self.last_box = None
+        self._last_size = None
+
+
+def crop_image(image: ImageT, box: Box | None) -> ImageT:
+    """box 영역을 잘라낸다. NumPy 배열은 복사 없이 뷰를 돌려준다."""
+
+    if box is None:
+        return image
+    left, top, width, height = box
+    if isinstance(image, np.ndarray):
+        return image[top : top + height, left : left + width]
+    return image.crop((left, top, left + width, top + height))
+
+
+def _to_gray(image: Image.Image | np.ndarray) -> np.ndarray:
+    array = np.asarray(image)
+    if array.ndim == 2:
+        return array
+    if array.shape[2] == 4:
+        return cv2.cvtColor(array, cv2.COLOR_RGBA2GRAY)
+    return cv2.cvtColor(array, cv2.COLOR_RGB2GRAY)
+
+
+def _text_mask(gray: np.ndarray) -> np.ndarray:
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, kernel)
+    _, mask = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    return mask
+
+
+def _crop(gray: np.ndarray, box: Box) -> np.ndarray:
+    left, top, width, height = box
+    return gray[top : top + height, left : left + width]
+
+
+def _text_density(gray: np.ndarray) -> float:
+    if gray.size == 0:
+        return 0.0
+    return float(np.count_nonzero(_text_mask(gray))) / gray.size
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.jobs import CancelToken
+from src.core.models import CharacterDamage, CharacterInfo
+from src.core.ocr import OcrEngine, PanelReading
+from src.core.prefetch import DamageFetcher
+from src.core.scraper import character_url
+
+Emit = Callable[[Any], None]
+
+# 큐 대기 중 취소 여부를 확인하는 간격(초)
+_POLL_INTERVAL = 0.05
+_END = object()
+
+
+@dataclass
+class Stage:
+    """파이프라인의 한 단계.
+
+    - fn(value)의 반환값이 다음 단계로 넘어간다.
+    - fan_out=True면 fn(value, emit)으로 호출되고, emit()한 값마다 다음 단계로 바로 흘려보낸다
+      (한 번도 emit하지 않으면 거르기, 여러 번이면 펼치기).
+    - workers는 이 단계를 동시에 실행할 스레드 수, queue_size는 이 단계 입력 큐의 크기다.
+      큐가 차면 앞 단계가 기다리므로(백프레셔) 느린 단계 앞에 결과가 무한정 쌓이지 않는다.
+    """
+
+    name: str
+    fn: Callable[..., Any]
+    workers: int = 1
+    queue_size: int = 8
+    fan_out: bool = False
+
+
+@dataclass
+class PipelineResult:
+    # 입력 순번, 그리고 펼친 단계마다 그 안에서의 순번
+    key: tuple[int, ...]
+    value: Any = None
+    error: BaseException | None = None
+    # 실패한 단계 이름(성공이면 None)
+    stage: str | None = None
+    # 이 결과를 만든(또는 실패한) 단계에 들어간 값
+    source: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Envelope:
+    key: tuple[int, ...]
+    value: Any = None
+    error: BaseException | None = None
+    stage: str | None = None
+    source: Any = None
+
+
+@dataclass
+class _StageState:
+    remaining: int
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class Pipeline:
+    """단계들을 크기 제한 큐로 이어 항목 단위로 흘려보내는 스트리밍 파이프라인.
+
+    - 각 단계는 자기 스레드들에서 돌고, 앞 단계가 항목 하나를 끝내는 즉시 다음 단계가 시작한다.
+    - 한 항목이 실패해도 다른 항목은 계속 진행된다. 실패한 항목은 이후 단계를 건너뛰고
+      error/stage/source가 채워진 결과로 나온다.
+    - cancel 토큰이 취소되면 모든 단계가 다음 큐 대기에서 멈추고 JobCancelled가 발생한다.
+      이미 실행 중인 단계 함수 자체는 끝날 때까지 기다리지 않는다.
+    """
+
+    def __init__(self, stages: Sequence[Stage]) -> None:
+        if not stages:
+            raise ValueError("pipeline needs at least one stage")
+        for stage in stages:
+            if stage.workers < 1 or stage.queue_size < 1:
+                raise ValueError(f"stage '{stage.name}' needs workers/queue_size >= 1")
+        self.stages = list(stages)
+
+    def run(
+        self,
+        items: Iterable[Any],
+        *,
+        on_item: Callable[[PipelineResult], None] | None = None,
+        cancel: CancelToken | None = None,
+    ) -> list[PipelineResult]:
+        """끝까지 실행하고 결과를 입력 순서(key)대로 돌려준다.
+
+        on_item은 결과가 하나 나올 때마다 완료 순서대로 호출된다(run을 부른 스레드에서).
+        """
+
+        results = []
+        for result in self.stream(items, cancel=cancel):
+            if on_item is not None:
+                on_item(result)
+            results.append(result)
+        results.sort(key=lambda result: result.key)
+        return results
+
+    def stream(
+        self, items: Iterable[Any], *, cancel: CancelToken | None = None
+    ) -> Iterator[PipelineResult]:
+        """결과를 완료 순서대로 내보낸다. 소비를 멈추면 파이프라인도 멈춘다."""
+
+        token = cancel or CancelToken()
+        # 호출 측이 중간에 순회를 그만두면 내부 스레드를 정리하기 위한 토큰
+        closed = CancelToken()
+
+        def stopped() -> bool:
+            return token.cancelled or closed.cancelled
+
+        queues: list[queue.Queue] = [
+            queue.Queue(maxsize=stage.queue_size) for stage in self.stages
+        ]
+        queues.append(queue.Queue(maxsize=self.stages[-1].queue_size))
+
+        threads = [
+            threading.Thread(
+                target=self._feed,
+                args=(items, queues[0], self.stages[0].workers, stopped),
+                name="pipeline-feed",
+                daemon=True,
+            )
+        ]
+        for position, stage in enumerate(self.stages):
+            following = self.stages[position + 1 :]
+            state = _StageState(stage.workers)
+            for worker in range(stage.workers):
+                threads.append(
+                    threading.Thread(
+                        target=self._work,
+                        args=(
+                            stage,
+                            queues[position],
+                            queues[position + 1],
+                            state,
+                            following[0].workers if following else 1,
+                            stopped,
+                        ),
+                        name=f"pipeline-{stage.name}-{worker}",
+                        daemon=True,
+                    )
+                )
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                envelope = _get(queues[-1], stopped)
+                if envelope is None or envelope is _END:
+                    break
+                yield PipelineResult(
+                    envelope.key,
+                    envelope.value,
+                    envelope.error,
+                    envelope.stage,
+                    envelope.source,
+                )
+        finally:
+            closed.cancel()
+        token.check()
+
+    def _feed(
+        self,
+        items: Iterable[Any],
+        outbox: queue.Queue,
+        ends: int,
+        stopped: Callable[[], bool],
+    ) -> None:
+        try:
+            for index, item in enumerate(items):
+                if not _put(outbox, _Envelope((index,), item), stopped):
+                    return
+        except Exception as exc:  # noqa: BLE001
+            failed = _Envelope((-1,), error=exc, stage="input")
+            if not _put(outbox, failed, stopped):
+                return
+        for _ in range(ends):
+            if not _put(outbox, _END, stopped):
+                return
+
+    def _work(
+        self,
+        stage: Stage,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        state: _StageState,
+        ends: int,
+        stopped: Callable[[], bool],
+    ) -> None:
+        while True:
+            envelope = _get(inbox, stopped)
+            if envelope is None:
+                return
+            if envelope is _END:
+                with state.lock:
+                    state.remaining -= 1
+                    last = state.remaining == 0
+                # 이 단계의 마지막 작업자만 다음 단계에 끝을 알린다.
+                if last:
+                    for _ in range(ends):
+                        _put(outbox, _END, stopped)
+                return
+            if envelope.error is not None:
+                if not _put(outbox, envelope, stopped):
+                    return
+                continue
+            if not self._process(stage, envelope, outbox, stopped):
+                return
+
+    def _process(
+        self,
+        stage: Stage,
+        envelope: _Envelope,
+        outbox: queue.Queue,
+        stopped: Callable[[], bool],
+    ) -> bool:
+        value = envelope.value
+        try:
+            if not stage.fan_out:
+                return _put(
+                    outbox,
+                    _Envelope(envelope.key, stage.fn(value), source=value),
+                    stopped,
+                )
+            emitted = 0
+
+            def emit(child: Any) -> None:
+                nonlocal emitted
+                key = (*envelope.key, emitted)
+                emitted += 1
+                _put(outbox, _Envelope(key, child, source=value), stopped)
+
+            stage.fn(value, emit)
+            return True
+        except Exception as exc:  # noqa: BLE001
+            failed = _Envelope(envelope.key, error=exc, stage=stage.name, source=value)
+            return _put(outbox, failed, stopped)
+
+
+def capture_stage(
+    grab: Callable[[], Any], *, keep: Callable[[Any], bool] | None = None
+) -> Stage:
+    """입력(트리거) 하나마다 화면을 캡쳐한다. keep이 False를 돌려준 프레임은 버린다."""
+
+    def run(_: Any, emit: Emit) -> None:
+        image = grab()
+        if keep is None or keep(image):
+            emit(image)
+
+    return Stage("capture", run, fan_out=True)
+
+
+def ocr_stage(
+    engine: OcrEngine,
+    *,
+    on_reading: Callable[[Any, PanelReading], None] | None = None,
+) -> Stage:
+    """캡쳐 이미지를 공대원(CharacterInfo)들로 펼친다. 행 모드에서는 읽는 대로 넘긴다.
+
+    흘려보내는 순서는 인식이 끝난 순서(캐시 적중 → 새로 읽은 행 → 재인식한 행)라 화면 순서와
+    다를 수 있다. 화면 순서의 최종 목록과 패널 위치가 필요하면 on_reading(image, reading)으로
+    받는다.
+    """
+
+    def run(image: Any, emit: Emit) -> None:
+        reading = engine.read_panel(image, on_character=emit)
+        if on_reading is not None:
+            on_reading(image, reading)
+
+    return Stage("ocr", run, fan_out=True)
+
+
+def fetch_stage(
+    scraper: DamageFetcher,
+    template: str,
+    *,
+    workers: int = 4,
+    force_refresh: bool = False,
+) -> Stage:
+    """공대원마다 총딜을 조회한다. 실패는 해당 공대원의 결과에만 담긴다."""
+
+    def run(info: CharacterInfo) -> CharacterDamage:
+        return scraper.fetch_character_damage(
+            character_url(template, info.name),
+            info.name,
+            info.job,
+            force_refresh=force_refresh,
+        )
+
+    return Stage("fetch", run, workers=workers, queue_size=max(8, workers * 2))
+
+
+def _put(target: queue.Queue, item: Any, stopped: Callable[[], bool]) -> bool:
+    while not stopped():
+        try:
+            target.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(source: queue.Queue, stopped: Callable[[], bool]) -> Any:
+    while not stopped():
+        try:
+            return source.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            continue
+    return None
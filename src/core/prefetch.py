@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Protocol
+
+from src.core.models import CharacterDamage, FetchResult
+
+logger = logging.getLogger(__name__)
+
+
+class DamageFetcher(Protocol):
+    def fetch_character_damage(
+        self,
+        url: str,
+        name: str,
+        job: str | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> CharacterDamage: ...
+
+
+class Prefetcher:
+    """OCR이 이름을 읽는 즉시 총딜 조회를 미리 시작해 두는 추측 조회기.
+
+    - request()는 URL마다 한 번만 조회를 예약한다(스레드 안전, OCR 작업 스레드에서 호출).
+    - take()는 예약된 조회를 넘겨받는다. 이미 실패로 끝난 조회는 넘기지 않아 다시 조회하게 한다.
+    - retain()은 최종 목록에 없는 URL의 조회를 취소한다. 아직 시작하지 않은 요청은
+      보내지 않고, 이미 보낸 요청은 결과만 버린다.
+    """
+
+    def __init__(self, scraper: DamageFetcher, *, max_workers: int = 4) -> None:
+        self.scraper = scraper
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="dundam-prefetch"
+        )
+        self._futures: dict[str, Future[FetchResult]] = {}
+        self._lock = threading.Lock()
+
+    def request(self, url: str, name: str, job: str | None = None) -> bool:
+        with self._lock:
+            if url in self._futures:
+                return False
+            self._futures[url] = self._executor.submit(self._fetch, url, name, job)
+        logger.debug("Prefetching %s.", name)
+        return True
+
+    def take(self, url: str) -> Future[FetchResult] | None:
+        with self._lock:
+            future = self._futures.pop(url, None)
+        if future is None or future.cancelled():
+            return None
+        if future.done() and not future.result().ok:
+            return None
+        return future
+
+    def retain(self, urls: Iterable[str]) -> int:
+        keep = set(urls)
+        with self._lock:
+            dropped = [url for url in self._futures if url not in keep]
+            futures = [self._futures.pop(url) for url in dropped]
+        cancelled = sum(future.cancel() for future in futures)
+        if dropped:
+            logger.info(
+                "Dropped %s prefetches (%s cancelled before sending).",
+                len(dropped),
+                cancelled,
+            )
+        return len(dropped)
+
+    def cancel_all(self) -> int:
+        return self.retain(())
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._futures)
+
+    def close(self) -> None:
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(self, url: str, name: str, job: str | None) -> FetchResult:
+        try:
+            damage = self.scraper.fetch_character_damage(url, name, job)
+        except Exception as exc:  # noqa: BLE001
+            return FetchResult(name=name, url=url, job=job, error=exc)
+        return FetchResult(name=name, url=url, job=job, damage=damage)
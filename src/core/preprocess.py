@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+DEFAULT_PREPROCESS_SPEC = "gray,otsu"
+
+Stage = Callable[[np.ndarray], np.ndarray]
+# (행, 열) → (잘라낸 원점 x, y, 확대 배수, 결과 행, 결과 열)
+GeometryStep = Callable[[int, int], tuple[int, int, int, int, int]]
+
+
+@dataclass
+class StageTiming:
+    stage: str
+    elapsed: float
+
+
+@dataclass(frozen=True)
+class Geometry:
+    """전처리 결과 좌표를 입력 좌표로 옮기는 변환: 입력 = offset + 결과 × scale."""
+
+    offset_x: float = 0.0
+    offset_y: float = 0.0
+    scale_x: float = 1.0
+    scale_y: float = 1.0
+
+
+class PreprocessPipeline:
+    """설정 문자열로 정의하는 OCR 전처리 파이프라인.
+
+    단계는 쉼표로 나열하고 인자는 콜론으로 붙인다. 예: ``crop:0:0:0.6:1,upscale:2,colorkey:#f0f0f0:40,open:1``
+
+    - ``crop:l:t:w:h``     입력 대비 비율로 잘라내기
+    - ``upscale:n``        정수 배 확대(작은 글자의 인식률 개선)
+    - ``gray``             그레이스케일
+    - ``otsu``             전역 Otsu 이진화(기본 동작)
+    - ``adaptive:b:c``     블록 b(홀수), 상수 c의 적응형 이진화(그라데이션/반투명 배경용)
+    - ``colorkey:#rrggbb:t`` 이름 글자색과 채널별 차이가 t 이하인 픽셀만 남긴 마스크
+    - ``open:n`` / ``close:n`` / ``dilate:n`` / ``erode:n``  n×n 커널 모폴로지 정리
+    - ``invert``           흑백 반전
+
+    행 단위 OCR(segment_rows)을 쓰려면 마지막 결과가 이진 이미지여야 한다.
+    """
+
+    def __init__(self, spec: str = DEFAULT_PREPROCESS_SPEC) -> None:
+        self.spec = spec
+        self.stages: list[tuple[str, Stage]] = [
+            (token, _build_stage(token))
+            for token in (part.strip() for part in spec.split(","))
+            if token
+        ]
+        if not self.stages:
+            raise ValueError("ocr_preprocess must define at least one stage")
+        self._geometry = [
+            step
+            for step in (_stage_geometry(token) for token, _ in self.stages)
+            if step is not None
+        ]
+
+    def __call__(self, image: np.ndarray) -> np.ndarray:
+        for _, stage in self.stages:
+            image = stage(image)
+        return image
+
+    def geometry(self, shape: tuple[int, ...]) -> Geometry:
+        """이 크기의 입력을 전처리했을 때 결과 좌표를 입력 좌표로 옮기는 변환(crop/upscale 반영)."""
+
+        rows, cols = shape[:2]
+        offset_x = offset_y = 0.0
+        scale = 1.0
+        for step in self._geometry:
+            x0, y0, factor, rows, cols = step(rows, cols)
+            offset_x += x0 * scale
+            offset_y += y0 * scale
+            scale /= factor
+        return Geometry(offset_x, offset_y, scale, scale)
+
+    def run_timed(self, image: np.ndarray) -> tuple[np.ndarray, list[StageTiming]]:
+        timings: list[StageTiming] = []
+        for name, stage in self.stages:
+            started = time.perf_counter()
+            image = stage(image)
+            timings.append(StageTiming(name, time.perf_counter() - started))
+        return image, timings
+
+
+def _build_stage(token: str) -> Stage:
+    name, *args = token.split(":")
+    name = name.lower()
+    try:
+        if name == "crop":
+            left, top, width, height = (float(arg) for arg in args)
+            return lambda image: _crop(image, left, top, width, height)
+        if name == "upscale":
+            factor = int(args[0]) if args else 2
+            if factor < 1:
+                raise ValueError
+            return lambda image: cv2.resize(
+                image, None, fx=factor, fy=factor, interpolation=cv2.INTER_CUBIC
+            )
+        if name == "gray":
+            _expect_no_args(args)
+            return _to_gray
+        if name == "otsu":
+            _expect_no_args(args)
+            return _otsu
+        if name == "adaptive":
+            block = int(args[0]) if args else 31
+            constant = float(args[1]) if len(args) > 1 else 10.0
+            if block < 3 or block % 2 == 0:
+                raise ValueError
+            return lambda image: cv2.adaptiveThreshold(
+                _to_gray(image),
+                255,
+                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                cv2.THRESH_BINARY,
+                block,
+                constant,
+            )
+        if name == "colorkey":
+            color = _parse_color(args[0])
+            tolerance = int(args[1]) if len(args) > 1 else 40
+            return lambda image: _color_key(image, color, tolerance)
+        if name in _MORPH_OPS:
+            size = int(args[0]) if args else 2
+            if size < 1:
+                raise ValueError
+            kernel = np.ones((size, size), np.uint8)
+            op = _MORPH_OPS[name]
+            return lambda image: cv2.morphologyEx(image, op, kernel)
+        if name == "invert":
+            _expect_no_args(args)
+            return cv2.bitwise_not
+    except (ValueError, IndexError) as exc:
+        raise ValueError(f"Invalid ocr_preprocess stage '{token}'") from exc
+    raise ValueError(f"Unknown ocr_preprocess stage '{token}'")
+
+
+def _stage_geometry(token: str) -> GeometryStep | None:
+    name, *args = token.split(":")
+    name = name.lower()
+    if name == "crop":
+        left, top, width, height = (float(arg) for arg in args)
+
+        def crop(rows: int, cols: int) -> tuple[int, int, int, int, int]:
+            y0, y1, x0, x1 = _crop_bounds(rows, cols, left, top, width, height)
+            return x0, y0, 1, y1 - y0, x1 - x0
+
+        return crop
+    if name == "upscale":
+        factor = int(args[0]) if args else 2
+        return lambda rows, cols: (0, 0, factor, rows * factor, cols * factor)
+    return None
+
+
+_MORPH_OPS = {
+    "open": cv2.MORPH_OPEN,
+    "close": cv2.MORPH_CLOSE,
+    "dilate": cv2.MORPH_DILATE,
+    "erode": cv2.MORPH_ERODE,
+}
+
+
+def _expect_no_args(args: list[str]) -> None:
+    if args:
+        raise ValueError
+
+
+def _to_gray(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 2:
+        return image
+    code = cv2.COLOR_RGBA2GRAY if image.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+    return cv2.cvtColor(image, code)
+
+
+def _otsu(image: np.ndarray) -> np.ndarray:
+    _, thresh = cv2.threshold(
+        _to_gray(image), 0, 255, cv2.THRESH_OTSU | cv2.THRESH_BINARY
+    )
+    return thresh
+
+
+def _crop(
+    image: np.ndarray, left: float, top: float, width: float, height: float
+) -> np.ndarray:
+    y0, y1, x0, x1 = _crop_bounds(*image.shape[:2], left, top, width, height)
+    return image[y0:y1, x0:x1]
+
+
+def _crop_bounds(
+    rows: int, cols: int, left: float, top: float, width: float, height: float
+) -> tuple[int, int, int, int]:
+    x0, y0 = round(left * cols), round(top * rows)
+    x1, y1 = round((left + width) * cols), round((top + height) * rows)
+    return max(0, y0), min(rows, y1), max(0, x0), min(cols, x1)
+
+
+def _parse_color(value: str) -> np.ndarray:
+    value = value.lstrip("#")
+    if len(value) != 6:
+        raise ValueError
+    return np.array([int(value[i : i + 2], 16) for i in (0, 2, 4)], np.int16)
+
+
+def _color_key(image: np.ndarray, color: np.ndarray, tolerance: int) -> np.ndarray:
+    if image.ndim == 2:
+        raise ValueError("colorkey stage needs a color image; put it before gray")
+    diff = np.abs(image[..., :3].astype(np.int16) - color)
+    mask = (diff <= tolerance).all(axis=2)
+    # Tesseract가 잘 읽도록 흰 배경에 검은 글자로 만든다.
+    return np.where(mask, 0, 255).astype(np.uint8)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from src.core.config import AppConfig
+
+
+class CircuitOpenError(RuntimeError):
+    """서버 장애로 회로가 열려 있어 요청을 보내지 않고 바로 실패할 때 발생한다."""
+
+
+@dataclass
+class RateLimiterState:
+    rate: float
+    tokens: float
+    blocked_for: float
+
+
+@dataclass
+class CircuitState:
+    state: str
+    consecutive_failures: int
+    retry_in: float
+
+
+class AdaptiveRateLimiter:
+    """429/5xx 응답에 맞춰 속도를 조절하는 스레드 안전 토큰 버킷.
+
+    - 스로틀 응답을 받으면 속도를 절반으로 줄이고(최소 min_rate), 성공할 때마다 조금씩 회복한다.
+    - Retry-After가 오면 그 시각까지 새 토큰을 내주지 않는다.
+    - reserve()는 기다려야 할 시간만 돌려주므로 동기/비동기 호출자 모두 쓸 수 있다.
+    """
+
+    def __init__(
+        self,
+        rate: float = 4.0,
+        burst: int = 4,
+        *,
+        min_rate: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = max(1, burst)
+        self._rate = rate
+        self._tokens = float(self.burst)
+        self._clock = clock
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 요청 전에 기다려야 할 초를 돌려준다."""
+
+        with self._lock:
+            now = self._refill()
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self, sleep: Callable[[float], None] = time.sleep) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = min(self.max_rate, self._rate + self.max_rate * 0.1)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = self._refill()
+            self._rate = max(self.min_rate, self._rate / 2)
+            if retry_after is not None and retry_after > 0:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def snapshot(self) -> RateLimiterState:
+        with self._lock:
+            now = self._refill()
+            return RateLimiterState(
+                rate=self._rate,
+                tokens=self._tokens,
+                blocked_for=max(0.0, self._blocked_until - now),
+            )
+
+    def _refill(self) -> float:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+        self._updated = now
+        return now
+
+
+class CircuitBreaker:
+    """연속 실패가 임계치를 넘으면 reset_timeout 동안 요청을 막는 회로 차단기.
+
+    closed → (연속 실패) → open → (시간 경과) → half_open(시험 요청 1건) → closed/open
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self._state == "closed":
+                return
+            retry_in = self._opened_at + self.reset_timeout - self._clock()
+            if self._state == "open" and retry_in <= 0:
+                self._state = "half_open"
+            if self._state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        raise CircuitOpenError(
+            "던담 서버가 응답하지 않아 요청을 잠시 중단했습니다"
+            f"(약 {max(retry_in, 0.0):.0f}초 후 재시도)."
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == "half_open" or self._failures >= self.failure_threshold:
+                self._state = "open"
+                self._opened_at = self._clock()
+
+    def record_cancelled(self) -> None:
+        """응답 없이 끝난 요청(취소 등). 시험 요청이었다면 다음 요청이 다시 시험하게 한다."""
+
+        with self._lock:
+            if self._state == "half_open":
+                self._trial_in_flight = False
+
+    def snapshot(self) -> CircuitState:
+        with self._lock:
+            retry_in = 0.0
+            if self._state == "open":
+                retry_in = max(
+                    0.0, self._opened_at + self.reset_timeout - self._clock()
+                )
+            return CircuitState(
+                state=self._state,
+                consecutive_failures=self._failures,
+                retry_in=retry_in,
+            )
+
+
+class RequestGuard:
+    """한 호스트로 나가는 요청에 속도 제한과 회로 차단을 함께 적용한다."""
+
+    def __init__(self, limiter: AdaptiveRateLimiter, breaker: CircuitBreaker) -> None:
+        self.limiter = limiter
+        self.breaker = breaker
+
+    def reserve(self) -> float:
+        """회로가 열려 있으면 CircuitOpenError, 아니면 기다릴 초를 돌려준다."""
+
+        self.breaker.before_request()
+        return self.limiter.reserve()
+
+    def wait(self, sleep: Callable[[float], None] = time.sleep) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            sleep(delay)
+
+    def record_response(self, status: int, retry_after: str | None = None) -> None:
+        if status == 429 or status >= 500:
+            self.limiter.on_throttle(parse_retry_after(retry_after))
+            self.breaker.record_failure()
+            return
+        self.limiter.on_success()
+        self.breaker.record_success()
+
+    def record_error(self) -> None:
+        self.breaker.record_failure()
+
+    def record_cancelled(self) -> None:
+        self.breaker.record_cancelled()
+
+
+_shared_guards: dict[str, RequestGuard] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_request_guard(config: AppConfig) -> RequestGuard | None:
+    """프로세스 전체에서 공유하는 RequestGuard를 호스트별로 돌려준다.
+
+    rate_limit_per_second가 0이면 None(제한 없음)을 돌려준다.
+    """
+
+    if config.rate_limit_per_second <= 0:
+        return None
+    host = urllib.parse.urlparse(config.dundam_base_url).netloc
+    with _shared_lock:
+        guard = _shared_guards.get(host)
+        if guard is None:
+            guard = RequestGuard(
+                AdaptiveRateLimiter(
+                    rate=config.rate_limit_per_second, burst=config.rate_limit_burst
+                ),
+                CircuitBreaker(
+                    failure_threshold=config.circuit_failure_threshold,
+                    reset_timeout=config.circuit_reset_timeout,
+                ),
+            )
+            _shared_guards[host] = guard
+        return guard
+
+
+def reset_shared_guards() -> None:
+    with _shared_lock:
+        _shared_guards.clear()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 남은 초로 바꾼다."""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
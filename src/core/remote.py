@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import requests
+
+from src.core.models import CharacterDamage, FetchResult, FetchStats
+from src.core.scraper import ResultCallback
+
+# 배치 엔드포인트 한 번에 보낼 수 있는 최대 공대원 수
+MAX_BATCH_SIZE = 64
+
+
+class RemoteLookupError(RuntimeError):
+    """조회 서버가 돌려준 공대원 단위 실패."""
+
+
+class RemoteScraper:
+    """조회 서버(``python -m src.cli serve``)를 통해 총딜을 조회하는 스크래퍼.
+
+    - DundamScraper와 같은 fetch_character_damage/fetch_many_concurrent를 제공하므로
+      앱은 lookup_server_url만 설정하면 직접 스크래핑 대신 서버를 쓴다.
+    - 캐시, 디스크 저장소, 속도 제한은 서버 한 곳에서 팀 전체가 공유한다.
+    """
+
+    cache = None
+    store = None
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout: float = 5.0,
+        session: requests.Session | None = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+    def fetch_character_damage(
+        self,
+        url: str,
+        name: str,
+        job: str | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> CharacterDamage:
+        params = {"url": url, "name": name}
+        if job:
+            params["job"] = job
+        if force_refresh:
+            params["refresh"] = "1"
+        response = self.session.get(
+            f"{self.base_url}/lookup", params=params, timeout=self.timeout
+        )
+        return result_from_json(_json_or_raise(response)).damage_or_raise()
+
+    def fetch_many_concurrent(
+        self,
+        urls: Iterable[tuple[str, str, str | None]],
+        *,
+        max_workers: int | None = None,
+        force_refresh: bool = False,
+        on_result: ResultCallback | None = None,
+    ) -> list[FetchResult]:
+        """배치 엔드포인트로 조회한다. 동시성은 서버의 fetch_max_workers를 따른다."""
+
+        targets = list(urls)
+        results: list[FetchResult] = []
+        for start in range(0, len(targets), MAX_BATCH_SIZE):
+            chunk = targets[start : start + MAX_BATCH_SIZE]
+            body = {
+                "items": [
+                    {"url": url, "name": name, "job": job} for url, name, job in chunk
+                ],
+                "force_refresh": force_refresh,
+            }
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/lookup/batch", json=body, timeout=self.timeout
+                )
+                items = _json_or_raise(response)["results"]
+                chunk_results = [
+                    result_from_json(item).to_fetch_result() for item in items
+                ]
+            except (requests.RequestException, RemoteLookupError, KeyError) as exc:
+                chunk_results = [
+                    FetchResult(name=name, url=url, job=job, error=exc)
+                    for url, name, job in chunk
+                ]
+            for offset, result in enumerate(chunk_results):
+                if on_result is not None:
+                    on_result(start + offset, result)
+            results.extend(chunk_results)
+        return results
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class _RemoteResult:
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        job: str | None,
+        damage: CharacterDamage | None,
+        error: str | None,
+    ) -> None:
+        self.name = name
+        self.url = url
+        self.job = job
+        self.damage = damage
+        self.error = error
+
+    def damage_or_raise(self) -> CharacterDamage:
+        if self.damage is None:
+            raise RemoteLookupError(self.error or "lookup failed")
+        return self.damage
+
+    def to_fetch_result(self) -> FetchResult:
+        error = RemoteLookupError(self.error) if self.damage is None else None
+        return FetchResult(
+            name=self.name, url=self.url, job=self.job, damage=self.damage, error=error
+        )
+
+
+def result_to_json(result: FetchResult) -> dict[str, Any]:
+    damage = result.damage
+    payload: dict[str, Any] = {
+        "name": result.name,
+        "url": result.url,
+        "job": result.job,
+        "damage": None,
+        "error": (
+            None if result.ok else f"{type(result.error).__name__}: {result.error}"
+        ),
+    }
+    if damage is not None:
+        stats = damage.stats
+        payload["damage"] = {
+            "name": damage.name,
+            "job": damage.job,
+            "fame": damage.fame,
+            "damage": damage.damage,
+            "source": stats.source if stats is not None else None,
+            "status": stats.status if stats is not None else None,
+            "elapsed": stats.elapsed if stats is not None else None,
+        }
+    return payload
+
+
+def result_from_json(payload: dict[str, Any]) -> _RemoteResult:
+    data = payload.get("damage")
+    damage = None
+    if data is not None:
+        damage = CharacterDamage(
+            name=data["name"],
+            damage=data["damage"],
+            job=data.get("job"),
+            fame=data.get("fame"),
+            stats=FetchStats(
+                url=payload["url"],
+                source=f"remote:{data.get('source') or 'network'}",
+                status=data.get("status"),
+                elapsed=data.get("elapsed") or 0.0,
+            ),
+        )
+    return _RemoteResult(
+        payload["name"],
+        payload["url"],
+        payload.get("job"),
+        damage,
+        payload.get("error"),
+    )
+
+
+def _json_or_raise(response: requests.Response) -> dict[str, Any]:
+    try:
+        payload = response.json()
+    except ValueError as exc:
+        raise RemoteLookupError(
+            f"lookup server returned HTTP {response.status_code}"
+        ) from exc
+    if response.status_code >= 400:
+        raise RemoteLookupError(payload.get("error") or f"HTTP {response.status_code}")
+    return payload
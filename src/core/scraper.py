@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+import codecs
 import re
 import time
-from collections.abc import Iterable
+import urllib.parse
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html import unescape
 
+import lxml.etree
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
 
-from src.core.models import CharacterDamage
+from src.core.cache import TTLCache
+from src.core.damage_store import DamageStore, server_from_url
+from src.core.models import CharacterDamage, FetchResult, FetchStats
+from src.core.ratelimit import RequestGuard
+from src.core.singleflight import SingleFlight
+
+# fetch_many_concurrent가 한 명씩 조회가 끝날 때마다 (입력 순번, 결과)로 호출한다.
+ResultCallback = Callable[[int, FetchResult], None]
+
+
+@dataclass
+class HttpValidator:
+    """URL별 조건부 요청 검증자와, 그 응답에서 이미 파싱해 둔 총딜 값."""
+
+    damage: str
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 class DundamScraper:
@@ -24,27 +47,85 @@ class DundamScraper:
         request_timeout: float = 10.0,
         max_retries: int = 2,
         retry_backoff: float = 0.5,
+        max_workers: int = 4,
+        cache: TTLCache[str] | None = None,
+        store: DamageStore | None = None,
+        conditional_requests: bool = False,
+        stream_responses: bool = False,
+        guard: RequestGuard | None = None,
     ) -> None:
         self.session = session or requests.Session()
         self.request_timeout = request_timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.max_workers = max_workers
+        # 렌더링된 URL -> 파싱된 총딜 문자열
+        self.cache = cache
+        # (서버, 캐릭터명) -> 디스크에 저장된 최근 결과
+        self.store = store
+        # 렌더링된 URL -> ETag/Last-Modified 검증자 (조건부 요청을 켠 경우에만)
+        self.validators: TTLCache[HttpValidator] | None = (
+            TTLCache(max_entries=1024, ttl=None) if conditional_requests else None
+        )
+        # 응답을 청크 단위로 읽다가 총딜을 찾으면 바로 연결을 닫는다.
+        self.stream_responses = stream_responses
+        # 프로세스 전체에서 공유하는 속도 제한/회로 차단기
+        self.guard = guard
+        # 렌더링된 URL 기준으로 진행 중인 네트워크 요청을 공유한다.
+        self._inflight: SingleFlight[tuple[str, int, str | None]] = SingleFlight()
 
     def fetch_html(self, url: str) -> str:
+        return self._get(url).text
+
+    def _get(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> requests.Response:
         last_exc: requests.RequestException | None = None
         for attempt in range(self.max_retries + 1):
             try:
-                response = self.session.get(url, timeout=self.request_timeout)
+                # 회로가 열려 있으면 CircuitOpenError로 즉시 실패한다.
+                delay = self.guard.reserve() if self.guard is not None else 0.0
+                try:
+                    if delay > 0:
+                        time.sleep(delay)
+                    response = self.session.get(
+                        url,
+                        timeout=self.request_timeout,
+                        headers=headers,
+                        stream=stream,
+                    )
+                except requests.RequestException:
+                    raise
+                except BaseException:
+                    # 속도 제한 대기 중이거나 응답 없이 중단되면 회로의 시험 요청 자리를
+                    # 돌려놓는다.
+                    if self.guard is not None:
+                        self.guard.record_cancelled()
+                    raise
+                if self.guard is not None:
+                    self.guard.record_response(
+                        response.status_code, response.headers.get("Retry-After")
+                    )
+                if stream and response.status_code >= 400:
+                    response.close()
                 if response.status_code >= 500:
                     raise requests.HTTPError(
                         f"Server error: {response.status_code}", response=response
                     )
+                if response.status_code == 429:
+                    raise requests.HTTPError("Too many requests", response=response)
                 response.raise_for_status()
-                return response.text
+                return response
             except requests.RequestException as exc:
                 last_exc = exc
                 status = getattr(exc.response, "status_code", None)
-                if status is not None and 400 <= status < 500:
+                if status is None and self.guard is not None:
+                    self.guard.record_error()
+                if status is not None and 400 <= status < 500 and status != 429:
                     raise RuntimeError(f"요청 실패({status}): {url}") from exc
                 if attempt >= self.max_retries:
                     break
@@ -52,55 +133,93 @@ class DundamScraper:
         raise RuntimeError(f"요청 실패(재시도 초과): {url}") from last_exc
 
     def parse_total_damage(self, html: str) -> str:
-        """HTML에서 '총딜' 키워드가 포함된 숫자/단위를 추출한다.
+        return parse_total_damage(html)
 
-        반환 예: "12.3조", "845억" 등 문자열 그대로.
-        찾을 수 없으면 ValueError를 발생시킨다.
+    def parse_total_damage_with_tier(self, html: str) -> tuple[str, str]:
+        return parse_total_damage_with_tier(html)
+
+    def _extract_damage_from_text(self, text: str) -> str | None:
+        return extract_damage_from_text(text)
+
+    def fetch_character_damage(
+        self,
+        url: str,
+        name: str,
+        job: str | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> CharacterDamage:
+        """총딜을 조회한다. 메모리 캐시 → 디스크 저장소(신선한 항목만) 순으로 먼저 확인한다.
+
+        force_refresh=True면 캐시를 건너뛰고 네트워크에서 다시 받아 캐시를 갱신한다.
         """
 
-        soup = BeautifulSoup(html, "lxml")
+        if not force_refresh:
+            cached = lookup_cached_damage(
+                url, name, job, cache=self.cache, store=self.store
+            )
+            if cached is not None:
+                return cached
 
-        # 1) 텍스트 노드에 '총딜'이 포함된 경우 주변 숫자를 찾는다.
-        text_nodes = soup.find_all(string=re.compile("총딜"))
-        for text_node in text_nodes:
-            candidate = self._extract_damage_from_text(text_node)
-            if candidate:
-                return candidate
-            # 부모 요소에 숫자가 있을 수 있다.
-            if text_node.parent:
-                parent_text = text_node.parent.get_text(" ", strip=True)
-                candidate = self._extract_damage_from_text(parent_text)
-                if candidate:
-                    return candidate
-
-        # 2) 숫자+단위 패턴만 있는 경우(백업 전략)
-        body_text = soup.get_text(" ", strip=True)
-        candidate = self._extract_damage_from_text(body_text)
-        if candidate:
-            return candidate
+        started = time.perf_counter()
+        # 같은 URL을 동시에 조회하면 요청 하나만 보내고 결과/오류를 함께 받는다.
+        (total_damage, status, tier), shared = self._inflight.do(
+            url, lambda: self._fetch_network(url)
+        )
+        result = CharacterDamage(
+            name=name,
+            job=job,
+            damage=total_damage,
+            stats=FetchStats(
+                url=url,
+                source="coalesced" if shared else "network",
+                status=status,
+                elapsed=time.perf_counter() - started,
+                parse_tier=tier,
+            ),
+        )
+        if not shared:
+            remember_damage(url, result, cache=self.cache, store=self.store)
+        return result
 
-        raise ValueError("총딜 정보를 찾을 수 없습니다.")
+    def _fetch_network(self, url: str) -> tuple[str, int, str | None]:
+        if self.validators is None and not self.stream_responses:
+            html = self.fetch_html(url)
+            total_damage, tier = self.parse_total_damage_with_tier(html)
+            return total_damage, 200, tier
+        return self._fetch_and_parse(url)
 
-    def _extract_damage_from_text(self, text: str) -> str | None:
-        # 예시 패턴: "총딜 12.3조", "총딜: 845억", "총딜=1,234,567,890"
-        pattern = r"총딜\s*[:=]?\s*([0-9][0-9,\.]*\s*(?:조|억|만|))"
-        match = re.search(pattern, text)
-        if match:
-            return match.group(1).replace(" ", "")
-
-        # 단순 숫자만 있는 경우(단위 없음)
-        unitless_pattern = r"총딜\s*[:=]?\s*([0-9][0-9,\.]*)(?!\S)"
-        match = re.search(unitless_pattern, text)
-        if match:
-            return match.group(1).replace(" ", "")
-        return None
+    def _fetch_and_parse(self, url: str) -> tuple[str, int, str | None]:
+        """조건부 요청/스트리밍 파싱을 적용해 총딜을 가져온다.
 
-    def fetch_character_damage(
-        self, url: str, name: str, job: str | None = None
-    ) -> CharacterDamage:
-        html = self.fetch_html(url)
-        total_damage = self.parse_total_damage(html)
-        return CharacterDamage(name=name, job=job, damage=total_damage)
+        - 304 Not Modified면 저장해 둔 총딜을 파싱 없이 재사용한다.
+        - 스트리밍 모드에서는 청크를 읽는 중 총딜을 찾으면 나머지 본문을 받지 않고 닫는다.
+        """
+
+        validator = self.validators.get(url) if self.validators is not None else None
+        stream = self.stream_responses
+        response = self._get(url, headers=conditional_headers(validator), stream=stream)
+        if response.status_code == 304:
+            if stream:
+                response.close()
+            if validator is not None:
+                return validator.damage, 304, None
+            response = self._get(url, stream=stream)
+
+        try:
+            if stream:
+                total_damage, tier = scan_damage_stream(_iter_response_text(response))
+            else:
+                total_damage, tier = self.parse_total_damage_with_tier(response.text)
+        finally:
+            if stream:
+                response.close()
+
+        if self.validators is not None:
+            validator = validator_from_headers(response.headers, total_damage)
+            if validator is not None:
+                self.validators.set(url, validator)
+        return total_damage, response.status_code, tier
 
     def fetch_many(
         self, urls: Iterable[tuple[str, str, str | None]]
@@ -109,3 +228,321 @@ class DundamScraper:
         for url, name, job in urls:
             results.append(self.fetch_character_damage(url, name, job))
         return results
+
+    def fetch_many_concurrent(
+        self,
+        urls: Iterable[tuple[str, str, str | None]],
+        *,
+        max_workers: int | None = None,
+        force_refresh: bool = False,
+        on_result: ResultCallback | None = None,
+    ) -> list[FetchResult]:
+        """여러 캐릭터를 병렬로 조회한다.
+
+        - 결과는 입력 순서를 유지한다.
+        - 한 명이 실패해도 나머지 조회는 계속되며, 실패는 FetchResult.error로 전달된다.
+        - 재시도/백오프는 요청마다 fetch_html의 정책을 그대로 따른다.
+        - on_result를 주면 전체가 끝나기를 기다리지 않고 한 명씩 끝나는 대로 호출한다
+          (작업 스레드에서 호출되므로 UI 갱신은 호출 측이 메인 스레드로 넘겨야 한다).
+        """
+
+        targets = list(urls)
+        if not targets:
+            return []
+
+        workers = max(1, min(max_workers or self.max_workers, len(targets)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="dundam-fetch"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._fetch_result, url, name, job, force_refresh, index, on_result
+                )
+                for index, (url, name, job) in enumerate(targets)
+            ]
+            return [future.result() for future in futures]
+
+    def close(self) -> None:
+        self.session.close()
+        if self.store is not None:
+            self.store.close()
+
+    def _fetch_result(
+        self,
+        url: str,
+        name: str,
+        job: str | None,
+        force_refresh: bool = False,
+        index: int = 0,
+        on_result: ResultCallback | None = None,
+    ) -> FetchResult:
+        try:
+            damage = self.fetch_character_damage(
+                url, name, job, force_refresh=force_refresh
+            )
+        except Exception as exc:  # noqa: BLE001
+            result = FetchResult(name=name, url=url, job=job, error=exc)
+        else:
+            result = FetchResult(name=name, url=url, job=job, damage=damage)
+        if on_result is not None:
+            on_result(index, result)
+        return result
+
+
+def default_url_template(base_url: str, server: str = "hilder") -> str:
+    return f"{base_url.rstrip('/')}/character?server={server}&key={{name}}"
+
+
+def character_url(template: str, name: str) -> str:
+    """URL 템플릿의 {name}을 URL 인코딩한 캐릭터 이름으로 바꾼다."""
+
+    return template.replace("{name}", urllib.parse.quote(name))
+
+
+def conditional_headers(validator: HttpValidator | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if validator is None:
+        return headers
+    if validator.etag:
+        headers["If-None-Match"] = validator.etag
+    if validator.last_modified:
+        headers["If-Modified-Since"] = validator.last_modified
+    return headers
+
+
+def validator_from_headers(
+    headers: Mapping[str, str], damage: str
+) -> HttpValidator | None:
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return None
+    return HttpValidator(damage=damage, etag=etag, last_modified=last_modified)
+
+
+def lookup_cached_damage(
+    url: str,
+    name: str,
+    job: str | None,
+    *,
+    cache: TTLCache[str] | None,
+    store: DamageStore | None,
+) -> CharacterDamage | None:
+    """메모리 캐시와 디스크 저장소에서 신선한 결과를 찾는다(없으면 None)."""
+
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            return CharacterDamage(
+                name=name,
+                job=job,
+                damage=cached,
+                stats=FetchStats(url=url, source="cache"),
+            )
+    if store is not None:
+        stored = store.get(server_from_url(url), name)
+        if stored is not None and not stored.is_stale:
+            if cache is not None:
+                cache.set(url, stored.damage.damage)
+            return CharacterDamage(
+                name=name,
+                job=job or stored.damage.job,
+                damage=stored.damage.damage,
+                fame=stored.damage.fame,
+                stats=FetchStats(url=url, source="store"),
+            )
+    return None
+
+
+def remember_damage(
+    url: str,
+    damage: CharacterDamage,
+    *,
+    cache: TTLCache[str] | None,
+    store: DamageStore | None,
+) -> None:
+    if cache is not None:
+        cache.set(url, damage.damage)
+    if store is not None:
+        store.put(server_from_url(url), damage)
+
+
+# '총딜' 마커 주변만 잘라 볼 원본 HTML 범위(문자 수)
+_REGEX_WINDOW = 512
+_SUBTREE_BEFORE = 2048
+_SUBTREE_AFTER = 4096
+_STREAM_CHUNK_SIZE = 16 * 1024
+
+_MARKER = "총딜"
+_TAG_RE = re.compile(r"<[^>]*>")
+_SPACE_RE = re.compile(r"\s+")
+_DAMAGE_RE = re.compile(r"총딜\s*[:=]?\s*([0-9][0-9,\.]*\s*(?:조|억|만|))")
+_UNITLESS_DAMAGE_RE = re.compile(r"총딜\s*[:=]?\s*([0-9][0-9,\.]*)(?!\S)")
+
+
+def parse_total_damage(html: str) -> str:
+    """HTML에서 '총딜' 키워드가 포함된 숫자/단위를 추출한다.
+
+    반환 예: "12.3조", "845억" 등 문자열 그대로.
+    찾을 수 없으면 ValueError를 발생시킨다.
+    동기/비동기 스크래퍼가 같은 파서를 공유하도록 모듈 함수로 둔다.
+    """
+
+    return parse_total_damage_with_tier(html)[0]
+
+
+def parse_total_damage_with_tier(html: str) -> tuple[str, str]:
+    """총딜 값과 함께 성공한 파서 단계를 돌려준다.
+
+    1) regex: 원본 HTML에서 '총딜' 주변만 태그를 지우고 정규식으로 찾는다.
+    2) lxml: 마커 주변 조각만 lxml로 파싱해 조상 요소의 텍스트에서 찾는다.
+    3) soup: 기존 방식대로 전체 문서를 BeautifulSoup으로 파싱한다.
+    """
+
+    positions = _marker_positions(html)
+    for tier, parser in (("regex", _parse_marker_window), ("lxml", _parse_subtree)):
+        for position in positions:
+            candidate = parser(html, position)
+            if candidate:
+                return candidate, tier
+    return _parse_full_document(html), "soup"
+
+
+def _marker_positions(html: str, start: int = 0) -> list[int]:
+    # 태그 속성 안의 '총딜'은 본문 텍스트가 아니므로 제외한다.
+    positions = []
+    index = html.find(_MARKER, start)
+    while index != -1:
+        if html.rfind("<", 0, index) <= html.rfind(">", 0, index):
+            positions.append(index)
+        index = html.find(_MARKER, index + len(_MARKER))
+    return positions
+
+
+def _parse_marker_window(
+    html: str, position: int, *, complete: bool = True
+) -> str | None:
+    end = position + _REGEX_WINDOW
+    window = html[position:end]
+    if end < len(html) or not complete:
+        # 창 끝에서 잘린 텍스트/태그는 숫자를 잘라먹을 수 있으므로 마지막 태그 앞까지만 본다.
+        window = window[: max(window.rfind("<"), 0)]
+    text = _SPACE_RE.sub(" ", unescape(_TAG_RE.sub(" ", window)))
+    return extract_damage_from_text(text)
+
+
+def _parse_subtree(html: str, position: int) -> str | None:
+    start = max(0, position - _SUBTREE_BEFORE)
+    if start > 0:
+        start = html.find("<", start, position)
+        if start == -1:
+            start = position
+    end = position + _SUBTREE_AFTER
+    if end < len(html):
+        end = max(html.rfind("<", position, end), position + len(_MARKER))
+    fragment_html = html[start:end]
+    try:
+        fragment = lxml.html.fragment_fromstring(fragment_html, create_parent="div")
+    except (lxml.etree.ParserError, ValueError):
+        return None
+
+    for text_node in fragment.xpath("//text()[contains(., '총딜')]"):
+        element = text_node.getparent()
+        for _ in range(3):
+            if element is None:
+                break
+            text = _SPACE_RE.sub(" ", " ".join(element.itertext()))
+            candidate = extract_damage_from_text(text)
+            if candidate:
+                return candidate
+            element = element.getparent()
+    return None
+
+
+def _parse_full_document(html: str) -> str:
+    soup = BeautifulSoup(html, "lxml")
+
+    # 1) 텍스트 노드에 '총딜'이 포함된 경우 주변 숫자를 찾는다.
+    text_nodes = soup.find_all(string=re.compile(_MARKER))
+    for text_node in text_nodes:
+        candidate = extract_damage_from_text(text_node)
+        if candidate:
+            return candidate
+        # 부모 요소에 숫자가 있을 수 있다.
+        if text_node.parent:
+            parent_text = text_node.parent.get_text(" ", strip=True)
+            candidate = extract_damage_from_text(parent_text)
+            if candidate:
+                return candidate
+
+    # 2) 숫자+단위 패턴만 있는 경우(백업 전략)
+    body_text = soup.get_text(" ", strip=True)
+    candidate = extract_damage_from_text(body_text)
+    if candidate:
+        return candidate
+
+    raise ValueError("총딜 정보를 찾을 수 없습니다.")
+
+
+class DamageStreamScanner:
+    """청크로 나뉘어 들어오는 HTML에서 '총딜'을 점진적으로 찾는다.
+
+    feed()는 regex 단계로 찾은 총딜을 돌려주며, 끝까지 못 찾으면 finish()가
+    버퍼에 모인 전체 본문으로 단계별 파서를 실행한다.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._scan_from = 0
+
+    def feed(self, text: str) -> str | None:
+        self._buffer += text
+        buffer = self._buffer
+        pending: int | None = None
+        for position in _marker_positions(buffer, self._scan_from):
+            candidate = _parse_marker_window(buffer, position, complete=False)
+            if candidate:
+                return candidate
+            if pending is None and position + _REGEX_WINDOW > len(buffer):
+                # 창이 아직 다 도착하지 않았으니 다음 청크에서 다시 본다.
+                pending = position
+        if pending is None:
+            pending = max(0, len(buffer) - len(_MARKER) + 1)
+        self._scan_from = pending
+        return None
+
+    def finish(self) -> tuple[str, str]:
+        return parse_total_damage_with_tier(self._buffer)
+
+
+def scan_damage_stream(chunks: Iterable[str]) -> tuple[str, str]:
+    """텍스트 청크를 읽으며 총딜을 찾는다. 중간에 찾으면 tier는 'stream'이다."""
+
+    scanner = DamageStreamScanner()
+    for chunk in chunks:
+        candidate = scanner.feed(chunk)
+        if candidate:
+            return candidate, "stream"
+    return scanner.finish()
+
+
+def _iter_response_text(response: requests.Response) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+        errors="replace"
+    )
+    for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def extract_damage_from_text(text: str) -> str | None:
+    # 예시 패턴: "총딜 12.3조", "총딜: 845억", "총딜=1,234,567,890"
+    match = _DAMAGE_RE.search(text)
+    if match:
+        return match.group(1).replace(" ", "")
+
+    # 단순 숫자만 있는 경우(단위 없음)
+    match = _UNITLESS_DAMAGE_RE.search(text)
+    if match:
+        return match.group(1).replace(" ", "")
+    return None
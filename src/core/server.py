@@ -0,0 +1,243 @@
+"""팀이 함께 쓰는 로컬 총딜 조회 서버(``python -m src.cli serve``).
+
+엔드포인트(모두 JSON):
+
+- ``GET /health``: 상태와 응답 캐시 적중 통계
+- ``GET /lookup?url=..&name=..[&job=..][&refresh=1]``: 한 명 조회
+- ``POST /lookup/batch``: ``{"items": [{"url", "name", "job"}], "force_refresh": false}``
+  를 동시에 조회해 같은 순서의 ``{"results": [...]}``로 돌려준다.
+
+공대원 단위 실패는 HTTP 200 응답 안의 ``error``로 전달되고, 요청 자체가 잘못되면 4xx를 돌려준다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import urllib.parse
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Protocol
+
+from src.core.cache import TTLCache
+from src.core.models import CharacterDamage, FetchResult
+from src.core.remote import MAX_BATCH_SIZE, result_to_json
+from src.core.scraper import ResultCallback
+
+logger = logging.getLogger(__name__)
+
+# 배치 요청 본문 크기 상한(바이트)
+_MAX_BODY = 256 * 1024
+
+
+class BadRequest(ValueError):
+    """클라이언트 요청이 잘못되어 400/413으로 응답해야 하는 경우."""
+
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+class LookupBackend(Protocol):
+    cache: TTLCache[str] | None
+
+    def fetch_character_damage(
+        self,
+        url: str,
+        name: str,
+        job: str | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> CharacterDamage: ...
+
+    def fetch_many_concurrent(
+        self,
+        urls: list[tuple[str, str, str | None]],
+        *,
+        max_workers: int | None = None,
+        force_refresh: bool = False,
+        on_result: ResultCallback | None = None,
+    ) -> list[FetchResult]: ...
+
+
+class LookupServer:
+    """하나의 스크래퍼(응답 캐시, 디스크 저장소, 속도 제한)를 여러 클라이언트가 공유하는 HTTP 서버.
+
+    - 요청마다 스레드에서 처리하며, 같은 캐릭터를 동시에 물으면 스크래퍼의 SingleFlight가
+      던담 요청 하나로 합친다.
+    - base_url(던담 주소)과 같은 호스트의 URL만 조회해 서버가 임의 주소를 대신 요청하지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        scraper: LookupBackend,
+        *,
+        base_url: str,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+    ) -> None:
+        self.scraper = scraper
+        allowed = urllib.parse.urlparse(base_url)
+        self._allowed = (allowed.scheme, allowed.netloc)
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._httpd = _HttpServer((host, port), _Handler)
+        self._httpd.lookup = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    def serve_forever(self) -> None:
+        logger.info("Lookup server listening on %s:%s.", *self.address)
+        self._httpd.serve_forever()
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 서비스를 시작한다(테스트/내장용)."""
+
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="bory-server", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def health(self) -> dict[str, Any]:
+        cache = self.scraper.cache
+        return {
+            "status": "ok",
+            "requests": self.requests_served,
+            "cache": (
+                {"hits": cache.hits, "misses": cache.misses}
+                if cache is not None
+                else None
+            ),
+        }
+
+    def lookup(self, params: dict[str, list[str]]) -> dict[str, Any]:
+        url = self._checked_url(_first(params, "url"))
+        name = _first(params, "name")
+        if not name:
+            raise BadRequest("name is required")
+        job = _first(params, "job") or None
+        force_refresh = _first(params, "refresh") in {"1", "true", "yes"}
+        self._count(1)
+        try:
+            damage = self.scraper.fetch_character_damage(
+                url, name, job, force_refresh=force_refresh
+            )
+        except Exception as exc:  # noqa: BLE001
+            result = FetchResult(name=name, url=url, job=job, error=exc)
+        else:
+            result = FetchResult(name=name, url=url, job=job, damage=damage)
+        return result_to_json(result)
+
+    def lookup_batch(self, body: Any) -> dict[str, Any]:
+        items = body.get("items") if isinstance(body, dict) else None
+        if not isinstance(items, list) or not items:
+            raise BadRequest("items must be a non-empty list")
+        if len(items) > MAX_BATCH_SIZE:
+            raise BadRequest(
+                f"at most {MAX_BATCH_SIZE} items per batch",
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+        targets = []
+        for item in items:
+            if not isinstance(item, dict) or not item.get("name"):
+                raise BadRequest("each item needs url and name")
+            url = self._checked_url(item.get("url"))
+            targets.append((url, str(item["name"]), item.get("job") or None))
+        self._count(len(targets))
+        results = self.scraper.fetch_many_concurrent(
+            targets, force_refresh=bool(body.get("force_refresh"))
+        )
+        return {"results": [result_to_json(result) for result in results]}
+
+    def _checked_url(self, url: Any) -> str:
+        if not isinstance(url, str) or not url:
+            raise BadRequest("url is required")
+        parsed = urllib.parse.urlparse(url)
+        if (parsed.scheme, parsed.netloc) != self._allowed:
+            raise BadRequest(
+                f"url must start with {self._allowed[0]}://{self._allowed[1]}"
+            )
+        return url
+
+    def _count(self, lookups: int) -> None:
+        with self._lock:
+            self.requests_served += lookups
+
+
+class _HttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    lookup: LookupServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _HttpServer
+    server_version = "bory-lookup"
+
+    def do_GET(self) -> None:  # noqa: N802
+        parsed = urllib.parse.urlparse(self.path)
+        params = urllib.parse.parse_qs(parsed.query)
+        if parsed.path == "/health":
+            self._respond(self.server.lookup.health)
+        elif parsed.path == "/lookup":
+            self._respond(lambda: self.server.lookup.lookup(params))
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if urllib.parse.urlparse(self.path).path != "/lookup/batch":
+            self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+            return
+        self._respond(lambda: self.server.lookup.lookup_batch(self._read_json()))
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _read_json(self) -> Any:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError as exc:
+            raise BadRequest("invalid Content-Length") from exc
+        if length > _MAX_BODY:
+            raise BadRequest(
+                "request body too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            )
+        try:
+            return json.loads(self.rfile.read(length) or b"null")
+        except ValueError as exc:
+            raise BadRequest("body must be JSON") from exc
+
+    def _respond(self, handler) -> None:
+        try:
+            payload = handler()
+        except BadRequest as exc:
+            self._send(exc.status, {"error": str(exc)})
+        except Exception:  # noqa: BLE001
+            logger.exception("Lookup request failed.")
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"})
+        else:
+            self._send(HTTPStatus.OK, payload)
+
+    def _send(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _first(params: dict[str, list[str]], key: str) -> str:
+    values = params.get(key)
+    return values[0] if values else ""
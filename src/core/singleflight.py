@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """같은 키로 동시에 들어온 호출을 하나의 실행으로 합친다(스레드용).
+
+    먼저 들어온 호출만 fn을 실행하고, 나머지는 그 결과나 예외를 그대로 받는다.
+    do()는 (결과, 다른 호출의 결과를 공유했는지)를 돌려준다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, Future[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+        return future.result(), False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight(Generic[T]):
+    """SingleFlight의 asyncio 버전. 하나의 이벤트 루프 안에서만 사용한다.
+
+    먼저 들어온 호출이 취소되면 나머지 호출은 RuntimeError를 받는다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        future = self._calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # future.cancel()로 넘기면 기다리던 호출들도 CancelledError(BaseException)를
+            # 받아 관계없는 배치 전체가 중단된다. 일반 예외로 넘겨 항목 단위 실패로 남긴다.
+            future.set_exception(
+                RuntimeError("같은 키로 진행 중이던 요청이 취소되었습니다")
+            )
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 기다리는 쪽이 없을 때 "exception was never retrieved" 경고를 막는다.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
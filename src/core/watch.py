@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import numpy as np
+from PIL import Image
+
+from src.core.fingerprint import pixel_key
+from src.core.models import CharacterInfo
+from src.core.panel_detect import PanelDetector, crop_image
+
+
+class PartyWatcher:
+    """감시 모드에서 주기적 캡쳐가 실제 작업으로 이어질지 판단한다.
+
+    - frame_changed(): 공대원 패널(탐지기가 없으면 화면 전체)의 픽셀이 직전과 완전히 같으면
+      OCR을 건너뛴다. 이름 한 글자만 바뀌어도 다시 읽도록 축소 해시가 아닌 정확한 지문을 쓴다.
+    - composition_changed(): OCR로 읽은 공대원 구성이 바뀐 경우에만 조회를 시작한다.
+    - next_delay(): 한 번의 작업 시간과 CPU 예산(0~1, 한 코어 대비 비율)으로 다음 캡쳐까지
+      기다릴 시간을 정해, 작업이 무거워지면 감시 간격이 자동으로 늘어난다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        cpu_budget: float = 0.25,
+        panel_detector: PanelDetector | None = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if not 0 < cpu_budget <= 1:
+            raise ValueError("cpu_budget must be in (0, 1]")
+        self.interval = interval
+        self.cpu_budget = cpu_budget
+        self.panel_detector = panel_detector
+        self._last_frame: bytes | None = None
+        self._last_names: frozenset[str] | None = None
+
+    def frame_changed(self, image: Image.Image | np.ndarray) -> bool:
+        array = np.asarray(image)
+        if self.panel_detector is not None:
+            # 시계나 효과처럼 패널 밖에서 바뀌는 부분은 OCR 대상이 아니므로 보지 않는다.
+            array = crop_image(array, self.panel_detector.locate(array))
+        fingerprint = pixel_key(array)
+        changed = fingerprint != self._last_frame
+        self._last_frame = fingerprint
+        return changed
+
+    def composition_changed(self, characters: list[CharacterInfo]) -> bool:
+        # 창이 가려지거나 패널이 닫혀 아무것도 못 읽은 경우는 변화로 보지 않는다.
+        if not characters:
+            return False
+        names = frozenset(info.name for info in characters)
+        changed = names != self._last_names
+        self._last_names = names
+        return changed
+
+    def next_delay(self, busy: float) -> float:
+        """busy초 동안 일했을 때 예산을 지키려면 최소 얼마나 쉬어야 하는지 돌려준다."""
+
+        idle_needed = busy * (1 / self.cpu_budget - 1)
+        return max(self.interval, idle_needed)
+
+    def reset(self) -> None:
+        self._last_frame = None
+        self._last_names = None
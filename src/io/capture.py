@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
+import cv2
+import numpy as np
 import pyautogui
 from PIL import Image
 
+from src.core.models import CaptureRegion
+
+_mss_local = threading.local()
+
 
 def capture_fullscreen() -> Image.Image:
     """현재 화면 전체를 캡쳐한다."""
@@ -12,6 +19,69 @@ def capture_fullscreen() -> Image.Image:
     return screenshot
 
 
-def save_image(image: Image.Image, path: Path) -> None:
+def capture_region(region: CaptureRegion | None) -> Image.Image:
+    """설정된 영역만 캡쳐한다. 영역이 없으면 전체 화면을 캡쳐한다.
+
+    비율 영역은 캡쳐 시점의 화면 크기로 환산하므로 해상도가 바뀌어도 그대로 쓸 수 있다.
+    """
+    if region is None:
+        return capture_fullscreen()
+    screen_width, screen_height = pyautogui.size()
+    box = region.to_pixels(screen_width, screen_height)
+    return pyautogui.screenshot(region=box)
+
+
+def grab_region(region: CaptureRegion | None, backend: str = "auto") -> np.ndarray:
+    """설정된 영역을 RGB NumPy 배열(H×W×3, uint8)로 캡쳐한다.
+
+    - mss: 캡쳐 버퍼를 복사 없이 배열로 감싼 뒤 BGRA→RGB 변환 한 번만 거친다.
+    - pyautogui: PIL 이미지를 배열로 한 번 변환한다(mss가 없을 때 auto의 대체 경로).
+    - 결과 배열은 OcrEngine.extract_characters_from_image()에 그대로 넘기면 추가 복사가 없다.
+    """
+    if backend == "pyautogui" or (backend == "auto" and not _mss_available()):
+        return np.asarray(capture_region(region))
+    return _grab_mss(region)
+
+
+def save_image(image: Image.Image | np.ndarray, path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(image, np.ndarray):
+        image = Image.fromarray(image)
     image.save(path)
+    return path
+
+
+def _mss_available() -> bool:
+    try:
+        import mss  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _grab_mss(region: CaptureRegion | None) -> np.ndarray:
+    try:
+        import mss
+    except ImportError as exc:
+        raise RuntimeError(
+            "capture_backend=mss를 쓰려면 'pip install mss'가 필요합니다."
+        ) from exc
+
+    # mss 인스턴스는 만든 스레드에서만 쓸 수 있어 스레드마다 하나씩 재사용한다.
+    grabber = getattr(_mss_local, "grabber", None)
+    if grabber is None:
+        grabber = _mss_local.grabber = mss.mss()
+    monitor = grabber.monitors[1]
+    if region is None:
+        box = monitor
+    else:
+        left, top, width, height = region.to_pixels(monitor["width"], monitor["height"])
+        box = {
+            "left": monitor["left"] + left,
+            "top": monitor["top"] + top,
+            "width": width,
+            "height": height,
+        }
+    shot = grabber.grab(box)
+    bgra = np.frombuffer(shot.bgra, np.uint8).reshape(shot.height, shot.width, 4)
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB)
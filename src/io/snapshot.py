@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from src.core.panel_detect import Box, crop_image
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MODES = ("off", "crop", "full")
+
+
+class SnapshotWriter:
+    """캡쳐 화면을 백그라운드 스레드 하나에서 파일로 저장한다.
+
+    - mode: ``off``(저장 안 함) | ``crop``(패널 영역만) | ``full``(캡쳐 전체)
+    - 인코딩이 밀려 있으면 아직 시작하지 않은 이전 저장은 취소하고 최신 화면만 남긴다.
+    - 넘긴 배열은 저장이 끝날 때까지 수정하지 않아야 한다(복사하지 않는다).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        mode: str = "crop",
+        image_format: str = "jpg",
+        stem: str = "raid_snapshot",
+    ) -> None:
+        if mode not in SNAPSHOT_MODES:
+            raise ValueError(f"Unknown snapshot mode '{mode}'")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.image_format = image_format
+        self.stem = stem
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: Future[Path] | None = None
+
+    def save(
+        self, image: Image.Image | np.ndarray, box: Box | None = None
+    ) -> Path | None:
+        """저장을 예약하고 저장될 경로를 바로 돌려준다. 끈 경우 None."""
+
+        if self.mode == "off":
+            return None
+        if self.mode == "crop":
+            image = crop_image(image, box)
+        path = self.directory / f"{self.stem}.{self.image_format}"
+        if self._pending is not None:
+            self._pending.cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="snapshot"
+            )
+        self._pending = self._executor.submit(self._write, image, path)
+        return path
+
+    def flush(self) -> None:
+        pending = self._pending
+        if pending is not None and not pending.cancelled():
+            pending.result()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._pending = None
+
+    def _write(self, image: Image.Image | np.ndarray, path: Path) -> Path:
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        options = {"quality": 85} if self.image_format == "jpg" else {}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            image.save(path, **options)
+        except Exception:
+            logger.exception("Failed to save snapshot to %s.", path)
+            raise
+        logger.debug("Saved snapshot %s (%sx%s).", path, image.width, image.height)
+        return path
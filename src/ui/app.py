@@ -2,39 +2,92 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 import tkinter as tk
-import urllib.parse
+from concurrent.futures import CancelledError, Future
 from pathlib import Path
 from tkinter import ttk
 
-from src.core.config import AppConfig
-from src.core.models import CharacterDamage, CharacterInfo, RaidSnapshot
-from src.core.ocr import OcrEngine
-from src.core.scraper import DundamScraper
+import numpy as np
+
+from src.core.config import DEFAULT_CONFIG_PATHS, AppConfig, save_config_values
+from src.core.container import build_ocr_engine, build_prefetcher, build_scraper
+from src.core.damage_store import server_from_url
+from src.core.jobs import CancelToken, JobRunner
+from src.core.models import (
+    CaptureRegion,
+    CharacterDamage,
+    CharacterInfo,
+    FetchResult,
+    RaidSnapshot,
+)
+from src.core.ocr import PanelReading
+from src.core.pipeline import (
+    Pipeline,
+    Stage,
+    capture_stage,
+    ocr_stage,
+)
+from src.core.scraper import character_url, default_url_template
+from src.core.watch import PartyWatcher
 from src.io import capture
+from src.io.snapshot import SnapshotWriter
+from src.ui.region_select import RegionSelector
 
 logger = logging.getLogger(__name__)
 
+_CAPTURE_TEXT = "시작(캡쳐)"
+_PENDING_TEXT = "조회 중..."
+_LOW_CONFIDENCE_TEXT = "인식 불확실(조회 안 함)"
+
 
 class RaidHelperApp:
     def __init__(self, config: AppConfig) -> None:
         self.config = config
-        self.ocr_engine = OcrEngine(language=config.ocr_language)
-        self.scraper = DundamScraper(
-            request_timeout=config.request_timeout,
-            max_retries=config.request_max_retries,
-            retry_backoff=config.request_retry_backoff,
-        )
+        self.scraper = build_scraper(config)
+        known_names = self.scraper.store.known_names() if self.scraper.store else []
+        self.ocr_engine = build_ocr_engine(config, known_names)
+        # 켜져 있으면 OCR이 이름을 읽는 대로 총딜 조회를 미리 시작한다.
+        self.prefetcher = build_prefetcher(config, self.scraper)
+        threading.Thread(target=self._warm_up_ocr, daemon=True).start()
         self.snapshot: RaidSnapshot | None = None
+        # 진행 중인 조회 작업의 키와, 끝난 뒤 이어서 실행할 조회 요청
+        self._fetch_key: tuple[str, tuple[str, ...]] | None = None
+        self._queued_fetch: tuple[str, list[CharacterInfo], bool, bool] | None = None
+        # 조회를 시작하거나 캡쳐/초기화로 표를 바꿀 때마다 늘어나는 세대 번호.
+        # 조회 작업은 시작할 때의 번호를 들고 다니며, 번호가 바뀐 뒤 늦게 도착한 결과는 버린다.
+        self._generation = 0
+        # 감시 모드에서 이미 조회한 공대원은 다시 조회하지 않는다.
+        self._known_damages: dict[str, CharacterDamage] = {}
+        self.watcher = PartyWatcher(
+            interval=config.watch_interval_seconds,
+            cpu_budget=config.watch_cpu_budget,
+            panel_detector=self.ocr_engine.panel_detector,
+        )
+        self._watch_job: str | None = None
+        # 캡쳐/OCR은 Tk 메인 루프를 막지 않도록 전용 작업 스레드에서 돌린다.
+        self.capture_runner: JobRunner[tuple[list[CharacterInfo], Path | None]] = (
+            JobRunner(self._post, name="capture")
+        )
+        self.watch_runner: JobRunner[tuple[list[CharacterInfo] | None, float]] = (
+            JobRunner(self._post, name="watch")
+        )
+        self.snapshot_writer = SnapshotWriter(
+            Path.cwd() / "artifacts",
+            mode=config.snapshot_save,
+            image_format=config.snapshot_format,
+        )
 
         self.root = tk.Tk()
         self.root.title("던담 공대원 데미지 도우미")
         self.root.protocol("WM_DELETE_WINDOW", self._handle_exit)
 
-        base_url = self.config.dundam_base_url.rstrip("/")
-        default_template = f"{base_url}/character?server=hilder&key={{name}}"
+        default_template = default_url_template(self.config.dundam_base_url)
         self.url_var = tk.StringVar(value=default_template)
         self.status_var = tk.StringVar(value="대기 중")
+        self.force_refresh_var = tk.BooleanVar(value=False)
+        self.watch_var = tk.BooleanVar(value=False)
+        self.capture_button_var = tk.StringVar(value=_CAPTURE_TEXT)
 
         self._build_window()
 
@@ -54,18 +107,32 @@ class RaidHelperApp:
 
         button_frame = ttk.Frame(main)
         button_frame.grid(row=1, column=0, columnspan=2, pady=(8, 0), sticky="w")
-        ttk.Button(button_frame, text="시작(캡쳐)", command=self._handle_capture).grid(
-            row=0, column=0, padx=(0, 6)
-        )
+        ttk.Button(
+            button_frame,
+            textvariable=self.capture_button_var,
+            command=self._handle_capture,
+        ).grid(row=0, column=0, padx=(0, 6))
+        ttk.Button(
+            button_frame, text="영역 지정", command=self._handle_select_region
+        ).grid(row=0, column=1, padx=(0, 6))
         ttk.Button(button_frame, text="데미지 조회", command=self._handle_fetch).grid(
-            row=0, column=1, padx=(0, 6)
+            row=0, column=2, padx=(0, 6)
         )
         ttk.Button(button_frame, text="초기화", command=self._handle_reset).grid(
-            row=0, column=2, padx=(0, 6)
+            row=0, column=3, padx=(0, 6)
         )
         ttk.Button(button_frame, text="종료", command=self._handle_exit).grid(
-            row=0, column=3
+            row=0, column=4, padx=(0, 6)
         )
+        ttk.Checkbutton(
+            button_frame, text="새로고침(캐시 무시)", variable=self.force_refresh_var
+        ).grid(row=0, column=5, padx=(0, 6))
+        ttk.Checkbutton(
+            button_frame,
+            text="자동 감시",
+            variable=self.watch_var,
+            command=self._toggle_watch,
+        ).grid(row=0, column=6)
 
         ttk.Label(main, text="상태").grid(row=2, column=0, sticky="w", pady=(8, 0))
         ttk.Label(main, textvariable=self.status_var).grid(
@@ -90,6 +157,10 @@ class RaidHelperApp:
         self.table.column("fame", width=80, anchor="center")
         self.table.column("damage", width=120, anchor="w")
 
+        self.table.tag_configure("pending", foreground="gray")
+        self.table.tag_configure("error", foreground="#c0392b")
+        self.table.tag_configure("low", background="#fff3cd")
+
         table_scroll = ttk.Scrollbar(
             table_frame, orient="vertical", command=self.table.yview
         )
@@ -114,31 +185,151 @@ class RaidHelperApp:
         self.root.mainloop()
 
     def _handle_capture(self) -> None:
-        try:
-            self._set_status("화면 캡쳐 중...")
-            logger.info("Starting capture.")
-            image = capture.capture_fullscreen()
-            screenshot_path = capture.save_image(
-                image, Path.cwd() / "artifacts" / "raid_snapshot.png"
+        if self.capture_runner.busy:
+            # 캡쳐 중에는 같은 버튼이 취소 버튼이 된다.
+            self._cancel_capture()
+            return
+        region = self.config.capture_region
+        logger.info("Starting capture (region=%s).", region)
+        self._set_status("화면 캡쳐 중...")
+        template = self.url_var.get() or ""
+        self.capture_runner.submit(
+            lambda token: self._capture_and_recognize(token, template),
+            self._apply_capture,
+            self._capture_failed,
+        )
+        self.capture_button_var.set("캡쳐 취소")
+
+    def _capture_and_recognize(
+        self, token: CancelToken, template: str
+    ) -> tuple[list[CharacterInfo], Path | None]:
+        """캡쳐 → OCR(+추측 조회) → 스크린샷 저장 예약(작업 스레드에서 실행)."""
+
+        readings: list[tuple[np.ndarray, PanelReading]] = []
+
+        def grab() -> np.ndarray:
+            image = capture.grab_region(
+                self.config.capture_region, self.config.capture_backend
             )
-            characters = self.ocr_engine.extract_characters_from_image(image)
-            self.snapshot = RaidSnapshot(
-                characters=characters, screenshot_path=screenshot_path
+            self._set_status("문자 인식 중...")
+            return image
+
+        def prefetch(info: CharacterInfo) -> CharacterInfo:
+            if self._should_fetch(info):
+                url = self._render_url(template, info.name)
+                self.prefetcher.request(url, info.name, info.job)
+            return info
+
+        stages = [
+            capture_stage(grab),
+            ocr_stage(
+                self.ocr_engine,
+                on_reading=lambda image, found: readings.append((image, found)),
+            ),
+        ]
+        if self.prefetcher is not None:
+            # OCR이 한 명을 읽는 대로 바로 조회를 걸어 둔다.
+            stages.append(Stage("prefetch", prefetch))
+        results = Pipeline(stages).run([None], cancel=token)
+        for result in results:
+            if not result.ok:
+                raise result.error
+        # 파이프라인 결과는 인식이 끝난 순서이므로 표에는 OCR이 돌려준 화면 순서를 쓴다.
+        image, reading = readings[0]
+        characters = reading.characters
+        # 감시 모드가 같은 탐지기로 다른 프레임을 읽었을 수 있으므로 last_box가 아니라
+        # 이 캡쳐에서 찾은 위치로 스크린샷을 자른다.
+        panel_box = reading.panel_box
+        detector = self.ocr_engine.panel_detector
+        if detector is not None:
+            logger.info(
+                "Panel box=%s (cache hits=%s misses=%s)",
+                panel_box,
+                detector.cache_hits,
+                detector.cache_misses,
             )
-            self._update_table_from_characters(characters)
-            self._log(f"캡쳐 완료: {screenshot_path}")
-            if not characters:
-                self._log(
-                    "OCR 결과가 비어 있습니다. 텍스트 영역이 잘 보이도록 다시 캡쳐하세요."
-                )
-            self._set_status("캡쳐 완료")
-            logger.info("Capture completed with %s characters.", len(characters))
-        except Exception as exc:  # noqa: BLE001
-            self._set_status("캡쳐 실패")
-            self._log(f"오류: {exc}")
-            logger.exception("Capture failed.")
+        # 스크린샷 인코딩/저장은 백그라운드에서 처리해 작업 스레드도 막지 않는다.
+        return characters, self.snapshot_writer.save(image, panel_box)
+
+    def _apply_capture(self, result: tuple[list[CharacterInfo], Path | None]) -> None:
+        characters, screenshot_path = result
+        self.capture_button_var.set(_CAPTURE_TEXT)
+        # 재인식/이름 보정으로 최종 목록에서 빠진 이름의 추측 조회는 취소한다.
+        self._retain_prefetches(self.url_var.get() or "", characters)
+        self._generation += 1
+        self.snapshot = RaidSnapshot(
+            characters=characters,
+            screenshot_path=str(screenshot_path) if screenshot_path else None,
+        )
+        self._update_table_from_characters(characters)
+        self._log(f"캡쳐 완료: {screenshot_path}" if screenshot_path else "캡쳐 완료")
+        for info in characters:
+            if self._is_low_confidence(info):
+                self._log(f"인식 불확실: {info.name} (신뢰도 {info.confidence:.0%})")
+        if not characters:
+            self._log(
+                "OCR 결과가 비어 있습니다. 텍스트 영역이 잘 보이도록 다시 캡쳐하세요."
+            )
+        self._set_status("캡쳐 완료")
+        logger.info("Capture completed with %s characters.", len(characters))
+
+    def _capture_failed(self, exc: BaseException) -> None:
+        self.capture_button_var.set(_CAPTURE_TEXT)
+        self._set_status("캡쳐 실패")
+        self._log(f"오류: {exc}")
+        logger.error("Capture failed.", exc_info=exc)
+
+    def _cancel_capture(self) -> None:
+        if not self.capture_runner.cancel():
+            return
+        if self.prefetcher is not None:
+            self.prefetcher.cancel_all()
+        self.capture_button_var.set(_CAPTURE_TEXT)
+        self._set_status("캡쳐 취소됨")
+        self._log("캡쳐를 취소했습니다.")
+        logger.info("Capture cancelled by user.")
+
+    def _warm_up_ocr(self) -> None:
+        try:
+            self.ocr_engine.warm_up()
+        except Exception:  # noqa: BLE001
+            logger.exception("OCR warm-up failed.")
+
+    def _handle_select_region(self) -> None:
+        if self.capture_runner.busy:
+            self._log("캡쳐가 끝난 뒤 영역을 지정하세요.")
+            return
+        self.root.withdraw()
+        # 메인 창이 사라진 뒤에 오버레이를 띄워야 영역 지정을 가리지 않는다.
+        self.root.after(
+            200,
+            lambda: RegionSelector(
+                self.root, self._apply_capture_region, on_closed=self.root.deiconify
+            ),
+        )
+
+    def _apply_capture_region(self, region: CaptureRegion | None) -> None:
+        self.config.capture_region = region
+        value = region.to_config_value() if region is not None else ""
+        path = self.config.config_path_used or DEFAULT_CONFIG_PATHS[0]
+        try:
+            saved = save_config_values(path, {"capture_region": value})
+        except OSError as exc:
+            self._log(f"캡쳐 영역 저장 실패: {exc}")
+            logger.exception("Failed to save capture region.")
+            return
+        self.config.config_path_used = saved
+        if region is None:
+            self._log("캡쳐 영역을 해제했습니다. 전체 화면을 캡쳐합니다.")
+        else:
+            self._log(f"캡쳐 영역을 저장했습니다: {value} ({saved})")
+        logger.info("Capture region set to %s (saved to %s).", region, saved)
 
     def _handle_fetch(self) -> None:
+        if self.capture_runner.busy:
+            self._log("캡쳐가 끝난 뒤 조회하세요.")
+            logger.info("Fetch rejected while capture is running.")
+            return
         if not self.snapshot or not self.snapshot.characters:
             self._log("먼저 캡쳐를 수행해 캐릭터를 추출하세요.")
             logger.warning("Fetch requested before capture.")
@@ -146,70 +337,457 @@ class RaidHelperApp:
 
         template = self.url_var.get() or ""
         characters = list(self.snapshot.characters)
+        force_refresh = self.force_refresh_var.get()
+        if force_refresh and self.prefetcher is not None:
+            self.prefetcher.cancel_all()
+        else:
+            self._retain_prefetches(template, characters)
+        key = (template, tuple(info.name for info in characters))
+        if self._fetch_key is not None:
+            if key == self._fetch_key:
+                # 같은 목록을 다시 누르면 새 스레드 없이 진행 중인 작업 결과를 기다린다.
+                self._log("이미 같은 조회가 진행 중입니다. 결과를 기다립니다.")
+                logger.info("Fetch click joined the running job.")
+                return
+            self._queued_fetch = (template, characters, force_refresh, False)
+            self._log("진행 중인 조회가 끝나면 새 목록으로 다시 조회합니다.")
+            logger.info("Fetch queued behind the running job.")
+            return
+        self._start_fetch(template, characters, force_refresh)
+
+    def _start_fetch(
+        self,
+        template: str,
+        characters: list[CharacterInfo],
+        force_refresh: bool,
+        reuse_known: bool = False,
+    ) -> None:
+        self._fetch_key = (template, tuple(info.name for info in characters))
+        self._generation += 1
         self._set_status("데미지 조회 중...")
-        logger.info("Starting fetch for %s characters.", len(characters))
+        logger.info(
+            "Starting fetch for %s characters (force_refresh=%s, reuse_known=%s).",
+            len(characters),
+            force_refresh,
+            reuse_known,
+        )
         threading.Thread(
-            target=self._fetch_damage_async, args=(template, characters), daemon=True
+            target=self._fetch_damage_async,
+            args=(template, characters, force_refresh, reuse_known, self._generation),
+            daemon=True,
         ).start()
 
     def _fetch_damage_async(
-        self, template: str, characters: list[CharacterInfo]
+        self,
+        template: str,
+        characters: list[CharacterInfo],
+        force_refresh: bool = False,
+        reuse_known: bool = False,
+        generation: int = 0,
     ) -> None:
         damages: list[CharacterDamage] = []
-        for info in characters:
-            url = self._render_url(template, info.name)
-            try:
-                result = self.scraper.fetch_character_damage(
-                    url, name=info.name, job=info.job
+        failed = True
+        try:
+            damages = self._fetch_damages(
+                template, characters, force_refresh, reuse_known, generation
+            )
+            failed = False
+        except Exception as exc:  # noqa: BLE001
+            self._log(f"조회 중 오류: {exc}")
+            logger.exception("Fetch job failed.")
+        finally:
+            # 어떻게 끝나든 진행 중 표시를 풀어야 이후 조회가 끝없이 대기하지 않는다.
+            self.root.after(
+                0, self._finalize_fetch, characters, damages, failed, generation
+            )
+
+    def _fetch_damages(
+        self,
+        template: str,
+        characters: list[CharacterInfo],
+        force_refresh: bool,
+        reuse_known: bool,
+        generation: int,
+    ) -> list[CharacterDamage]:
+        all_targets = [
+            (self._render_url(template, info.name), info.name, info.job)
+            for info in characters
+        ]
+        known = dict(self._known_damages) if reuse_known else {}
+        low = {
+            index
+            for index, info in enumerate(characters)
+            if self._is_low_confidence(info)
+        }
+        skip_low = self.config.ocr_low_confidence_action == "skip"
+        # 이미 결과가 있는 공대원과 잘못 읽었을 가능성이 큰 이름은 조회하지 않는다.
+        indices = [
+            index
+            for index, info in enumerate(characters)
+            if info.name not in known and not (skip_low and index in low)
+        ]
+        targets = [all_targets[index] for index in indices]
+        prefetched = {}
+        if self.prefetcher is not None and not force_refresh:
+            for position, (url, _, _) in enumerate(targets):
+                future = self.prefetcher.take(url)
+                if future is not None:
+                    prefetched[position] = future
+        remaining = [
+            position for position in range(len(targets)) if position not in prefetched
+        ]
+        self._show_pending_rows(
+            all_targets,
+            characters,
+            use_store=not force_refresh,
+            known=known,
+            low=low if skip_low else set(),
+            generation=generation,
+        )
+        if low:
+            self._log(
+                f"인식이 불확실한 이름 {len(low)}개"
+                + ("는 조회하지 않습니다." if skip_low else "를 표시했습니다.")
+            )
+        done = {"count": 0}
+        lock = threading.Lock()
+
+        def on_result(position: int, result: FetchResult) -> None:
+            with lock:
+                done["count"] += 1
+                count = done["count"]
+            if result.ok:
+                self._known_damages[result.name] = result.damage
+                if self.ocr_engine.name_index is not None:
+                    self.ocr_engine.name_index.add(result.name)
+            index = indices[position]
+            if generation == self._generation:
+                self._set_status(f"데미지 조회 중... ({count}/{len(targets)})")
+            self._show_fetch_result(
+                index,
+                characters[index],
+                result,
+                flagged=index in low,
+                generation=generation,
+            )
+
+        for position, future in prefetched.items():
+            future.add_done_callback(
+                lambda done, position=position: on_result(
+                    position, _prefetched_result(done, targets[position])
                 )
-                damages.append(result)
-                self._log(f"{info.name}: {result.damage}")
-            except Exception as exc:  # noqa: BLE001
-                self._log(f"{info.name} 조회 실패: {exc}")
-                logger.warning("Fetch failed for %s: %s", info.name, exc)
+            )
+        if prefetched:
+            logger.info("Reusing %s prefetched lookups.", len(prefetched))
+        # 목록이 이미 확정되어 있으므로 파이프라인 대신 스크래퍼의 일괄 조회를 쓴다.
+        # asyncio 엔진은 한 이벤트 루프의 fetch_many로, 조회 서버는 /lookup/batch 한 번으로
+        # 처리해 공대원마다 따로 요청을 보내지 않는다.
+        fetched = self.scraper.fetch_many_concurrent(
+            [targets[position] for position in remaining],
+            max_workers=self.config.fetch_max_workers,
+            force_refresh=force_refresh,
+            on_result=lambda index, result: on_result(remaining[index], result),
+        )
+        results = [
+            _prefetched_result(future, targets[position])
+            for position, future in prefetched.items()
+        ]
+        results += fetched
+        if self.scraper.cache is not None:
+            logger.info(
+                "Response cache hits=%s misses=%s",
+                self.scraper.cache.hits,
+                self.scraper.cache.misses,
+            )
+
+        damages = [known[info.name] for info in characters if info.name in known]
+        damages += [result.damage for result in results if result.ok]
+        return damages
+
+    def _show_pending_rows(
+        self,
+        targets: list[tuple[str, str, str | None]],
+        characters: list[CharacterInfo],
+        *,
+        use_store: bool = True,
+        known: dict[str, CharacterDamage] | None = None,
+        low: set[int] | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """조회 전에 모든 행을 "조회 중..."으로 채운다.
+
+        디스크 저장소에 이전 결과가 있으면 그 값을 먼저 보여주고, 오래된 값은 네트워크로 갱신된다.
+        low에 든 행은 조회하지 않으므로 "인식 불확실"로 표시한다.
+        """
+
+        store = self.scraper.store if use_store else None
+        rows = []
+        stale = 0
+        for (url, _, _), info in zip(targets, characters, strict=True):
+            stored = store.get(server_from_url(url), info.name) if store else None
+            damage = _PENDING_TEXT
+            if stored is not None:
+                damage = stored.damage.damage
+                if stored.is_stale:
+                    damage += " (갱신 중)"
+                    stale += 1
+            rows.append([info.name, info.job or "", info.fame or "", damage])
+        self._set_table_rows(rows, tags=("pending",), generation=generation)
+        for index, info in enumerate(characters):
+            damage = (known or {}).get(info.name)
+            if damage is not None:
+                row = [damage.name, damage.job or "", damage.fame or "", damage.damage]
+                self._set_table_row(index, row, generation=generation)
+            elif index in (low or set()):
+                row = [info.name, info.job or "", info.fame or "", _LOW_CONFIDENCE_TEXT]
+                self._set_table_row(index, row, tags=("low",), generation=generation)
+        if store is not None:
+            logger.info(
+                "Showing stored damages; %s stale entries will be refreshed.", stale
+            )
 
-        self.root.after(0, self._finalize_fetch, characters, damages)
+    def _show_fetch_result(
+        self,
+        index: int,
+        info: CharacterInfo,
+        result: FetchResult,
+        *,
+        flagged: bool = False,
+        generation: int | None = None,
+    ) -> None:
+        """조회가 끝난 한 명의 행만 제자리에서 갱신한다(작업 스레드에서 호출)."""
+
+        if result.ok:
+            damage = result.damage
+            row = [damage.name, damage.job or "", damage.fame or "", damage.damage]
+            self._set_table_row(
+                index, row, tags=("low",) if flagged else (), generation=generation
+            )
+            self._log(f"{result.name}: {damage.damage}")
+            stats = damage.stats
+            if stats is not None:
+                logger.debug(
+                    "Fetched %s source=%s status=%s parser=%s elapsed=%.3fs",
+                    result.name,
+                    stats.source,
+                    stats.status,
+                    stats.parse_tier,
+                    stats.elapsed,
+                )
+        else:
+            row = [info.name, info.job or "", info.fame or "", "조회 실패"]
+            self._set_table_row(index, row, tags=("error",), generation=generation)
+            self._log(f"{result.name} 조회 실패: {result.error}")
+            logger.warning("Fetch failed for %s: %s", result.name, result.error)
+
+    def _should_fetch(self, info: CharacterInfo) -> bool:
+        return not (
+            self.config.ocr_low_confidence_action == "skip"
+            and self._is_low_confidence(info)
+        )
+
+    def _retain_prefetches(
+        self, template: str, characters: list[CharacterInfo]
+    ) -> None:
+        if self.prefetcher is None:
+            return
+        self.prefetcher.retain(
+            self._render_url(template, info.name)
+            for info in characters
+            if self._should_fetch(info)
+        )
+
+    def _is_low_confidence(self, info: CharacterInfo) -> bool:
+        return (
+            info.confidence is not None
+            and info.confidence < self.config.ocr_min_confidence
+        )
 
     def _finalize_fetch(
-        self, characters: list[CharacterInfo], damages: list[CharacterDamage]
+        self,
+        characters: list[CharacterInfo],
+        damages: list[CharacterDamage],
+        failed: bool = False,
+        generation: int | None = None,
     ) -> None:
+        if generation is None or generation == self._generation:
+            screenshot_path = self.snapshot.screenshot_path if self.snapshot else None
+            self.snapshot = RaidSnapshot(
+                characters=characters, screenshot_path=screenshot_path
+            )
+            self._set_status("조회 실패" if failed else "조회 완료")
+            logger.info("Fetch completed with %s results.", len(damages))
+        else:
+            # 조회 도중 다시 캡쳐하거나 초기화했다면 지금 스냅샷과 표는 새 목록의 것이다.
+            logger.info("Dropped results of a superseded fetch.")
+
+        self._fetch_key = None
+        if self._queued_fetch is not None:
+            queued, self._queued_fetch = self._queued_fetch, None
+            self._start_fetch(*queued)
+
+    def _toggle_watch(self) -> None:
+        if self.watch_var.get():
+            self.watcher.reset()
+            self._log("자동 감시를 시작합니다.")
+            logger.info(
+                "Watch mode on (interval=%.1fs, cpu_budget=%.2f).",
+                self.watcher.interval,
+                self.watcher.cpu_budget,
+            )
+            self._schedule_watch(0)
+        else:
+            self._cancel_watch()
+            self._log("자동 감시를 멈췄습니다.")
+            logger.info("Watch mode off.")
+
+    def _schedule_watch(self, delay: float) -> None:
+        if not self.watch_var.get() or self._watch_job is not None:
+            return
+        self._watch_job = self.root.after(int(delay * 1000), self._watch_tick)
+
+    def _cancel_watch(self) -> None:
+        if self._watch_job is not None:
+            self.root.after_cancel(self._watch_job)
+            self._watch_job = None
+        # 감시를 끈 뒤 늦게 끝난 주기의 결과는 반영하지 않는다.
+        self.watch_runner.cancel()
+
+    def _watch_tick(self) -> None:
+        self._watch_job = None
+        if not self.watch_var.get():
+            return
+        self.watch_runner.submit(self._watch_cycle, self._finish_watch_cycle)
+
+    def _watch_cycle(
+        self, token: CancelToken
+    ) -> tuple[list[CharacterInfo] | None, float]:
+        started = time.perf_counter()
+        characters = None
+        readings: list[list[CharacterInfo]] = []
+        # 화면이 그대로면 캡쳐 단계에서 걸러 OCR을 건너뛴다. 화면이 바뀌어도 OCR 엔진의
+        # 행 캐시(원본 픽셀 키)가 그대로인 행을 재사용하므로 새로 들어온 공대원 행만 인식한다.
+        stages = [
+            capture_stage(
+                lambda: capture.grab_region(
+                    self.config.capture_region, self.config.capture_backend
+                ),
+                keep=self.watcher.frame_changed,
+            ),
+            ocr_stage(
+                self.ocr_engine,
+                on_reading=lambda image, reading: readings.append(reading.characters),
+            ),
+        ]
+        results = Pipeline(stages).run([None], cancel=token)
+        failed = [result for result in results if not result.ok]
+        for result in failed:
+            logger.error("Watch %s stage failed.", result.stage, exc_info=result.error)
+        recognized = readings[0] if readings else []
+        if not failed and self.watcher.composition_changed(recognized):
+            characters = recognized
+        busy = time.perf_counter() - started
+        delay = self.watcher.next_delay(busy)
+        logger.debug("Watch cycle took %.3fs; next in %.1fs.", busy, delay)
+        return characters, delay
+
+    def _finish_watch_cycle(
+        self, result: tuple[list[CharacterInfo] | None, float]
+    ) -> None:
+        characters, delay = result
+        if characters is not None:
+            self._apply_watched_party(characters)
+        self._schedule_watch(delay)
+
+    def _apply_watched_party(self, characters: list[CharacterInfo]) -> None:
+        screenshot_path = self.snapshot.screenshot_path if self.snapshot else None
         self.snapshot = RaidSnapshot(
-            characters=characters, screenshot_path=self.snapshot.screenshot_path
+            characters=characters, screenshot_path=screenshot_path
         )
-        self._update_table_from_damages(damages)
-        self._set_status("조회 완료")
-        logger.info("Fetch completed with %s results.", len(damages))
+        self._log(f"공대 구성 변경 감지: {len(characters)}명")
+        logger.info("Watch detected a new party of %s characters.", len(characters))
+        template = self.url_var.get() or ""
+        if self._fetch_key is not None:
+            self._queued_fetch = (template, characters, False, True)
+            return
+        self._start_fetch(template, characters, False, reuse_known=True)
 
     def _handle_reset(self) -> None:
+        if self.capture_runner.cancel():
+            self.capture_button_var.set(_CAPTURE_TEXT)
+        if self.prefetcher is not None:
+            self.prefetcher.cancel_all()
         self.snapshot = None
+        self._queued_fetch = None
+        self._generation += 1
+        self._known_damages.clear()
+        self.watcher.reset()
         self._update_table_from_characters([])
         self._clear_log()
         self._set_status("대기 중")
 
     def _handle_exit(self) -> None:
+        self.watch_var.set(False)
+        self._cancel_watch()
+        self.capture_runner.close()
+        self.watch_runner.close()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        self.scraper.close()
+        self.ocr_engine.close()
+        self.snapshot_writer.close()
         self.root.destroy()
 
     def _render_url(self, template: str, name: str) -> str:
-        safe_name = urllib.parse.quote(name)
-        return template.replace("{name}", safe_name)
+        return character_url(template, name)
 
     def _update_table_from_characters(self, characters: list[CharacterInfo]) -> None:
         rows = [[c.name, c.job or "", c.fame or "", ""] for c in characters]
         self._set_table_rows(rows)
 
-    def _update_table_from_damages(self, damages: list[CharacterDamage]) -> None:
-        rows = [[d.name, d.job or "", d.fame or "", d.damage] for d in damages]
-        self._set_table_rows(rows)
+    def _set_table_rows(
+        self,
+        rows: list[list[str]],
+        tags: tuple[str, ...] = (),
+        *,
+        generation: int | None = None,
+    ) -> None:
+        """표 전체를 교체한다. 행 id는 순번 기반("row-0", ...)이라 이후 제자리 갱신에 쓴다.
 
-    def _set_table_rows(self, rows: list[list[str]]) -> None:
+        generation을 주면 메인 스레드에서 반영할 때 그 세대가 아직 현재인 경우에만 바꾼다.
+        """
+
+        def update():
+            if generation is not None and generation != self._generation:
+                return
+            self.table.delete(*self.table.get_children())
+            for index, row in enumerate(rows):
+                self.table.insert("", "end", iid=_row_id(index), values=row, tags=tags)
+
+        self.root.after(0, update)
+
+    def _set_table_row(
+        self,
+        index: int,
+        row: list[str],
+        tags: tuple[str, ...] = (),
+        *,
+        generation: int | None = None,
+    ) -> None:
         def update():
-            for item in self.table.get_children():
-                self.table.delete(item)
-            for row in rows:
-                self.table.insert("", "end", values=row)
+            # 조회 도중 다시 캡쳐하거나 초기화했다면 같은 순번의 행이 이제 다른 공대원이므로
+            # 늦게 도착한 이전 조회 결과는 버린다.
+            if generation is not None and generation != self._generation:
+                return
+            iid = _row_id(index)
+            if self.table.exists(iid):
+                self.table.item(iid, values=row, tags=tags)
 
         self.root.after(0, update)
 
+    def _post(self, callback, *args) -> None:
+        self.root.after(0, callback, *args)
+
     def _set_status(self, message: str) -> None:
         self.root.after(0, self.status_var.set, message)
 
@@ -231,6 +809,21 @@ class RaidHelperApp:
         self.root.after(0, clear)
 
 
+def _prefetched_result(
+    future: Future[FetchResult], target: tuple[str, str, str | None]
+) -> FetchResult:
+    # 초기화 등으로 넘겨받은 뒤에 취소된 추측 조회는 그 공대원의 실패로만 남긴다.
+    try:
+        return future.result()
+    except CancelledError as exc:
+        url, name, job = target
+        return FetchResult(name=name, url=url, job=job, error=exc)
+
+
+def _row_id(index: int) -> str:
+    return f"row-{index}"
+
+
 def main(config: AppConfig | None = None) -> None:
     app = RaidHelperApp(config or AppConfig())
     app.run()
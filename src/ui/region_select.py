@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import tkinter as tk
+from collections.abc import Callable
+
+from src.core.models import CaptureRegion
+
+# 이보다 작게 끌면 실수로 클릭한 것으로 보고 무시한다(픽셀).
+_MIN_DRAG = 10
+
+
+class RegionSelector:
+    """반투명 전체 화면 창에서 마우스로 캡쳐 영역을 지정받는다.
+
+    - 드래그한 사각형을 화면 크기에 대한 비율(CaptureRegion)로 on_selected에 넘긴다.
+    - 우클릭은 영역 해제(전체 화면 캡쳐), Esc는 취소이며 취소 시 on_selected는 호출하지 않는다.
+    """
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        on_selected: Callable[[CaptureRegion | None], None],
+        on_closed: Callable[[], None] | None = None,
+    ) -> None:
+        self._on_selected = on_selected
+        self._on_closed = on_closed
+        self._start: tuple[int, int] | None = None
+        self._rect: int | None = None
+
+        self.window = tk.Toplevel(master)
+        self.window.attributes("-fullscreen", True)
+        self.window.attributes("-topmost", True)
+        self.window.attributes("-alpha", 0.3)
+        self.window.configure(cursor="crosshair")
+
+        self.canvas = tk.Canvas(self.window, bg="black", highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.create_text(
+            20,
+            20,
+            anchor="nw",
+            fill="white",
+            font=("TkDefaultFont", 16, "bold"),
+            text="공대원 목록 영역을 드래그하세요. (우클릭: 전체 화면, Esc: 취소)",
+        )
+
+        self.canvas.bind("<ButtonPress-1>", self._handle_press)
+        self.canvas.bind("<B1-Motion>", self._handle_drag)
+        self.canvas.bind("<ButtonRelease-1>", self._handle_release)
+        self.canvas.bind("<ButtonPress-3>", lambda _event: self._finish(None))
+        self.window.bind("<Escape>", lambda _event: self._close())
+        self.window.focus_force()
+
+    def _handle_press(self, event: tk.Event) -> None:
+        self._start = (event.x, event.y)
+        if self._rect is not None:
+            self.canvas.delete(self._rect)
+        self._rect = self.canvas.create_rectangle(
+            event.x, event.y, event.x, event.y, outline="red", width=3
+        )
+
+    def _handle_drag(self, event: tk.Event) -> None:
+        if self._start is None or self._rect is None:
+            return
+        self.canvas.coords(self._rect, *self._start, event.x, event.y)
+
+    def _handle_release(self, event: tk.Event) -> None:
+        if self._start is None:
+            return
+        x0, y0 = self._start
+        self._start = None
+        left, right = sorted((x0, event.x))
+        top, bottom = sorted((y0, event.y))
+        if right - left < _MIN_DRAG or bottom - top < _MIN_DRAG:
+            return
+
+        # Tk 좌표와 캡쳐 좌표는 DPI 배율에 따라 다를 수 있어 비율로 저장한다.
+        screen_width = self.window.winfo_width() or self.window.winfo_screenwidth()
+        screen_height = self.window.winfo_height() or self.window.winfo_screenheight()
+        self._finish(
+            CaptureRegion(
+                left=left / screen_width,
+                top=top / screen_height,
+                width=(right - left) / screen_width,
+                height=(bottom - top) / screen_height,
+            )
+        )
+
+    def _finish(self, region: CaptureRegion | None) -> None:
+        self._close()
+        self._on_selected(region)
+
+    def _close(self) -> None:
+        self.window.destroy()
+        if self._on_closed is not None:
+            self._on_closed()
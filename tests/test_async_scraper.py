@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from src.core.async_scraper import AsyncDundamScraper, PooledDundamScraper
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_fetch_many_shares_client_and_keeps_order():
+    pages = {
+        "/a": "<div>총딜 12.3조</div>",
+        "/c": "<div><span>총딜</span><span>845억</span></div>",
+    }
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path not in pages:
+            return httpx.Response(404, text="not found")
+        return httpx.Response(200, text=pages[request.url.path])
+
+    async def scenario():
+        scraper = AsyncDundamScraper(_client(handler), retry_backoff=0.0)
+        first = await scraper.fetch_many(
+            [
+                ("https://example.test/a", "A", None),
+                ("https://example.test/b", "B", None),
+                ("https://example.test/c", "C", "Mage"),
+            ],
+            max_concurrency=2,
+        )
+        client = scraper.client
+        second = await scraper.fetch_many([("https://example.test/a", "A", None)])
+        assert scraper.client is client
+        await scraper.client.aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert [r.name for r in first] == ["A", "B", "C"]
+    assert [r.ok for r in first] == [True, False, True]
+    assert first[0].damage.damage == "12.3조"
+    assert first[2].damage.damage == "845억"
+    assert "404" in str(first[1].error)
+    assert second[0].damage.damage == "12.3조"
+    assert sorted(seen) == ["/a", "/a", "/b", "/c"]
+
+
+def test_async_fetch_html_retries_then_fails():
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(503, text="error")
+
+    async def scenario():
+        scraper = AsyncDundamScraper(_client(handler), max_retries=1, retry_backoff=0.0)
+        try:
+            await scraper.fetch_html("https://example.test")
+        finally:
+            await scraper.client.aclose()
+
+    with pytest.raises(RuntimeError, match="재시도 초과"):
+        asyncio.run(scenario())
+    assert calls["count"] == 2
+
+
+def test_pooled_scraper_exposes_sync_api():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<div>총딜 1,234</div>")
+
+    scraper = PooledDundamScraper(AsyncDundamScraper(_client(handler)))
+    try:
+        damage = scraper.fetch_character_damage("https://example.test", "A")
+        results = scraper.fetch_many_concurrent([("https://example.test", "B", None)])
+    finally:
+        scraper.close()
+
+    assert damage.damage == "1,234"
+    assert results[0].damage.name == "B"
+    assert not scraper.loop_thread.running
+
+
+def test_async_conditional_request_reports_not_modified():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, text="<div>총딜 845억</div>", headers={"ETag": '"v1"'}
+        )
+
+    async def scenario():
+        scraper = AsyncDundamScraper(_client(handler), conditional_requests=True)
+        try:
+            first = await scraper.fetch_character_damage("https://example.test", "A")
+            second = await scraper.fetch_character_damage("https://example.test", "A")
+        finally:
+            await scraper.client.aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.damage == second.damage == "845억"
+    assert (first.stats.status, second.stats.status) == (200, 304)
+
+
+def test_async_streaming_stops_at_damage():
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = "<div>총딜 1.5조</div>" + "<p>filler</p>" * 5000
+        return httpx.Response(200, content=body.encode())
+
+    async def scenario():
+        scraper = AsyncDundamScraper(_client(handler), stream_responses=True)
+        try:
+            return await scraper.fetch_character_damage("https://example.test", "A")
+        finally:
+            await scraper.client.aclose()
+
+    result = asyncio.run(scenario())
+
+    assert result.damage == "1.5조"
+    assert result.stats.parse_tier == "stream"
+
+
+def test_pooled_fetch_many_reports_results_through_callback():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/bad":
+            return httpx.Response(404, text="not found")
+        return httpx.Response(200, text="<div>총딜 1억</div>")
+
+    scraper = PooledDundamScraper(
+        AsyncDundamScraper(_client(handler), retry_backoff=0.0)
+    )
+    reported: list[tuple[int, str, bool]] = []
+    try:
+        scraper.fetch_many_concurrent(
+            [
+                ("https://example.test/a", "A", None),
+                ("https://example.test/bad", "B", None),
+            ],
+            on_result=lambda index, result: reported.append(
+                (index, result.name, result.ok)
+            ),
+        )
+    finally:
+        scraper.close()
+
+    assert sorted(reported) == [(0, "A", True), (1, "B", False)]
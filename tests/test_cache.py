@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from src.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries_and_counts_hits():
+    clock = FakeClock()
+    cache: TTLCache[str] = TTLCache(max_entries=4, ttl=10.0, clock=clock)
+
+    cache.set("a", "1억")
+    assert cache.get("a") == "1억"
+
+    clock.now = 11.0
+    assert cache.get("a") is None
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[int] = TTLCache(max_entries=2, ttl=None)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from src import cli
+from src.core.batch import EXIT_ALL_FAILED, EXIT_OK, EXIT_PARTIAL, EXIT_USAGE
+from src.core.scraper import DundamScraper
+
+_TEMPLATE = "https://example.test/character?name={name}"
+
+
+@pytest.fixture
+def offline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BORY_REQUEST_MAX_RETRIES", "0")
+    # 조건부 요청/스트리밍을 끄면 조회가 fetch_html 하나로 모인다.
+    monkeypatch.setenv("BORY_HTTP_CONDITIONAL_REQUESTS", "false")
+    monkeypatch.setenv("BORY_STREAM_RESPONSES", "false")
+    pages = {}
+
+    def fake_fetch_html(self, url: str) -> str:
+        if url not in pages:
+            raise ConnectionError("timeout")
+        return pages[url]
+
+    monkeypatch.setattr(DundamScraper, "fetch_html", fake_fetch_html)
+    return pages
+
+
+def test_lookup_streams_json_lines_and_reports_partial_failure(
+    offline, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    offline[_TEMPLATE.replace("{name}", "Alpha")] = "<div>총딜 12.3조</div>"
+    names = tmp_path / "roster.txt"
+    names.write_text("# 공대\nAlpha\n\nBeta\nAlpha\n", encoding="utf-8")
+
+    code = cli.main(["lookup", "--names", str(names), "--template", _TEMPLATE])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert code == EXIT_PARTIAL
+    assert sorted(record["name"] for record in records) == ["Alpha", "Beta"]
+    by_name = {record["name"]: record for record in records}
+    assert by_name["Alpha"]["damage"] == "12.3조"
+    assert by_name["Alpha"]["error"] is None
+    assert by_name["Beta"]["stage"] == "fetch"
+    assert "ConnectionError" in by_name["Beta"]["error"]
+
+
+def test_lookup_reads_stdin_and_writes_csv(
+    offline, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
+    import io
+
+    offline[_TEMPLATE.replace("{name}", "Alpha")] = "<div>총딜 845억</div>"
+    monkeypatch.setattr("sys.stdin", io.StringIO("Alpha\n"))
+
+    code = cli.main(["lookup", "--format", "csv", "--template", _TEMPLATE])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert code == EXIT_OK
+    assert lines[0].startswith("name,job,fame,damage,source")
+    assert lines[1].startswith("Alpha,,,845억,network")
+
+
+def test_lookup_exit_codes_for_empty_input_and_total_failure(
+    offline, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    import io
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n# nothing\n"))
+    assert cli.main(["lookup"]) == EXIT_USAGE
+
+    names = tmp_path / "names.txt"
+    names.write_text("Ghost\n", encoding="utf-8")
+    assert (
+        cli.main(["lookup", "--names", str(names), "--template", _TEMPLATE])
+        == EXIT_ALL_FAILED
+    )
+    missing = tmp_path / "missing.png"
+    assert cli.main(["lookup", "--image", str(missing)]) == EXIT_ALL_FAILED
+
+
+def test_lookup_reports_image_path_for_images_without_names(
+    offline,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+):
+    from PIL import Image
+    from src.core.models import CharacterInfo
+
+    class _Engine:
+        def extract_characters_from_image(self, image, *, on_character=None):
+            found = [CharacterInfo("Alpha")] if image[0, 0, 0] > 128 else []
+            for info in found:
+                on_character(info)
+            return found
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(cli, "build_ocr_engine", lambda config, names: _Engine())
+    offline[_TEMPLATE.replace("{name}", "Alpha")] = "<div>총딜 12.3조</div>"
+    party, empty = tmp_path / "party.png", tmp_path / "empty.png"
+    Image.new("RGB", (8, 8), "white").save(party)
+    Image.new("RGB", (8, 8), "black").save(empty)
+
+    code = cli.main(
+        [
+            "lookup",
+            "--image",
+            str(party),
+            "--image",
+            str(empty),
+            "--template",
+            _TEMPLATE,
+        ]
+    )
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert code == EXIT_PARTIAL
+    by_name = {record["name"]: record for record in records}
+    assert by_name["Alpha"]["damage"] == "12.3조"
+    assert by_name[str(empty)]["stage"] == "ocr"
+    assert "NoNamesRecognized" in by_name[str(empty)]["error"]
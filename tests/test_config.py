@@ -2,8 +2,9 @@ import os
 from pathlib import Path
 
 import pytest
-from src.core.config import AppConfig, load_config
+from src.core.config import AppConfig, load_config, save_config_values
 from src.core.container import create_container
+from src.core.models import CaptureRegion
 
 
 def test_load_config_prefers_env_over_file(
@@ -82,3 +83,75 @@ max_party_members=16
 
     with pytest.raises(ValueError, match="max_party_members.*1 to 12"):
         load_config(config_path=config_file, environ={})
+
+
+def test_load_config_reads_fetch_max_workers_and_rejects_zero():
+    config = load_config(environ={"BORY_FETCH_MAX_WORKERS": "6"}, search_paths=())
+    assert config.fetch_max_workers == 6
+
+    with pytest.raises(ValueError, match="fetch_max_workers.*1 to 32"):
+        load_config(environ={"BORY_FETCH_MAX_WORKERS": "0"}, search_paths=())
+
+
+def test_load_config_reads_capture_region_as_pixels_or_fractions():
+    pixels = load_config(
+        environ={"BORY_CAPTURE_REGION": "100, 200, 640, 480"}, search_paths=()
+    )
+    assert pixels.capture_region == CaptureRegion(100, 200, 640, 480)
+    assert pixels.capture_region.to_pixels(1920, 1080) == (100, 200, 640, 480)
+
+    fractions = load_config(
+        environ={"BORY_CAPTURE_REGION": "0.5,0.25,0.5,0.5"}, search_paths=()
+    )
+    assert fractions.capture_region.to_pixels(2560, 1440) == (1280, 360, 1280, 720)
+
+    assert load_config(environ={}, search_paths=()).capture_region is None
+    with pytest.raises(ValueError, match="capture_region"):
+        load_config(environ={"BORY_CAPTURE_REGION": "1,2,3"}, search_paths=())
+    with pytest.raises(ValueError, match="capture_region"):
+        load_config(environ={"BORY_CAPTURE_REGION": "0,0,0,100"}, search_paths=())
+
+
+def test_save_config_values_round_trips_capture_region(tmp_path: Path):
+    config_file = tmp_path / "bory.ini"
+    config_file.write_text("[bory]\nocr_language=kor\n")
+    region = CaptureRegion(0.1, 0.2, 0.3333333, 0.4)
+
+    save_config_values(config_file, {"capture_region": region.to_config_value()})
+    config = load_config(config_path=config_file, environ={})
+
+    assert config.ocr_language == "kor"
+    assert config.capture_region == CaptureRegion(0.1, 0.2, 0.3333, 0.4)
+
+
+def test_load_config_normalizes_capture_backend_and_snapshot_options():
+    config = load_config(
+        environ={
+            "BORY_CAPTURE_BACKEND": "MSS",
+            "BORY_SNAPSHOT_SAVE": "Full",
+            "BORY_SNAPSHOT_FORMAT": ".PNG",
+        },
+        search_paths=(),
+    )
+    assert (config.capture_backend, config.snapshot_save) == ("mss", "full")
+    assert config.snapshot_format == "png"
+
+    with pytest.raises(ValueError, match="snapshot_save"):
+        load_config(environ={"BORY_SNAPSHOT_SAVE": "always"}, search_paths=())
+
+
+def test_lookup_server_url_switches_scraper_to_remote():
+    from src.core.container import build_scraper
+    from src.core.remote import RemoteScraper
+
+    config = load_config(
+        environ={"BORY_LOOKUP_SERVER_URL": " http://127.0.0.1:8765/ "},
+        search_paths=(),
+    )
+    assert config.lookup_server_url == "http://127.0.0.1:8765/"
+    assert isinstance(build_scraper(config), RemoteScraper)
+
+    with pytest.raises(ValueError, match="lookup_server_url"):
+        load_config(environ={"BORY_LOOKUP_SERVER_URL": "127.0.0.1"}, search_paths=())
+    with pytest.raises(ValueError, match="server_port.*1 to 65535"):
+        load_config(environ={"BORY_SERVER_PORT": "70000"}, search_paths=())
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.core.damage_store import DamageStore, server_from_url
+from src.core.models import CharacterDamage
+from src.core.scraper import DundamScraper
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_damage_store_persists_and_marks_stale(tmp_path: Path):
+    clock = FakeClock()
+    path = tmp_path / "cache" / "damage.sqlite3"
+    store = DamageStore(path, stale_after=60.0, clock=clock)
+    store.put("hilder", CharacterDamage(name="보리사랑", damage="12.3조", job="버서커"))
+    store.close()
+
+    reopened = DamageStore(path, stale_after=60.0, clock=clock)
+    stored = reopened.get("hilder", "보리사랑")
+    assert stored is not None
+    assert stored.damage.damage == "12.3조"
+    assert stored.damage.job == "버서커"
+    assert not stored.is_stale
+    assert reopened.get("cain", "보리사랑") is None
+
+    clock.now += 61.0
+    assert reopened.get("hilder", "보리사랑").is_stale
+    reopened.close()
+
+
+def test_damage_store_bounds_size_under_concurrent_writers(tmp_path: Path):
+    store = DamageStore(tmp_path / "damage.sqlite3", max_entries=10)
+
+    def writer(prefix: str) -> None:
+        for i in range(20):
+            store.put("hilder", CharacterDamage(name=f"{prefix}{i}", damage="1억"))
+
+    threads = [threading.Thread(target=writer, args=(p,)) for p in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store) == 10
+    store.close()
+
+
+def test_scraper_serves_fresh_store_entries_without_network(tmp_path: Path):
+    store = DamageStore(tmp_path / "damage.sqlite3")
+    url = "https://dundam.xyz/character?server=hilder&key=A"
+    store.put(server_from_url(url), CharacterDamage(name="A", damage="845억"))
+
+    scraper = DundamScraper(session=Mock(), store=store)
+    result = scraper.fetch_character_damage(url, "A", "Mage")
+
+    assert result.damage == "845억"
+    assert result.job == "Mage"
+    scraper.session.get.assert_not_called()
+    store.close()
@@ -4,6 +4,7 @@ import urllib.parse
 
 from PIL import Image
 from src.core.ocr import OcrEngine
+from src.core.pipeline import Pipeline, capture_stage, fetch_stage, ocr_stage
 from src.core.scraper import DundamScraper
 
 
@@ -13,14 +14,16 @@ def _run_capture_ocr_fetch(
     scraper: DundamScraper,
     capture_fn,
 ):
-    image = capture_fn()
-    characters = ocr_engine.extract_characters_from_image(image)
-    damages = []
-    for info in characters:
-        url = template.replace("{name}", urllib.parse.quote(info.name))
-        damages.append(
-            scraper.fetch_character_damage(url, name=info.name, job=info.job)
-        )
+    pipeline = Pipeline(
+        [
+            capture_stage(capture_fn),
+            ocr_stage(ocr_engine),
+            fetch_stage(scraper, template),
+        ]
+    )
+    results = pipeline.run([None])
+    characters = [result.source for result in results]
+    damages = [result.value for result in results]
     return characters, damages
 
 
@@ -57,3 +60,36 @@ def test_capture_ocr_fetch_pipeline(monkeypatch):
     assert [c.job for c in characters] == ["Warrior", "Mage"]
     assert [c.fame for c in characters] == [12345, 67890]
     assert [d.damage for d in damages] == ["12.3조", "845억"]
+
+
+def test_pipeline_reports_failed_fetch_per_character(monkeypatch):
+    ocr_engine = OcrEngine()
+    monkeypatch.setattr(
+        ocr_engine,
+        "extract_text",
+        lambda _: "Alpha Warrior 12345\nBeta Mage 67890\n",
+    )
+    scraper = DundamScraper()
+    template = "https://example.test/character?name={name}"
+
+    def fake_fetch_html(url: str) -> str:
+        if "Beta" in url:
+            raise ConnectionError("timeout")
+        return "<div>총딜 12.3조</div>"
+
+    monkeypatch.setattr(scraper, "fetch_html", fake_fetch_html)
+    pipeline = Pipeline(
+        [
+            capture_stage(lambda: Image.new("RGB", (10, 10), "white")),
+            ocr_stage(ocr_engine),
+            fetch_stage(scraper, template, workers=2),
+        ]
+    )
+
+    results = pipeline.run([None])
+
+    assert [result.key for result in results] == [(0, 0, 0), (0, 0, 1)]
+    assert results[0].ok and results[0].value.damage == "12.3조"
+    assert results[1].stage == "fetch"
+    assert results[1].source.name == "Beta"
+    assert isinstance(results[1].error, ConnectionError)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import queue
+import threading
+
+import pytest
+from src.core.jobs import CancelToken, JobCancelled, JobRunner
+
+
+class _Loop:
+    """UI 스레드 역할: post된 콜백을 모아 두었다가 테스트에서 실행한다."""
+
+    def __init__(self) -> None:
+        self.calls: queue.Queue = queue.Queue()
+
+    def post(self, callback, *args) -> None:
+        self.calls.put((callback, args))
+
+    def run_one(self) -> None:
+        callback, args = self.calls.get(timeout=5)
+        callback(*args)
+
+
+def test_job_runner_rejects_second_submit_and_reports_result():
+    loop = _Loop()
+    runner: JobRunner[str] = JobRunner(loop.post)
+    release = threading.Event()
+    results: list[str] = []
+
+    assert runner.submit(lambda token: release.wait(5) and "done", results.append)
+    assert runner.busy
+    assert not runner.submit(lambda token: "second", results.append)
+
+    release.set()
+    loop.run_one()
+    runner.close()
+
+    assert results == ["done"]
+    assert not runner.busy
+
+
+def test_job_runner_cancel_drops_result_and_frees_runner():
+    loop = _Loop()
+    runner: JobRunner[str] = JobRunner(loop.post)
+    started, release = threading.Event(), threading.Event()
+    results: list[str] = []
+    stopped: list[bool] = []
+
+    def slow(token: CancelToken) -> str:
+        started.set()
+        release.wait(5)
+        try:
+            token.check()
+        except JobCancelled:
+            stopped.append(True)
+            raise
+        return "stale"
+
+    runner.submit(slow, results.append)
+    started.wait(5)
+    assert runner.cancel()
+    assert not runner.busy
+    assert runner.submit(lambda token: "fresh", results.append)
+
+    release.set()
+    loop.run_one()
+    runner.close()
+
+    assert stopped == [True]
+    assert results == ["fresh"]
+
+
+def test_job_runner_routes_errors_to_on_error():
+    loop = _Loop()
+    runner: JobRunner[str] = JobRunner(loop.post)
+    errors: list[BaseException] = []
+
+    def broken(token: CancelToken) -> str:
+        raise OSError("screen grab failed")
+
+    runner.submit(broken, lambda _: None, errors.append)
+    loop.run_one()
+    runner.close()
+
+    assert [str(exc) for exc in errors] == ["screen grab failed"]
+    with pytest.raises(JobCancelled):
+        token = CancelToken()
+        token.cancel()
+        token.check()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from src.core.damage_store import DamageStore
+from src.core.models import CharacterDamage
+from src.core.name_index import NameIndex, decompose_jamo, edit_distance
+from src.core.ocr import OcrEngine
+
+
+def test_decompose_jamo_splits_syllables_and_keeps_other_text():
+    assert decompose_jamo("보리a1") == "ㅂㅗㄹㅣa1"
+    assert decompose_jamo("닭") == "ㄷㅏㄺ"
+    # 받침 하나 차이는 음절 비교로는 1글자지만 자모로는 1개 자모 차이다.
+    assert edit_distance(decompose_jamo("보리사랑"), decompose_jamo("보라사랑")) == 1
+
+
+def test_snap_corrects_jamo_and_latin_confusions():
+    index = NameIndex(["보리사랑", "세컨캐릭", "Illusion", "Oracle0"])
+
+    assert index.snap("보리사랑") == "보리사랑"
+    assert index.snap("보리사량") == "보리사랑"
+    assert index.snap("세컨캐릭") == "세컨캐릭"
+    assert index.snap("l1lusion") == "Illusion"
+    assert index.snap("0racleO") == "Oracle0"
+    # 너무 다르거나 처음 보는 이름은 그대로 둔다.
+    assert index.snap("완전다른이름") == "완전다른이름"
+    assert len(index) == 4
+
+
+def test_snap_leaves_ambiguous_names_alone():
+    index = NameIndex(["가나다라", "가나다마"])
+
+    assert index.match("가나다바") is None
+    assert index.snap("가나다바") == "가나다바"
+
+
+def test_parse_characters_snaps_to_names_from_store(tmp_path):
+    store = DamageStore(tmp_path / "damage.sqlite3")
+    store.put("hilder", CharacterDamage(name="보리사랑", damage="1억"))
+    store.put("cain", CharacterDamage(name="보리사랑", damage="2억"))
+    store.put("hilder", CharacterDamage(name="세컨캐릭", damage="3억"))
+    assert sorted(store.known_names()) == ["보리사랑", "세컨캐릭"]
+
+    engine = OcrEngine(name_index=NameIndex(store.known_names()))
+    characters = engine.parse_characters(
+        "보리사량 버서커 45678\n세컨캐릭 마도학자 42310"
+    )
+    store.close()
+
+    assert [c.name for c in characters] == ["보리사랑", "세컨캐릭"]
+    assert characters[0].fame == 45678
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import importlib.util
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+from src.core import ocr_backends
+from src.core.cache import TTLCache
+from src.core.config import load_config
+from src.core.fingerprint import dhash
+from src.core.name_index import NameIndex
+from src.core.ocr import OcrEngine, segment_rows
+from src.core.ocr_backends import (
+    OcrOutput,
+    OcrWord,
+    PytesseractBackend,
+    TesserocrPoolBackend,
+)
+from src.core.preprocess import PreprocessPipeline
+
+
+def test_pytesseract_backend_recognizes_many_in_order(monkeypatch):
+    calls: list[tuple[int, str, str]] = []
+
+    def fake_image_to_string(image, lang, config):
+        calls.append((int(image[0, 0]), lang, config))
+        return f"text-{int(image[0, 0])}"
+
+    monkeypatch.setattr(
+        ocr_backends.pytesseract, "image_to_string", fake_image_to_string
+    )
+    backend = PytesseractBackend("kor", workers=3)
+    images = [np.full((4, 4), value, np.uint8) for value in (1, 2, 3, 4)]
+
+    try:
+        outputs = backend.recognize_many(images, psm=7)
+    finally:
+        backend.close()
+
+    assert [output.text for output in outputs] == [
+        "text-1",
+        "text-2",
+        "text-3",
+        "text-4",
+    ]
+    assert all(output.backend == "pytesseract" for output in outputs)
+    assert all(output.elapsed >= 0 for output in outputs)
+    assert sorted(calls) == [(value, "kor", "--psm 7") for value in (1, 2, 3, 4)]
+
+
+def test_ocr_engine_records_timing_for_each_call(monkeypatch):
+    monkeypatch.setattr(
+        ocr_backends.pytesseract,
+        "image_to_string",
+        lambda image, lang, config: "Alpha Warrior 12345",
+    )
+    engine = OcrEngine(language="kor")
+
+    text = engine.extract_text(Image.new("RGB", (20, 10), "white"))
+    texts = engine.extract_texts([Image.new("RGB", (20, 10), "white")] * 2, psm=7)
+
+    assert text == "Alpha Warrior 12345"
+    assert texts == ["Alpha Warrior 12345"] * 2
+    assert len(engine.timings) == 3
+    engine.close()
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("tesserocr") is not None, reason="tesserocr installed"
+)
+def test_tesserocr_backend_requires_optional_dependency():
+    with pytest.raises(RuntimeError, match="pip install tesserocr"):
+        TesserocrPoolBackend("kor")
+
+
+def test_load_config_validates_ocr_backend():
+    config = load_config(
+        environ={"BORY_OCR_BACKEND": "TesserOCR", "BORY_OCR_WORKERS": "3"},
+        search_paths=(),
+    )
+    assert config.ocr_backend == "tesserocr"
+    assert config.ocr_workers == 3
+
+    with pytest.raises(ValueError, match="ocr_backend"):
+        load_config(environ={"BORY_OCR_BACKEND": "easyocr"}, search_paths=())
+
+
+def _party_list(
+    rows: int,
+    *,
+    invert: bool = False,
+    changed_row: int | None = None,
+    names: dict[int, str] | None = None,
+) -> Image.Image:
+    background, ink = (255, 0) if invert else (30, 230)
+    image = np.full((rows * 32 + 20, 400, 3), background, np.uint8)
+    for row in range(rows):
+        name = "Newcomer" if row == changed_row else f"Name{row}"
+        name = (names or {}).get(row, name)
+        cv2.putText(
+            image,
+            f"{name} Mage 4567{row}",
+            (10, 30 + row * 32),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.7,
+            (ink, ink, ink),
+            2,
+        )
+    return Image.fromarray(image)
+
+
+@pytest.mark.parametrize("invert", [False, True])
+def test_segment_rows_finds_each_line_in_screen_order(invert):
+    engine = OcrEngine()
+    binary = engine.preprocess(_party_list(6, invert=invert))
+
+    rows = segment_rows(binary)
+
+    assert len(rows) == 6
+    assert all(top < bottom for top, bottom in rows)
+    assert all(rows[i][1] <= rows[i + 1][0] + 6 for i in range(5))
+    assert segment_rows(np.zeros((20, 20), np.uint8)) == []
+
+
+class _FakeBackend:
+    name = "fake"
+    workers = 1
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int | None]] = []
+
+    def recognize(self, image, *, psm=None, with_words=False):
+        return self.recognize_many([image], psm=psm, with_words=with_words)[0]
+
+    def recognize_many(self, images, *, psm=None, with_words=False):
+        self.calls.append((len(images), psm))
+        return [
+            OcrOutput(f"Member{index} Mage {1000 + index}", 0.01, self.name)
+            for index in range(len(images))
+        ]
+
+    def warm_up(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_row_mode_ocrs_rows_in_one_parallel_batch_with_single_line_psm():
+    backend = _FakeBackend()
+    engine = OcrEngine(backend=backend, row_mode=True)
+
+    characters = engine.extract_characters_from_image(_party_list(4))
+
+    assert backend.calls == [(4, 7)]
+    assert [c.name for c in characters] == [f"Member{i}" for i in range(4)]
+    assert [c.fame for c in characters] == [1000, 1001, 1002, 1003]
+    assert len(engine.timings) == 4
+
+
+def test_row_mode_streams_characters_per_worker_batch():
+    backend = _FakeBackend()
+    backend.workers = 2
+    engine = OcrEngine(backend=backend, row_mode=True)
+    seen: list[tuple[str, int]] = []
+
+    characters = engine.extract_characters_from_image(
+        _party_list(4),
+        on_character=lambda info: seen.append((info.name, len(backend.calls))),
+    )
+
+    assert backend.calls == [(2, 7), (2, 7)]
+    # 두 번째 묶음을 인식하기 전에 앞 두 명이 이미 넘어와 조회를 시작할 수 있다.
+    assert seen == [("Member0", 1), ("Member1", 1), ("Member0", 2), ("Member1", 2)]
+    assert [c.name for c in characters] == [name for name, _ in seen]
+
+
+def test_result_cache_skips_ocr_for_repeated_image_and_unchanged_rows():
+    backend = _FakeBackend()
+    cache: TTLCache = TTLCache(max_entries=32, ttl=None)
+    engine = OcrEngine(backend=backend, row_mode=True, result_cache=cache)
+
+    first = engine.extract_characters_from_image(_party_list(4))
+    again = engine.extract_characters_from_image(_party_list(4))
+    changed = engine.extract_characters_from_image(_party_list(4, changed_row=2))
+
+    assert backend.calls == [(4, 7), (1, 7)]
+    assert again == first
+    assert again[0] is not first[0]
+    assert [c.name for c in changed] == ["Member0", "Member1", "Member0", "Member3"]
+    assert cache.hits >= 4
+
+
+def test_result_cache_reuses_unchanged_rows_when_another_member_changes():
+    backend = _FakeBackend()
+    cache: TTLCache = TTLCache(max_entries=32, ttl=None)
+    engine = OcrEngine(backend=backend, row_mode=True, result_cache=cache)
+
+    engine.extract_characters_from_image(_party_list(2))
+    # 한 명만 바뀌면 전체 Otsu 임계값이 달라져도 나머지 행은 원본 픽셀이 같으므로 재사용한다.
+    engine.extract_characters_from_image(_party_list(2, names={0: "Name8"}))
+
+    assert backend.calls == [(2, 7), (1, 7)]
+
+
+def test_result_cache_misses_when_a_single_digit_changes():
+    backend = _FakeBackend()
+    cache: TTLCache = TTLCache(max_entries=32, ttl=None)
+    engine = OcrEngine(backend=backend, row_mode=True, result_cache=cache)
+
+    # 두 행은 64×8 dHash가 같다. 글자 하나만 달라도 다른 공대원이므로 재사용하면 안 된다.
+    engine.extract_characters_from_image(_party_list(1, names={0: "Name1"}))
+    engine.extract_characters_from_image(_party_list(1, names={0: "Name7"}))
+    engine.extract_characters_from_image(_party_list(1, names={0: "Name7"}))
+
+    assert backend.calls == [(1, 7), (1, 7)]
+
+
+def test_dhash_changes_with_text_but_not_with_identical_capture():
+    first = np.array(_party_list(2))
+    same = np.array(_party_list(2))
+    different = np.array(_party_list(2, changed_row=0))
+
+    assert dhash(first) == dhash(same)
+    assert dhash(first, width=64) != dhash(different, width=64)
+    assert dhash(first[:20]) != dhash(first)
+
+
+def test_pytesseract_word_data_carries_confidence_and_boxes(monkeypatch):
+    data = {
+        "text": ["", "Alpha", "Mage", "  "],
+        "conf": ["-1", "91.5", "70", "-1"],
+        "left": [0, 4, 60, 0],
+        "top": [0, 2, 3, 0],
+        "width": [100, 50, 40, 0],
+        "height": [20, 16, 15, 0],
+    }
+    monkeypatch.setattr(
+        ocr_backends.pytesseract, "image_to_data", lambda image, **kwargs: data
+    )
+
+    output = PytesseractBackend("kor").recognize(
+        np.zeros((20, 100), np.uint8), psm=7, with_words=True
+    )
+
+    assert output.text == "Alpha Mage"
+    assert [(w.text, w.left, w.width) for w in output.words] == [
+        ("Alpha", 4, 50),
+        ("Mage", 60, 40),
+    ]
+    assert output.confidence == pytest.approx(0.8075)
+
+
+class _ConfidenceBackend(_FakeBackend):
+    """첫 인식에서는 2번 행만 신뢰도가 낮고, 재인식하면 올바르게 읽는다."""
+
+    def recognize_many(self, images, *, psm=None, with_words=False):
+        self.calls.append((len(images), psm))
+        retry = len(self.calls) > 1
+        outputs = []
+        for index, image in enumerate(images):
+            low = not retry and index == 2
+            name = "Garb@ge" if low else f"Member{index}"
+            width = image.shape[1]
+            words = [
+                OcrWord(name, 30.0 if low else 95.0, 10, 2, width // 3, 20),
+                OcrWord("Mage", 30.0 if low else 90.0, width // 2, 2, 40, 20),
+            ]
+            outputs.append(OcrOutput(f"{name} Mage 100", 0.01, self.name, words))
+        return outputs
+
+
+def test_row_mode_reports_confidence_bbox_and_retries_only_low_rows():
+    backend = _ConfidenceBackend()
+    engine = OcrEngine(
+        backend=backend,
+        row_mode=True,
+        retry_confidence=0.6,
+        retry_preprocessor=PreprocessPipeline("upscale:2,gray,otsu"),
+    )
+
+    characters = engine.extract_characters_from_image(_party_list(4))
+
+    assert backend.calls == [(4, 7), (1, 7)]
+    assert [c.name for c in characters] == ["Member0", "Member1", "Member0", "Member3"]
+    assert characters[2].confidence == pytest.approx(0.925)
+    tops = [c.bbox[1] for c in characters]
+    assert tops == sorted(tops)
+    assert all(c.bbox[0] == 10 and 0 < c.bbox[2] <= 400 for c in characters)
+
+
+class _NamesBackend(_FakeBackend):
+    def __init__(self, names: list[str]) -> None:
+        super().__init__()
+        self.names = names
+
+    def recognize_many(self, images, *, psm=None, with_words=False):
+        self.calls.append((len(images), psm))
+        return [
+            OcrOutput(
+                f"{name} Mage 100",
+                0.01,
+                self.name,
+                [
+                    OcrWord(name, 95.0, 10, 2, 80, 20),
+                    OcrWord("Mage", 95.0, 100, 2, 40, 20),
+                ],
+            )
+            for name in self.names[: len(images)]
+        ]
+
+
+def test_snapped_names_keep_a_confidence_below_the_threshold():
+    backend = _NamesBackend(["Alphonse", "Alphonze"])
+    engine = OcrEngine(
+        backend=backend,
+        row_mode=True,
+        name_index=NameIndex(["Alphonse"], min_confidence=0.75),
+    )
+
+    exact, snapped = engine.extract_characters_from_image(_party_list(2))
+
+    assert exact.name == snapped.name == "Alphonse"
+    assert exact.confidence == 1.0
+    # 글자 하나를 고쳤으므로 OCR 신뢰도(0.95)보다 낮은 일치 신뢰도(7/8)를 쓴다.
+    assert snapped.confidence == pytest.approx(0.875)
+    assert snapped.confidence < 0.9
+
+
+def test_row_mode_maps_boxes_and_retry_strips_through_a_crop_stage():
+    backend = _ConfidenceBackend()
+    retried: list[np.ndarray] = []
+    original = backend.recognize_many
+
+    def recognize_many(images, *, psm=None, with_words=False):
+        if backend.calls:
+            retried.extend(images)
+        return original(images, psm=psm, with_words=with_words)
+
+    backend.recognize_many = recognize_many
+    engine = OcrEngine(
+        backend=backend,
+        row_mode=True,
+        preprocessor=PreprocessPipeline("crop:0.5:0:0.5:1,gray,otsu"),
+        retry_confidence=0.6,
+        retry_preprocessor=PreprocessPipeline("gray"),
+    )
+    # 공대원 목록을 오른쪽 절반에 두고 전처리 crop으로 그 부분만 읽는다.
+    image = np.zeros((148, 800, 3), np.uint8)
+    image[:, 400:] = np.array(_party_list(4))
+    rows = segment_rows(engine.preprocess(image))
+
+    characters = engine.extract_characters_from_image(image)
+
+    assert all(c.bbox[0] == 410 for c in characters)
+    assert [c.bbox[1] for c in characters] == [top for top, _ in rows]
+    # 재인식한 행은 crop 안의 같은 행(오른쪽 절반)이어야 한다.
+    top, bottom = rows[2]
+    expected = cv2.cvtColor(image[top:bottom, 400:], cv2.COLOR_RGB2GRAY)
+    assert len(retried) == 1
+    assert np.array_equal(retried[0], expected)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+from PIL import Image
+from src.core.ocr import OcrEngine
+from src.core.panel_detect import PanelDetector
+
+
+def _screenshot(x: int, y: int) -> Image.Image:
+    image = np.full((720, 1280, 3), 40, np.uint8)
+    for row in range(8):
+        cv2.putText(
+            image,
+            f"Name{row} Berserker 4567{row}",
+            (x + 10, y + 30 + row * 32),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.8,
+            (230, 230, 230),
+            2,
+        )
+    return Image.fromarray(image)
+
+
+def _contains(box, x: int, y: int, width: int, height: int) -> bool:
+    left, top, box_width, box_height = box
+    return (
+        left <= x
+        and top <= y
+        and left + box_width >= x + width
+        and top + box_height >= y + height
+    )
+
+
+def test_detect_finds_text_panel_and_ignores_blank_screens():
+    detector = PanelDetector(downscale_width=640)
+
+    box = detector.detect(_screenshot(100, 150))
+
+    assert box is not None
+    assert _contains(box, 115, 160, 250, 240)
+    assert box[2] * box[3] < 0.2 * 1280 * 720
+    assert detector.detect(Image.new("RGB", (200, 100), "white")) is None
+
+
+def test_locate_reuses_cached_box_until_panel_moves():
+    detector = PanelDetector(downscale_width=640)
+
+    first = detector.locate(_screenshot(100, 150))
+    second = detector.locate(_screenshot(100, 150))
+    moved = detector.locate(_screenshot(700, 300))
+
+    assert first == second
+    assert (detector.cache_hits, detector.cache_misses) == (1, 2)
+    assert moved != first
+    assert _contains(moved, 715, 310, 250, 240)
+
+
+def test_ocr_engine_only_passes_detected_crop_to_tesseract(monkeypatch):
+    engine = OcrEngine(panel_detector=PanelDetector(downscale_width=640))
+    sizes: list[tuple[int, int]] = []
+
+    def fake_extract_text(image) -> str:
+        height, width = np.asarray(image).shape[:2]
+        sizes.append((width, height))
+        return "Alpha Warrior 12345\n"
+
+    monkeypatch.setattr(engine, "extract_text", fake_extract_text)
+
+    characters = engine.extract_characters_from_image(_screenshot(100, 150))
+
+    assert [c.name for c in characters] == ["Alpha"]
+    assert sizes[0][0] < 1280 and sizes[0][1] < 720
+
+
+def test_ocr_engine_crops_numpy_capture_without_copying(monkeypatch):
+    engine = OcrEngine(panel_detector=PanelDetector(downscale_width=640))
+    capture = np.asarray(_screenshot(100, 150))
+    seen: list[np.ndarray] = []
+
+    def fake_extract_text(image) -> str:
+        seen.append(image)
+        return "Alpha Warrior 12345\n"
+
+    monkeypatch.setattr(engine, "extract_text", fake_extract_text)
+
+    characters = engine.extract_characters_from_image(capture)
+
+    assert [c.name for c in characters] == ["Alpha"]
+    assert seen[0].shape[:2] < capture.shape[:2]
+    assert np.shares_memory(seen[0], capture)
+
+
+def test_read_panel_keeps_its_own_box_when_detector_moves_on(monkeypatch):
+    engine = OcrEngine(panel_detector=PanelDetector(downscale_width=640))
+    monkeypatch.setattr(engine, "extract_text", lambda image: "Alpha Warrior 12345\n")
+
+    reading = engine.read_panel(_screenshot(100, 150))
+    # 다른 스레드(감시 모드)가 같은 탐지기로 다른 위치의 프레임을 읽은 경우
+    engine.read_panel(_screenshot(700, 300))
+
+    assert _contains(reading.panel_box, 115, 160, 250, 240)
+    assert engine.panel_detector.last_box != reading.panel_box
+    assert [c.name for c in reading.characters] == ["Alpha"]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from src.core.jobs import CancelToken, JobCancelled
+from src.core.pipeline import Pipeline, Stage
+
+
+def test_pipeline_fans_out_and_keeps_input_order():
+    pipeline = Pipeline(
+        [
+            Stage(
+                "split",
+                lambda text, emit: [emit(word) for word in text.split()],
+                fan_out=True,
+            ),
+            Stage("upper", str.upper, workers=3),
+        ]
+    )
+
+    results = pipeline.run(["a b", "", "c"])
+
+    assert [result.key for result in results] == [(0, 0), (0, 1), (2, 0)]
+    assert [result.value for result in results] == ["A", "B", "C"]
+    assert [result.source for result in results] == ["a", "b", "c"]
+
+
+def test_pipeline_error_skips_later_stages_for_that_item_only():
+    seen: list[int] = []
+
+    def parse(value: str) -> int:
+        return int(value)
+
+    def record(value: int) -> int:
+        seen.append(value)
+        return value * 2
+
+    pipeline = Pipeline([Stage("parse", parse), Stage("double", record)])
+
+    results = pipeline.run(["1", "x", "3"])
+
+    assert [result.value for result in results] == [2, None, 6]
+    assert results[1].stage == "parse" and results[1].source == "x"
+    assert isinstance(results[1].error, ValueError)
+    assert sorted(seen) == [1, 3]
+
+
+def test_pipeline_stage_workers_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait(value: int) -> int:
+        barrier.wait()
+        return value
+
+    results = Pipeline([Stage("wait", wait, workers=3)]).run(range(3))
+
+    assert [result.value for result in results] == [0, 1, 2]
+
+
+def test_pipeline_applies_backpressure_to_fast_stages():
+    release = threading.Event()
+    produced: list[int] = []
+
+    def produce(value: int) -> int:
+        produced.append(value)
+        return value
+
+    pipeline = Pipeline(
+        [
+            Stage("produce", produce, queue_size=1),
+            Stage("slow", lambda value: release.wait(5) and value, queue_size=1),
+        ]
+    )
+    stream = pipeline.stream(range(100))
+    consumer = threading.Thread(target=lambda: list(stream))
+    consumer.start()
+    time.sleep(0.3)
+    backlog = len(produced)
+    release.set()
+    consumer.join(5)
+
+    # 느린 단계 앞에는 큐 크기만큼만 쌓이고 나머지 입력은 읽히지도 않는다.
+    assert backlog <= 4
+    assert len(produced) == 100
+
+
+def test_pipeline_cancel_stops_stages_and_raises():
+    token = CancelToken()
+    processed: list[int] = []
+
+    def step(value: int) -> int:
+        processed.append(value)
+        if value == 2:
+            token.cancel()
+        time.sleep(0.01)
+        return value
+
+    with pytest.raises(JobCancelled):
+        Pipeline([Stage("step", step, queue_size=1)]).run(range(1000), cancel=token)
+
+    assert len(processed) < 10
+
+
+def test_ocr_stage_reports_screen_order_separately_from_emission_order():
+    from src.core.models import CharacterInfo
+    from src.core.ocr import PanelReading
+    from src.core.pipeline import ocr_stage
+
+    class _Engine:
+        def read_panel(self, image, *, on_character=None):
+            screen = [CharacterInfo(name) for name in ("Alpha", "Delta", "Charlie")]
+            # 캐시에 있던 행이 먼저, 새로 읽은 행이 나중에 나온다.
+            for index in (2, 0, 1):
+                on_character(screen[index])
+            return PanelReading(screen, (1, 2, 3, 4))
+
+    readings = []
+    results = Pipeline(
+        [ocr_stage(_Engine(), on_reading=lambda image, found: readings.append(found))]
+    ).run(["frame"])
+
+    assert [result.value.name for result in results] == ["Charlie", "Alpha", "Delta"]
+    assert [[info.name for info in found.characters] for found in readings] == [
+        ["Alpha", "Delta", "Charlie"]
+    ]
+    assert readings[0].panel_box == (1, 2, 3, 4)
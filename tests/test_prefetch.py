@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+
+from src.core.models import CharacterDamage
+from src.core.prefetch import Prefetcher
+
+
+class _BlockingScraper:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def fetch_character_damage(self, url, name, job=None, *, force_refresh=False):
+        with self.lock:
+            self.calls.append(name)
+        self.release.wait(5)
+        if name == "Broken":
+            raise ConnectionError("timeout")
+        return CharacterDamage(name=name, job=job, damage="12.3조")
+
+
+def test_prefetcher_dedupes_requests_and_hands_over_results():
+    scraper = _BlockingScraper()
+    prefetcher = Prefetcher(scraper, max_workers=2)
+
+    assert prefetcher.request("u/alpha", "Alpha", "Mage")
+    assert not prefetcher.request("u/alpha", "Alpha", "Mage")
+    prefetcher.request("u/broken", "Broken")
+    scraper.release.set()
+
+    future = prefetcher.take("u/alpha")
+    assert future is not None and future.result().damage.damage == "12.3조"
+    assert prefetcher.take("u/alpha") is None
+    broken = prefetcher._futures["u/broken"]
+    broken.result()
+    # 실패한 추측 조회는 넘기지 않아 실제 조회에서 다시 시도한다.
+    assert prefetcher.take("u/broken") is None
+    prefetcher.close()
+    assert scraper.calls.count("Alpha") == 1
+
+
+def test_prefetcher_retain_cancels_queued_lookups_for_dropped_names():
+    scraper = _BlockingScraper()
+    prefetcher = Prefetcher(scraper, max_workers=1)
+    for name in ("Alpha", "Misread", "Gamma"):
+        prefetcher.request(f"u/{name}", name)
+
+    dropped = prefetcher.retain(["u/Alpha", "u/Gamma"])
+    scraper.release.set()
+    results = [prefetcher.take(url).result().name for url in ("u/Alpha", "u/Gamma")]
+    prefetcher.close()
+
+    assert dropped == 1
+    assert results == ["Alpha", "Gamma"]
+    assert "Misread" not in scraper.calls
+    assert prefetcher.pending() == 0
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+from src.core.ocr_backends import OcrOutput
+from src.core.ocr_bench import format_report, load_fixtures, run_benchmark
+from src.core.preprocess import PreprocessPipeline
+
+
+def _gradient_with_text() -> np.ndarray:
+    ramp = np.linspace(20, 200, 300, dtype=np.uint8)
+    image = np.dstack([np.tile(ramp, (60, 1))] * 3)
+    cv2.putText(
+        image, "Alpha", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (250, 220, 90), 2
+    )
+    return image
+
+
+def test_default_spec_matches_gray_otsu():
+    image = _gradient_with_text()
+    gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    _, expected = cv2.threshold(gray, 0, 255, cv2.THRESH_OTSU | cv2.THRESH_BINARY)
+
+    assert np.array_equal(PreprocessPipeline()(image), expected)
+
+
+def test_stages_crop_upscale_and_color_key():
+    image = _gradient_with_text()
+
+    cropped = PreprocessPipeline("crop:0:0:0.5:1")(image)
+    upscaled = PreprocessPipeline("upscale:3,gray")(image)
+    keyed = PreprocessPipeline("colorkey:#fadc5a:30,open:1")(image)
+
+    assert cropped.shape == (60, 150, 3)
+    assert upscaled.shape == (180, 900)
+    # 글자색 픽셀만 검은색으로 남고 그라데이션 배경은 모두 흰색이 된다.
+    assert keyed.dtype == np.uint8
+    assert 0 < np.count_nonzero(keyed == 0) < keyed.size * 0.2
+    assert (keyed[:, 250:] == 255).all()
+
+
+def test_geometry_maps_output_back_through_crop_and_upscale():
+    pipeline = PreprocessPipeline("upscale:2,crop:0.5:0.25:0.5:0.5,gray,otsu")
+    image = _gradient_with_text()
+
+    geometry = pipeline.geometry(image.shape)
+    output = pipeline(image)
+
+    # 확대 후 (300, 30)에서 잘랐으므로 원본 기준 원점은 (150, 15), 결과 1픽셀은 원본 0.5픽셀
+    assert (geometry.offset_x, geometry.offset_y) == (150, 15)
+    assert (geometry.scale_x, geometry.scale_y) == (0.5, 0.5)
+    assert output.shape[1] * geometry.scale_x == 150
+    assert PreprocessPipeline().geometry(image.shape).offset_x == 0
+
+
+def test_run_timed_reports_every_stage_and_rejects_bad_specs():
+    _, timings = PreprocessPipeline("gray,adaptive:15:5,close:2").run_timed(
+        _gradient_with_text()
+    )
+
+    assert [timing.stage for timing in timings] == ["gray", "adaptive:15:5", "close:2"]
+    assert all(timing.elapsed >= 0 for timing in timings)
+    with pytest.raises(ValueError, match="Unknown"):
+        PreprocessPipeline("gray,sharpen")
+    with pytest.raises(ValueError, match="Invalid"):
+        PreprocessPipeline("adaptive:4")
+    with pytest.raises(ValueError, match="at least one"):
+        PreprocessPipeline(" , ")
+
+
+class _ScriptedBackend:
+    name = "scripted"
+    workers = 1
+
+    def recognize(self, image, *, psm=None, with_words=False):
+        # 입력이 너무 크면(전처리 실패로 잡음이 많다고 가정) 이름 하나를 놓친다.
+        text = "Alpha Mage 100\nBeta Mage 200" if image.shape[1] < 400 else "Alpha"
+        return OcrOutput(text, 0.0, self.name)
+
+    def recognize_many(self, images, *, psm=None, with_words=False):
+        return [self.recognize(image, psm=psm) for image in images]
+
+    def warm_up(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_benchmark_reports_accuracy_and_stage_times(tmp_path):
+    Image.fromarray(_gradient_with_text()).save(tmp_path / "party1.png")
+    (tmp_path / "party1.txt").write_text("Alpha\nBeta\n", encoding="utf-8")
+    Image.new("RGB", (10, 10)).save(tmp_path / "no_expectation.png")
+
+    fixtures = load_fixtures(tmp_path)
+    results = run_benchmark(
+        ["gray,otsu", "upscale:2,gray,otsu"], fixtures, _ScriptedBackend()
+    )
+
+    assert [fixture.image_path.name for fixture in fixtures] == ["party1.png"]
+    assert [result.accuracy for result in results] == [1.0, 0.5]
+    assert list(results[1].stage_seconds) == ["upscale:2", "gray", "otsu"]
+    report = format_report(results)
+    assert "accuracy=100.0% (2/2)" in report
+    assert "upscale:2" in report
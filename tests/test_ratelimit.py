@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from src.core.config import AppConfig
+from src.core.ratelimit import (
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    RequestGuard,
+    parse_retry_after,
+    reset_shared_guards,
+    shared_request_guard,
+)
+from src.core.scraper import DundamScraper
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_limiter_spaces_requests_after_burst():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=2, clock=clock)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+
+    clock.now += 1.5
+    assert limiter.reserve() == 0.0
+
+
+def test_rate_limiter_backs_off_on_throttle_and_honors_retry_after():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(rate=4.0, burst=4, min_rate=1.0, clock=clock)
+
+    limiter.on_throttle(retry_after=3.0)
+    state = limiter.snapshot()
+    assert state.rate == 2.0
+    assert state.blocked_for == pytest.approx(3.0)
+    assert limiter.reserve() == pytest.approx(3.0)
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.snapshot().rate == 1.0
+    limiter.on_success()
+    assert limiter.snapshot().rate == pytest.approx(1.4)
+
+
+def test_circuit_breaker_opens_and_allows_single_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.snapshot().state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.now += 10.0
+    breaker.before_request()
+    assert breaker.snapshot().state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.snapshot().state == "closed"
+
+
+def test_scraper_fails_fast_while_circuit_is_open():
+    clock = FakeClock()
+    response = SimpleNamespace(status_code=503, text="error", headers={})
+    response.raise_for_status = Mock()
+    session = Mock()
+    session.get = Mock(return_value=response)
+    guard = RequestGuard(
+        AdaptiveRateLimiter(rate=1000.0, burst=100, clock=clock),
+        CircuitBreaker(failure_threshold=2, reset_timeout=30.0, clock=clock),
+    )
+    scraper = DundamScraper(
+        session=session, max_retries=5, retry_backoff=0.0, guard=guard
+    )
+
+    with pytest.raises(CircuitOpenError):
+        scraper.fetch_html("https://example.test/a")
+    assert session.get.call_count == 2
+
+    with pytest.raises(CircuitOpenError):
+        scraper.fetch_html("https://example.test/b")
+    assert session.get.call_count == 2
+
+
+def test_shared_request_guard_is_shared_per_host():
+    reset_shared_guards()
+    try:
+        first = shared_request_guard(AppConfig())
+        second = shared_request_guard(AppConfig(rate_limit_burst=9))
+        assert first is second
+        assert shared_request_guard(AppConfig(rate_limit_per_second=0)) is None
+    finally:
+        reset_shared_guards()
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_cancelled_half_open_trial_lets_the_next_request_try():
+    import asyncio
+
+    import httpx
+    from src.core.async_scraper import AsyncDundamScraper
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    guard = RequestGuard(AdaptiveRateLimiter(rate=1000.0, burst=100), breaker)
+    breaker.record_failure()
+    clock.now += 10.0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(10)
+        return httpx.Response(200, text="ok")
+
+    async def scenario():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper = AsyncDundamScraper(client, guard=guard)
+        trial = asyncio.create_task(scraper.fetch_html("https://example.test/a"))
+        await asyncio.sleep(0.01)
+        assert breaker.snapshot().state == "half_open"
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+    # 취소된 시험 요청이 자리를 돌려놓았으므로 다음 요청이 시험 요청이 된다.
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.snapshot().state == "closed"
+
+
+def test_cancel_during_rate_limit_wait_releases_the_half_open_trial():
+    import asyncio
+
+    import httpx
+    from src.core.async_scraper import AsyncDundamScraper
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    limiter = AdaptiveRateLimiter(rate=1.0, burst=1, min_rate=0.1, clock=clock)
+    guard = RequestGuard(limiter, breaker)
+    breaker.record_failure()
+    clock.now += 10.0
+    # 토큰을 미리 써 두어 다음 요청이 속도 제한 대기에 걸리게 한다.
+    limiter.reserve()
+    sent: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(str(request.url))
+        return httpx.Response(200, text="ok")
+
+    async def scenario():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper = AsyncDundamScraper(client, guard=guard)
+        trial = asyncio.create_task(scraper.fetch_html("https://example.test/a"))
+        await asyncio.sleep(0.01)
+        assert breaker.snapshot().state == "half_open"
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        assert sent == []
+
+        # 대기 중에 취소된 요청이 시험 자리를 돌려놓았으므로 다음 요청이 시험한다.
+        clock.now += 10.0
+        assert await scraper.fetch_html("https://example.test/b") == "ok"
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+    assert sent == ["https://example.test/b"]
+    assert breaker.snapshot().state == "closed"
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 import requests
-from src.core.scraper import DundamScraper
+from src.core.cache import TTLCache
+from src.core.scraper import (
+    DundamScraper,
+    parse_total_damage_with_tier,
+    scan_damage_stream,
+)
 
 
 def test_parse_total_damage_basic():
@@ -33,11 +39,29 @@ def test_parse_total_damage_missing():
         scraper.parse_total_damage("<html><body>데미지 없음</body></html>")
 
 
+def test_parse_total_damage_tiers():
+    assert parse_total_damage_with_tier("<div>총딜 12.3조</div>") == ("12.3조", "regex")
+
+    padded_attr = "x" * 600
+    subtree_html = (
+        f'<div><span>총딜</span><span data-blob="{padded_attr}">845억</span></div>'
+    )
+    assert parse_total_damage_with_tier(subtree_html) == ("845억", "lxml")
+
+    far_html = "<div><span>총딜</span>" + "<i></i>" * 1000 + "<b>7억</b></div>"
+    assert parse_total_damage_with_tier(far_html) == ("7억", "soup")
+
+
+def test_parse_total_damage_ignores_marker_inside_attributes():
+    html = '<meta content="총딜 1억"><div>총딜: 2억</div>'
+    assert parse_total_damage_with_tier(html) == ("2억", "regex")
+
+
 def test_fetch_html_retries_on_server_error():
-    response_ok = SimpleNamespace(status_code=200, text="ok")
+    response_ok = SimpleNamespace(status_code=200, text="ok", headers={})
     response_ok.raise_for_status = Mock()
 
-    response_err = SimpleNamespace(status_code=500, text="error")
+    response_err = SimpleNamespace(status_code=500, text="error", headers={})
     response_err.raise_for_status = Mock()
 
     session = Mock()
@@ -52,7 +76,7 @@ def test_fetch_html_retries_on_server_error():
 
 
 def test_fetch_html_fails_fast_on_client_error():
-    response = SimpleNamespace(status_code=404, text="not found")
+    response = SimpleNamespace(status_code=404, text="not found", headers={})
     response.raise_for_status = Mock(side_effect=requests.HTTPError(response=response))
 
     session = Mock()
@@ -68,7 +92,7 @@ def test_fetch_html_fails_fast_on_client_error():
 
 
 def test_fetch_html_raises_after_retries():
-    response = SimpleNamespace(status_code=503, text="error")
+    response = SimpleNamespace(status_code=503, text="error", headers={})
     response.raise_for_status = Mock(
         side_effect=requests.HTTPError("Server error", response=response)
     )
@@ -83,3 +107,186 @@ def test_fetch_html_raises_after_retries():
     with pytest.raises(RuntimeError, match="재시도 초과"):
         scraper.fetch_html("https://example.test")
     assert session.get.call_count == 2
+
+
+def test_fetch_many_concurrent_keeps_order_and_collects_errors(monkeypatch):
+    scraper = DundamScraper(max_workers=3)
+    html_map = {
+        "https://example.test/a": "<div>총딜 12.3조</div>",
+        "https://example.test/c": "<div>총딜 845억</div>",
+    }
+
+    def fake_fetch_html(url):
+        if url not in html_map:
+            raise RuntimeError(f"요청 실패(404): {url}")
+        return html_map[url]
+
+    monkeypatch.setattr(scraper, "fetch_html", fake_fetch_html)
+
+    results = scraper.fetch_many_concurrent(
+        [
+            ("https://example.test/a", "A", "Warrior"),
+            ("https://example.test/b", "B", None),
+            ("https://example.test/c", "C", "Mage"),
+        ]
+    )
+
+    assert [r.name for r in results] == ["A", "B", "C"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].damage.damage == "12.3조"
+    assert results[0].damage.job == "Warrior"
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[2].damage.damage == "845억"
+
+
+def test_fetch_many_concurrent_retries_each_request():
+    response_ok = SimpleNamespace(
+        status_code=200, text="<div>총딜 1억</div>", headers={}
+    )
+    response_ok.raise_for_status = Mock()
+    response_err = SimpleNamespace(status_code=502, text="error", headers={})
+    response_err.raise_for_status = Mock()
+
+    session = Mock()
+    session.get = Mock(side_effect=[response_err, response_ok])
+
+    scraper = DundamScraper(
+        session=session, request_timeout=1.0, max_retries=1, retry_backoff=0.0
+    )
+
+    results = scraper.fetch_many_concurrent([("https://example.test", "A", None)])
+
+    assert results[0].ok
+    assert results[0].damage.damage == "1억"
+    assert session.get.call_count == 2
+
+
+def test_fetch_character_damage_uses_cache_unless_forced(monkeypatch):
+    scraper = DundamScraper(cache=TTLCache(max_entries=8, ttl=60.0))
+    fetch_html = Mock(return_value="<div>총딜 12.3조</div>")
+    monkeypatch.setattr(scraper, "fetch_html", fetch_html)
+
+    first = scraper.fetch_character_damage("https://example.test/a", "A")
+    second = scraper.fetch_character_damage("https://example.test/a", "A", "Mage")
+    forced = scraper.fetch_character_damage(
+        "https://example.test/a", "A", force_refresh=True
+    )
+
+    assert first.damage == second.damage == forced.damage == "12.3조"
+    assert second.job == "Mage"
+    assert fetch_html.call_count == 2
+    assert scraper.cache.hits == 1
+
+
+def test_fetch_character_damage_reuses_parsed_value_on_not_modified(monkeypatch):
+    response_ok = SimpleNamespace(
+        status_code=200,
+        text="<div>총딜 12.3조</div>",
+        headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"},
+    )
+    response_ok.raise_for_status = Mock()
+    response_304 = SimpleNamespace(status_code=304, text="", headers={})
+    response_304.raise_for_status = Mock()
+
+    session = Mock()
+    session.get = Mock(side_effect=[response_ok, response_304])
+    scraper = DundamScraper(session=session, conditional_requests=True)
+    parse = Mock(wraps=scraper.parse_total_damage_with_tier)
+    monkeypatch.setattr(scraper, "parse_total_damage_with_tier", parse)
+
+    first = scraper.fetch_character_damage("https://example.test/a", "A")
+    second = scraper.fetch_character_damage("https://example.test/a", "A")
+
+    assert first.damage == second.damage == "12.3조"
+    assert (first.stats.status, second.stats.status) == (200, 304)
+    assert parse.call_count == 1
+    second_headers = session.get.call_args_list[1].kwargs["headers"]
+    assert second_headers["If-None-Match"] == '"v1"'
+    assert second_headers["If-Modified-Since"] == "Wed, 01 Oct 2025 00:00:00 GMT"
+
+
+def test_scan_damage_stream_waits_for_split_marker_and_number():
+    chunks = ["<div><span>총", "딜</span> <span>12.", "3조</span>", "<p>rest</p>"]
+    assert scan_damage_stream(iter(chunks)) == ("12.3조", "stream")
+
+
+def test_scan_damage_stream_falls_back_to_full_parse():
+    far_html = "<div><span>총딜</span>" + "<i></i>" * 1000 + "<b>7억</b></div>"
+    chunks = [far_html[i : i + 100] for i in range(0, len(far_html), 100)]
+    assert scan_damage_stream(iter(chunks)) == ("7억", "soup")
+
+
+def test_fetch_character_damage_stops_reading_stream_early():
+    consumed: list[bytes] = []
+
+    def iter_content(chunk_size):
+        yield "<html><div>총딜 845억</div>".encode()
+        for _ in range(100):
+            chunk = b"<p>" + b"x" * 1000 + b"</p>"
+            consumed.append(chunk)
+            yield chunk
+
+    response = SimpleNamespace(
+        status_code=200, encoding="utf-8", headers={}, iter_content=iter_content
+    )
+    response.raise_for_status = Mock()
+    response.close = Mock()
+    session = Mock()
+    session.get = Mock(return_value=response)
+
+    scraper = DundamScraper(session=session, stream_responses=True)
+    result = scraper.fetch_character_damage("https://example.test/a", "A")
+
+    assert result.damage == "845억"
+    assert result.stats.parse_tier == "stream"
+    assert len(consumed) <= 1
+    response.close.assert_called()
+    assert session.get.call_args.kwargs["stream"] is True
+
+
+def test_fetch_html_retries_after_too_many_requests():
+    response_429 = SimpleNamespace(status_code=429, text="slow down", headers={})
+    response_429.raise_for_status = Mock()
+    response_ok = SimpleNamespace(status_code=200, text="ok", headers={})
+    response_ok.raise_for_status = Mock()
+
+    session = Mock()
+    session.get = Mock(side_effect=[response_429, response_ok])
+    scraper = DundamScraper(session=session, max_retries=1, retry_backoff=0.0)
+
+    assert scraper.fetch_html("https://example.test") == "ok"
+    assert session.get.call_count == 2
+
+
+def test_fetch_many_concurrent_reports_each_result_as_it_completes(monkeypatch):
+    scraper = DundamScraper(max_workers=2)
+    slow_release = threading.Event()
+
+    def fetch_html(url: str) -> str:
+        if url.endswith("/slow"):
+            slow_release.wait(5)
+            return "<div>총딜 2억</div>"
+        if url.endswith("/bad"):
+            raise RuntimeError("boom")
+        return "<div>총딜 1억</div>"
+
+    reported: list[tuple[int, bool]] = []
+
+    def on_result(index: int, result) -> None:
+        reported.append((index, result.ok))
+        if len(reported) == 2:
+            slow_release.set()
+
+    monkeypatch.setattr(scraper, "fetch_html", fetch_html)
+    results = scraper.fetch_many_concurrent(
+        [
+            ("https://example.test/slow", "S", None),
+            ("https://example.test/fast", "F", None),
+            ("https://example.test/bad", "B", None),
+        ],
+        on_result=on_result,
+    )
+
+    assert [r.name for r in results] == ["S", "F", "B"]
+    assert reported[-1] == (0, True)
+    assert sorted(reported) == [(0, True), (1, True), (2, False)]
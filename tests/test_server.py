@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+import requests
+from src.core.cache import TTLCache
+from src.core.remote import RemoteLookupError, RemoteScraper
+from src.core.scraper import DundamScraper
+from src.core.server import LookupServer
+
+_BASE = "https://dundam.test"
+_ALPHA = f"{_BASE}/view?name=Alpha"
+
+
+@pytest.fixture
+def server():
+    pages = {_ALPHA: "<div>총딜 12.3조</div>"}
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def fake_fetch_html(url: str) -> str:
+        with lock:
+            calls.append(url)
+        if url not in pages:
+            raise ConnectionError("timeout")
+        return pages[url]
+
+    scraper = DundamScraper(max_retries=0, cache=TTLCache(max_entries=16, ttl=60))
+    scraper.fetch_html = fake_fetch_html
+    lookup = LookupServer(scraper, base_url=_BASE, port=0)
+    lookup.start()
+    host, port = lookup.address
+    yield f"http://{host}:{port}", calls
+    lookup.close()
+    scraper.close()
+
+
+def test_clients_share_one_cache(server):
+    url, calls = server
+    first, second = RemoteScraper(url), RemoteScraper(url)
+
+    assert first.fetch_character_damage(_ALPHA, "Alpha").damage == "12.3조"
+    damage = second.fetch_character_damage(_ALPHA, "Alpha")
+
+    assert damage.damage == "12.3조"
+    assert damage.stats is not None and damage.stats.source == "remote:cache"
+    assert calls == [_ALPHA]
+    health = requests.get(f"{url}/health", timeout=5).json()
+    assert health["status"] == "ok"
+    assert health["requests"] == 2
+    assert health["cache"]["hits"] == 1
+
+
+def test_batch_reports_failures_per_character(server):
+    url, _ = server
+    results = []
+
+    fetched = RemoteScraper(url).fetch_many_concurrent(
+        [(_ALPHA, "Alpha", None), (f"{_BASE}/view?name=Beta", "Beta", "검성")],
+        on_result=lambda index, result: results.append(index),
+    )
+
+    assert sorted(results) == [0, 1]
+    assert fetched[0].ok and fetched[0].damage.damage == "12.3조"
+    assert not fetched[1].ok and fetched[1].job == "검성"
+    assert "ConnectionError" in str(fetched[1].error)
+
+
+def test_rejects_urls_outside_dundam(server):
+    url, calls = server
+
+    with pytest.raises(RemoteLookupError, match="url must start with"):
+        RemoteScraper(url).fetch_character_damage("http://169.254.169.254/", "x")
+    response = requests.post(f"{url}/lookup/batch", json={"items": []}, timeout=5)
+
+    assert response.status_code == 400
+    assert calls == []
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from src.core.scraper import DundamScraper
+from src.core.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_result_between_threads():
+    flight: SingleFlight[str] = SingleFlight()
+    release = threading.Event()
+    calls = {"count": 0}
+
+    def slow() -> str:
+        calls["count"] += 1
+        release.wait(5)
+        return "12.3조"
+
+    results: list[tuple[str, bool]] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("a", slow)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls["count"] == 1
+    assert sorted(results) == [("12.3조", False), ("12.3조", True), ("12.3조", True)]
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_propagates_errors_to_all_callers():
+    flight: SingleFlight[str] = SingleFlight()
+
+    def failing() -> str:
+        raise RuntimeError("요청 실패(404)")
+
+    with pytest.raises(RuntimeError, match="404"):
+        flight.do("a", failing)
+    assert flight.in_flight() == 0
+
+
+def test_async_single_flight_coalesces_concurrent_calls():
+    calls = {"count": 0}
+
+    async def fetch() -> str:
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return "845억"
+
+    async def scenario():
+        flight: AsyncSingleFlight[str] = AsyncSingleFlight()
+        return await asyncio.gather(*(flight.do("a", fetch) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert calls["count"] == 1
+    assert [value for value, _ in results] == ["845억"] * 3
+    assert [shared for _, shared in results].count(False) == 1
+
+
+def test_async_single_flight_cancelled_leader_fails_joiners_normally():
+    async def fetch() -> str:
+        await asyncio.sleep(10)
+        return "845억"
+
+    async def scenario():
+        flight: AsyncSingleFlight[str] = AsyncSingleFlight()
+        leader = asyncio.create_task(flight.do("a", fetch))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(flight.do("a", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(leader, joiner, return_exceptions=True)
+        return results, flight.in_flight()
+
+    (leader, joiner), in_flight = asyncio.run(scenario())
+
+    assert isinstance(leader, asyncio.CancelledError)
+    # 기다리던 쪽은 CancelledError가 아니라 항목 단위로 처리할 수 있는 예외를 받는다.
+    assert isinstance(joiner, RuntimeError)
+    assert in_flight == 0
+
+
+def test_fetch_many_concurrent_coalesces_duplicate_urls(monkeypatch):
+    scraper = DundamScraper(max_workers=4)
+    joined = {"count": 0}
+    all_joined = threading.Event()
+    original_do = scraper._inflight.do
+
+    def counting_do(key, fn):
+        if key.endswith("/a"):
+            joined["count"] += 1
+            if joined["count"] == 3:
+                all_joined.set()
+        return original_do(key, fn)
+
+    def fetch_html(url: str) -> str:
+        if url.endswith("/a"):
+            all_joined.wait(5)
+        return "<div>총딜 1억</div>"
+
+    fetch = Mock(side_effect=fetch_html)
+    monkeypatch.setattr(scraper._inflight, "do", counting_do)
+    monkeypatch.setattr(scraper, "fetch_html", fetch)
+
+    results = scraper.fetch_many_concurrent(
+        [("https://example.test/a", "A", None)] * 3
+        + [("https://example.test/b", "B", None)]
+    )
+
+    assert [r.damage.damage for r in results] == ["1억"] * 4
+    assert fetch.call_count == 2
+    sources = [r.damage.stats.source for r in results]
+    assert sources.count("coalesced") == 2
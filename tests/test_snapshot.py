@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+from src.io.snapshot import SnapshotWriter
+
+
+def _capture() -> np.ndarray:
+    image = np.zeros((90, 160, 3), np.uint8)
+    image[10:40, 20:100] = 255
+    return image
+
+
+def test_snapshot_writer_saves_only_panel_crop_in_background(tmp_path: Path):
+    writer = SnapshotWriter(tmp_path / "artifacts", mode="crop", image_format="png")
+
+    path = writer.save(_capture(), (20, 10, 80, 30))
+    writer.flush()
+    writer.close()
+
+    assert path == tmp_path / "artifacts" / "raid_snapshot.png"
+    with Image.open(path) as saved:
+        assert saved.size == (80, 30)
+        assert np.asarray(saved).min() == 255
+
+
+def test_snapshot_writer_full_jpeg_and_off_modes(tmp_path: Path):
+    writer = SnapshotWriter(tmp_path, mode="full", image_format="jpg")
+    path = writer.save(_capture(), (20, 10, 80, 30))
+    writer.close()
+
+    with Image.open(path) as saved:
+        assert (saved.format, saved.size) == ("JPEG", (160, 90))
+
+    off = SnapshotWriter(tmp_path / "off", mode="off")
+    assert off.save(_capture()) is None
+    assert not (tmp_path / "off").exists()
+    with pytest.raises(ValueError, match="snapshot mode"):
+        SnapshotWriter(tmp_path, mode="gif")
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+from src.core.models import CharacterInfo
+from src.core.panel_detect import PanelDetector
+from src.core.watch import PartyWatcher
+
+
+def test_frame_changed_only_when_screen_content_changes():
+    watcher = PartyWatcher()
+    frame = np.zeros((90, 160), np.uint8)
+    frame[20:40, 20:120] = 255
+    moved = np.zeros((90, 160), np.uint8)
+    moved[50:70, 20:120] = 255
+
+    assert watcher.frame_changed(frame) is True
+    assert watcher.frame_changed(frame.copy()) is False
+    assert watcher.frame_changed(moved) is True
+
+    watcher.reset()
+    assert watcher.frame_changed(moved) is True
+
+
+def test_composition_changed_ignores_order_and_empty_reads():
+    watcher = PartyWatcher()
+    party = [CharacterInfo("A"), CharacterInfo("B")]
+
+    assert watcher.composition_changed(party) is True
+    assert watcher.composition_changed(list(reversed(party))) is False
+    assert watcher.composition_changed([]) is False
+    assert watcher.composition_changed(party + [CharacterInfo("C")]) is True
+
+
+def test_next_delay_keeps_work_within_cpu_budget():
+    watcher = PartyWatcher(interval=2.0, cpu_budget=0.25)
+
+    assert watcher.next_delay(0.1) == 2.0
+    assert watcher.next_delay(1.0) == pytest.approx(3.0)
+
+    with pytest.raises(ValueError, match="cpu_budget"):
+        PartyWatcher(cpu_budget=0)
+
+
+def _party_frame(names: list[str]) -> np.ndarray:
+    frame = np.full((1080, 1920, 3), 30, np.uint8)
+    for row, name in enumerate(names):
+        cv2.putText(
+            frame,
+            name,
+            (1500, 300 + row * 40),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.8,
+            (255, 255, 255),
+            2,
+        )
+    return frame
+
+
+@pytest.mark.parametrize("detector", [None, PanelDetector()])
+def test_frame_changed_detects_a_single_character_change(detector):
+    watcher = PartyWatcher(panel_detector=detector)
+    names = ["Alpha", "Bravo", "Charlie", "Delta"]
+    renamed = ["Alpha", "Bravo", "Charlle", "Delta"]
+
+    assert watcher.frame_changed(_party_frame(names)) is True
+    assert watcher.frame_changed(_party_frame(names)) is False
+    assert watcher.frame_changed(_party_frame(renamed)) is True